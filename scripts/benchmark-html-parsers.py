@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HTML parser backends (sitebuild.htmlparse) on recorded pages.
+
+By default the pages are the HTML responses recorded in the HTTP cache
+(.build-cache/http/, filled by import-wp-blog.py / generate-live-article-pages.py);
+files or directories of .html files can be passed instead. Each backend parses
+every page and runs the scrapers' selector queries on it (title, og:title,
+description, entry content / Divi text modules, dates, author). The report
+shows time per page and how many pages the backends disagree on (compared on
+normalized entry text).
+
+Usage:
+    python scripts/benchmark-html-parsers.py
+    python scripts/benchmark-html-parsers.py --repeat 5 blog/ dry-eyes/
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from sitebuild import htmlparse
+from sitebuild.httpcache import HTTP_CACHE_DIR
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def recorded_pages() -> list[Path]:
+    pages = []
+    for meta_path in sorted(HTTP_CACHE_DIR.glob("*.json")):
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        headers = {k.lower(): v for k, v in meta.get("headers", {}).items()}
+        if headers.get("content-type", "").startswith("text/html"):
+            pages.append(meta_path.with_suffix(".body"))
+    return [p for p in pages if p.exists()]
+
+
+def html_files(paths: list[str]) -> list[Path]:
+    files: list[Path] = []
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            files.extend(sorted(path.rglob("*.html")))
+        elif path.is_file():
+            files.append(path)
+    return files
+
+
+def scrape(page: htmlparse.Node) -> str:
+    """The selector queries the scrapers run; returns normalized entry text."""
+    for selector in ('meta[property="og:title"]', "title", 'meta[name="description"]'):
+        page.select_one(selector)
+    for selector in ("time.entry-date.published", "time.published", "time.updated", ".author.vcard a"):
+        page.select_one(selector)
+    entry = page.select_one(".entry-content") or page.select_one("article")
+    if entry is None:
+        return ""
+    blocks = entry.select(".et_pb_text_inner") or [entry]
+    for block in blocks:
+        block.inner_html()
+    return " ".join(" ".join(block.text() for block in blocks).split())
+
+
+def run(backend: str, documents: list[str], repeat: int) -> tuple[float, list[str]]:
+    best = float("inf")
+    results: list[str] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        results = [scrape(htmlparse.parse(doc, backend)) for doc in documents]
+        best = min(best, time.perf_counter() - t0)
+    return best, results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends on recorded pages.")
+    parser.add_argument("paths", nargs="*", help="HTML files or directories (default: HTML in the HTTP cache).")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per backend; the best is reported (default: %(default)s).")
+    args = parser.parse_args()
+
+    files = html_files(args.paths) if args.paths else recorded_pages()
+    if not files:
+        print("No pages to benchmark. Run an import first or pass HTML files/directories.")
+        return 1
+    documents = [fp.read_bytes().decode("utf-8", errors="replace") for fp in files]
+    size_mb = sum(len(doc) for doc in documents) / 1e6
+    print(f"{len(documents)} pages, {size_mb:.1f} MB")
+
+    timings: dict[str, float] = {}
+    outputs: dict[str, list[str]] = {}
+    for backend in htmlparse.BACKENDS:
+        timings[backend], outputs[backend] = run(backend, documents, max(1, args.repeat))
+
+    baseline = timings[htmlparse.FALLBACK_BACKEND]
+    for backend, seconds in timings.items():
+        per_page = 1000 * seconds / len(documents)
+        print(f"  {backend:5} {seconds:7.2f}s  {per_page:7.2f} ms/page  {baseline / seconds:5.1f}x")
+
+    fast, slow = outputs[htmlparse.DEFAULT_BACKEND], outputs[htmlparse.FALLBACK_BACKEND]
+    differing = [str(fp) for fp, a, b in zip(files, fast, slow) if a != b]
+    print(f"Entry text differs on {len(differing)} of {len(documents)} pages")
+    for name in differing[:10]:
+        print(f"  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,12 +1,24 @@
 #!/usr/bin/env python3
+"""
+QA for the blog-writer pages listed in content/page_manifest.json.
+
+The checks are the "blog-writer" group of the QA engine
+(sitebuild/checks/blogwriter.py). Results go into each page's run file under
+content/blog_writer_runs/ and into QA_SUMMARY.md there.
+"""
+
 from __future__ import annotations
 
 import json
 import re
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
 
+from sitebuild import qa
+from sitebuild.checks.blogwriter import manifest_pages
+
 
 @dataclass(frozen=True)
 class PageInfo:
@@ -19,23 +31,14 @@ MANIFEST_PATH = ROOT / "content" / "page_manifest.json"
 RUNS_DIR = ROOT / "content" / "blog_writer_runs"
 
 
-IMG_SRC_RE = re.compile(r"<img[^>]+src=\"(?P<src>[^\"]+)\"", flags=re.I)
-TITLE_RE = re.compile(r"<title>(?P<t>.*?)</title>", flags=re.I | re.S)
-META_DESC_RE = re.compile(
-    r"<meta[^>]+name=\"description\"[^>]+content=\"(?P<c>[^\"]+)\"[^>]*>",
-    flags=re.I,
-)
-H1_RE = re.compile(r"<h1[^>]*>", flags=re.I)
-
-BANNED_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
-    ("em/en dashes", re.compile(r"[—–]")),
-    ("today world filler", re.compile(r"In today[’']s world", flags=re.I)),
-    ("important-to-note filler", re.compile(r"it[’']s important to note", flags=re.I)),
-    ("seamless", re.compile(r"\bseamless\b", flags=re.I)),
-    ("streamline", re.compile(r"\bstreamline\b", flags=re.I)),
-    ("leverage", re.compile(r"\bleverage\b", flags=re.I)),
-    ("robust", re.compile(r"\brobust\b", flags=re.I)),
-]
+# Rule name -> key in the per-page "checks" summary.
+CHECK_KEYS = {
+    "blog-hero-points": "hero_points",
+    "blog-cta": "cta",
+    "blog-title": "title",
+    "blog-meta-description": "meta_description",
+    "blog-h1": "h1",
+}
 
 
 def read_text(path: Path) -> str:
@@ -69,58 +72,20 @@ def slugify(old_path: str) -> str:
     return name.strip("-")
 
 
-def local_image_issues(page_path: Path, html: str) -> list[str]:
-    issues: list[str] = []
-    for m in IMG_SRC_RE.finditer(html):
-        src = m.group("src").strip()
-        if not src or src.startswith(("http://", "https://", "//", "data:")):
-            continue
-        src = src.split("#", 1)[0].split("?", 1)[0]
-        img_path = (page_path.parent / src).resolve()
-        if not img_path.exists():
-            issues.append(f"Missing image: {src}")
-    return issues
-
-
-def qa_for_page(page_path: Path, html: str) -> dict[str, object]:
-    issues: list[str] = []
-
-    # Core structure
-    title = TITLE_RE.search(html)
-    meta_desc = META_DESC_RE.search(html)
-    has_h1 = bool(H1_RE.search(html))
-    has_hero_points = "Hero value points" in html
-    has_cta = ("pages/patients/book.html" in html) or ("href=\"tel:" in html)
-
-    if not title or not title.group("t").strip():
-        issues.append("Missing <title>")
-    if not meta_desc or not meta_desc.group("c").strip():
-        issues.append("Missing meta description")
-    if not has_h1:
-        issues.append("Missing <h1>")
-    if not has_hero_points:
-        issues.append("Missing hero value points block")
-    if not has_cta:
-        issues.append("Missing clear CTA (book or call)")
-
-    # Banned content patterns
-    for label, pattern in BANNED_PATTERNS:
-        if pattern.search(html):
-            issues.append(f"Banned: {label}")
-
-    # Local images
-    issues.extend(local_image_issues(page_path, html))
-
+def page_results(report: qa.QaReport) -> dict[str, dict[str, object]]:
+    """Per-page pass/fail, issues and structure checks from the engine's findings."""
+    issues: dict[str, list[str]] = defaultdict(list)
+    failed: dict[str, set[str]] = defaultdict(set)
+    for finding in report.findings:
+        issues[finding.page].append(finding.message)
+        failed[finding.page].add(finding.rule)
     return {
-        "ok": len(issues) == 0,
-        "issues": issues,
-        "checks": {
-            "hero_points": has_hero_points,
-            "cta": has_cta,
-            "title": bool(title and title.group("t").strip()),
-            "meta_description": bool(meta_desc and meta_desc.group("c").strip()),
-            "h1": has_h1,
-        },
+        rel: {
+            "ok": not issues[rel],
+            "issues": issues[rel],
+            "checks": {key: name not in failed[rel] for name, key in CHECK_KEYS.items()},
+        }
+        for rel in manifest_pages()
     }
 
 
@@ -130,7 +95,7 @@ def update_run_file(page: PageInfo, result: dict[str, object]) -> None:
         return
 
     text = read_text(run_path)
-    text = re.sub(r"\n## QA Results \\(.*\\)\\n[\\s\\S]*\\Z", "", text, flags=re.S)
+    text = re.sub(r"\n## QA Results \(.*\)\n[\s\S]*\Z", "", text, flags=re.S)
 
     ok = bool(result["ok"])
     issues = result["issues"]
@@ -184,11 +149,11 @@ def main() -> int:
         raise SystemExit(f"Missing manifest: {MANIFEST_PATH}")
     RUNS_DIR.mkdir(parents=True, exist_ok=True)
 
+    rules, checks = qa.select(["blog-writer"])
+    by_page = page_results(qa.run(rules, checks))
     results: list[tuple[str, dict[str, object]]] = []
     for page in load_pages():
-        page_path = ROOT / page.new_path
-        html = read_text(page_path)
-        r = qa_for_page(page_path, html)
+        r = by_page[page.new_path]
         results.append((page.new_path, r))
         update_run_file(page, r)
 
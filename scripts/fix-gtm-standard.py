@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """Replace deferred GTM loading with Google's standard immediate-load snippet."""
 import re
-import glob
 import os
 
+from sitebuild import inventory
+
 GTM_ID = "GTM-WG6M9ZDV"
 
 # Standard GTM head snippet (goes right before </head>)
@@ -44,14 +45,12 @@ DEFERRED_GTM = re.compile(
     re.DOTALL
 )
 
-# Find all HTML files (exclude node_modules, .superdesign, dev)
+# All site HTML: public pages, ./pages sources and partials (the inventory
+# already skips node_modules, .superdesign and dev)
 base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-html_files = []
-for pattern in ['**/*.html']:
-    for f in glob.glob(os.path.join(base, pattern), recursive=True):
-        if '/node_modules/' in f or '/.superdesign/' in f or '/dev/' in f:
-            continue
-        html_files.append(f)
+html_files = [
+    str(p) for p in inventory.load().paths(inventory.PUBLIC, inventory.SOURCE, inventory.PARTIAL)
+]
 
 print(f"Processing {len(html_files)} HTML files...")
 
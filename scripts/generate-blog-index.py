@@ -11,6 +11,10 @@ import html
 import json
 import re
 from pathlib import Path
+from typing import Iterator
+
+from sitebuild import githistory, inventory, jsonld
+from sitebuild.jsonstream import iter_records
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 MANIFEST_PATH = BASE_DIR / "content" / "wp_blog_posts.json"
@@ -29,28 +33,11 @@ def load_authors() -> dict:
 
 
 def build_collection_schema() -> str:
-    schema = {
-        "@context": "https://schema.org",
-        "@graph": [
-            {
-                "@type": "CollectionPage",
-                "@id": f"{ORIGIN}/blog/",
-                "url": f"{ORIGIN}/blog/",
-                "name": "Resources & Blog | Classic Vision Care",
-                "description": "Practical eye care answers and local guides from Classic Vision Care in Kennesaw and East Cobb/Marietta, GA.",
-                "isPartOf": {"@id": f"{ORIGIN}/#website"},
-                "inLanguage": "en-US",
-            },
-            {
-                "@type": "WebSite",
-                "@id": f"{ORIGIN}/#website",
-                "url": ORIGIN,
-                "name": "Classic Vision Care",
-                "publisher": {"@id": f"{ORIGIN}/#organization"},
-            },
-        ],
-    }
-    return json.dumps(schema, ensure_ascii=False)
+    return jsonld.collection_page(
+        f"{ORIGIN}/blog/",
+        name="Resources & Blog | Classic Vision Care",
+        description="Practical eye care answers and local guides from Classic Vision Care in Kennesaw and East Cobb/Marietta, GA.",
+    )
 
 
 def read_layout_blocks() -> tuple[str, str]:
@@ -81,14 +68,16 @@ def card(href: str, eyebrow: str, title: str, desc: str) -> str:
     """.strip()
 
 
-def load_wp_posts() -> list[dict]:
+def iter_wp_posts() -> Iterator[dict]:
+    """Manifest entries, read incrementally (nothing if the manifest is missing or invalid)."""
     if not MANIFEST_PATH.exists():
-        return []
+        return
     try:
-        data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
-    except Exception:
-        return []
-    return data if isinstance(data, list) else []
+        for post in iter_records(MANIFEST_PATH):
+            if isinstance(post, dict):
+                yield post
+    except ValueError:
+        return
 
 
 def fmt_date(date_str: str | None) -> str | None:
@@ -108,7 +97,10 @@ def post_row(post: dict) -> str:
     path = str(post.get("path") or "").strip()
     title = str(post.get("title") or "").strip() or path
     desc = str(post.get("description") or "").strip()
-    date_text = fmt_date(post.get("date_published"))
+    date_text = fmt_date(
+        post.get("date_published")
+        or githistory.load().last_modified(inventory.rel_for_url_path(path))
+    )
     author = str(post.get("author") or "").strip()
 
     safe_title = html.escape(title)
@@ -240,15 +232,15 @@ def main() -> int:
         ]
     )
 
-    wp_posts = load_wp_posts()
-    wp_posts_sorted = sorted(
-        wp_posts,
-        key=lambda p: str(p.get("date_published") or ""),
+    # Render each row as the manifest streams in; only (date, row) pairs are kept for sorting.
+    wp_rows = sorted(
+        ((str(p.get("date_published") or ""), post_row(p)) for p in iter_wp_posts()),
+        key=lambda pair: pair[0],
         reverse=True,
     )
     all_posts_block = ""
-    if wp_posts_sorted:
-        rows = "\n".join(post_row(p) for p in wp_posts_sorted)
+    if wp_rows:
+        rows = "\n".join(row for _, row in wp_rows)
         all_posts_block = f"""
   <section class="py-16 lg:py-20 bg-white">
     <div class="max-w-7xl mx-auto px-6">
@@ -6,12 +6,24 @@ current ClassicVisionCare.com site and wrapping it in the new site's layout.
 Why scrape (instead of WP REST content):
 - Several high-traffic posts use Divi shortcodes in REST output.
 - The front-end HTML contains the fully rendered content we need to preserve.
+
+Fetched pages are cached in .build-cache/http/ and revalidated with ETag /
+Last-Modified on later runs; --offline regenerates from the cache alone.
+
+Batch mode: paths can also come from a file (--paths-file, one per line) or
+from every post in content/wp_blog_posts.json (--from-manifest). Pages are
+scraped --workers at a time; a path that fails is recorded in the error
+report (.build-cache/live-articles-errors.json) instead of aborting the run,
+and finished paths are checkpointed in .build-cache/live-articles.json, so
+rerunning the same command resumes with the failed and unprocessed paths.
+The checkpoint is cleared once a run completes without errors.
+
+    python3 scripts/generate-live-article-pages.py --from-manifest --overwrite
 """
 
 from __future__ import annotations
 
 import argparse
-import datetime as dt
 import html
 import json
 import re
@@ -19,11 +31,16 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
 
-import requests
-from bs4 import BeautifulSoup
+from sitebuild import bylines, htmlparse, jsonld, slots
+from sitebuild.buildcache import CACHE_DIR, JsonCache, fingerprint
+from sitebuild.fetch import Fetcher, add_fetch_arguments, fetcher_from_args
+from sitebuild.jsonstream import iter_records
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 ORIGIN = "https://classicvisioncare.com"
+MANIFEST_PATH = BASE_DIR / "content" / "wp_blog_posts.json"
+ERROR_REPORT_PATH = CACHE_DIR / "live-articles-errors.json"
+CHECKPOINT_VERSION = 1
 
 
 # ---------------------------------------------------------------------------
@@ -42,125 +59,6 @@ def _assign_author(path: str, community_slugs: set[str]) -> str:
     return "ankit-patel" if slug in community_slugs else "dr-mital-patel"
 
 
-def _clean_headline(raw: str) -> str:
-    for sep in (" | ", " - Classic Vision Care"):
-        if sep in raw:
-            raw = raw.split(sep)[0]
-    return raw.strip()
-
-
-def _fmt_date(date_str: str | None) -> str:
-    if not date_str:
-        return ""
-    try:
-        parsed = dt.datetime.fromisoformat(str(date_str).replace("Z", "+00:00"))
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=dt.timezone.utc)
-        parsed = parsed.astimezone(dt.timezone.utc)
-        return f"{parsed.strftime('%B')} {parsed.day}, {parsed.year}"
-    except Exception:
-        return ""
-
-
-def _build_article_schema(
-    canonical_url: str,
-    title: str,
-    description: str,
-    date_published: str | None,
-    date_modified: str | None,
-    author_slug: str,
-    authors: dict[str, Any],
-) -> str:
-    author = authors[author_slug]
-    is_medical = author_slug == "dr-mital-patel"
-    headline = _clean_headline(title)
-
-    graph: list[dict[str, Any]] = []
-    article: dict[str, Any] = {
-        "@type": "MedicalWebPage" if is_medical else ["Article", "BlogPosting"],
-        "@id": f"{canonical_url}#article",
-        "headline": headline,
-        "author": {"@id": author["schema_id"]},
-        "publisher": {"@id": f"{ORIGIN}/#organization"},
-        "mainEntityOfPage": {"@id": canonical_url},
-        "inLanguage": "en-US",
-    }
-    if date_published:
-        article["datePublished"] = date_published
-    if date_modified:
-        article["dateModified"] = date_modified
-    if description:
-        article["description"] = description
-    graph.append(article)
-
-    graph.append({
-        "@type": "WebPage", "@id": canonical_url, "url": canonical_url,
-        "name": title, "isPartOf": {"@id": f"{ORIGIN}/#website"},
-        "author": {"@id": author["schema_id"]},
-        "breadcrumb": {"@id": f"{canonical_url}#breadcrumb"}, "inLanguage": "en-US",
-    })
-    graph.append({
-        "@type": author["schema_type"], "@id": author["schema_id"],
-        "name": author["name"], "url": f"{ORIGIN}{author['author_page']}",
-        "image": f"{ORIGIN}{author['image']}", "jobTitle": author["title"],
-        "sameAs": author.get("sameAs", []),
-        "worksFor": {"@id": f"{ORIGIN}/#organization"},
-    })
-    graph.append({
-        "@type": "BreadcrumbList", "@id": f"{canonical_url}#breadcrumb",
-        "itemListElement": [
-            {"@type": "ListItem", "position": 1, "name": "Home", "item": f"{ORIGIN}/"},
-            {"@type": "ListItem", "position": 2, "name": "Resources", "item": f"{ORIGIN}/blog/"},
-            {"@type": "ListItem", "position": 3, "name": headline},
-        ],
-    })
-    graph.append({
-        "@type": "Organization", "@id": f"{ORIGIN}/#organization",
-        "name": "Classic Vision Care", "url": f"{ORIGIN}/",
-        "logo": f"{ORIGIN}/images/logos/EOP1600_Classic_Logo_FN.png",
-    })
-    return json.dumps({"@context": "https://schema.org", "@graph": graph}, ensure_ascii=False)
-
-
-def _build_rich_byline(
-    date_published: str | None, author_slug: str, authors: dict[str, Any],
-) -> str:
-    author = authors[author_slug]
-    date_text = _fmt_date(date_published)
-    safe_name = html.escape(author["name"])
-    safe_img = html.escape(author["image"], quote=True)
-    safe_alt = html.escape(author["image_alt"], quote=True)
-    safe_page = html.escape(author["author_page"], quote=True)
-    date_line = f'<p class="text-xs text-gray-500">{html.escape(date_text)}</p>' if date_text else ""
-    return (
-        f'<div class="mt-4 flex items-center gap-3">\n'
-        f'        <img src="{safe_img}" alt="{safe_alt}" '
-        f'class="w-10 h-10 rounded-full object-cover" width="40" height="40" loading="lazy">\n'
-        f'        <div>\n'
-        f'          <p class="text-sm font-medium text-cvc-charcoal">'
-        f'<a href="{safe_page}" class="hover:underline">{safe_name}</a></p>\n'
-        f'          {date_line}\n'
-        f'        </div>\n'
-        f'      </div>'
-    )
-
-
-def _build_medical_review_footer(authors: dict[str, Any]) -> str:
-    a = authors["dr-mital-patel"]
-    return (
-        f'<div class="mt-8 flex items-center gap-3 border-t border-gray-100 pt-6">\n'
-        f'        <img src="{a["image"]}" alt="{html.escape(a["image_alt"], quote=True)}" '
-        f'class="w-12 h-12 rounded-full object-cover" width="48" height="48" loading="lazy">\n'
-        f'        <div>\n'
-        f'          <p class="text-sm text-gray-500">Medically reviewed by</p>\n'
-        f'          <p class="text-sm font-medium text-cvc-charcoal">'
-        f'<a href="{a["author_page"]}" class="hover:underline">{html.escape(a["name"])}</a>'
-        f' &middot; Optometrist</p>\n'
-        f'        </div>\n'
-        f'      </div>'
-    )
-
-
 @dataclass(frozen=True)
 class ScrapedArticle:
     title: str
@@ -179,7 +77,7 @@ def read_layout_blocks() -> tuple[str, str]:
         raise RuntimeError("Could not extract header from index.html")
 
     footer_match = re.search(
-        r"(<!-- Footer -->.*?<script src=\"/scripts/editorial-forest\.js\"></script>)",
+        r"(<!-- Footer -->.*?<script\b[^>]*\bsrc=[\"']/scripts/editorial-forest\.js[\"'][^>]*></script>)",
         index_text,
         flags=re.DOTALL,
     )
@@ -189,58 +87,59 @@ def read_layout_blocks() -> tuple[str, str]:
     return header_match.group(1), footer_match.group(1)
 
 
-def scrape_article(path: str) -> ScrapedArticle:
-    url = f"{ORIGIN}{path}"
-    resp = requests.get(url, timeout=45)
-    resp.raise_for_status()
+def scrape_article(fetcher: Fetcher, path: str, *, origin: str = ORIGIN) -> ScrapedArticle:
+    url = f"{origin}{path}"
+    resp = fetcher.get(url, timeout=45)
+    return htmlparse.extract(resp.text, lambda page: parse_article(page, url))
 
-    soup = BeautifulSoup(resp.text, "lxml")
 
+def parse_article(page: htmlparse.Node, url: str) -> ScrapedArticle:
     title = None
-    og_title = soup.select_one('meta[property="og:title"]')
-    if og_title and og_title.get("content"):
-        title = og_title["content"].strip()
-    if not title and soup.title and soup.title.string:
-        title = soup.title.string.strip()
+    og_title = page.select_one('meta[property="og:title"]')
+    if og_title and og_title.attr("content"):
+        title = og_title.attr("content").strip()
+    title_el = page.select_one("title")
+    if not title and title_el and title_el.text().strip():
+        title = title_el.text().strip()
     if not title:
-        raise RuntimeError(f"Could not determine title for {url}")
+        raise htmlparse.ExtractError(f"Could not determine title for {url}")
 
     meta_description = None
-    desc = soup.select_one('meta[name="description"]')
-    if desc and desc.get("content"):
-        meta_description = desc["content"].strip()
+    desc = page.select_one('meta[name="description"]')
+    if desc and desc.attr("content"):
+        meta_description = desc.attr("content").strip()
 
-    article = soup.find("article")
-    entry = soup.select_one(".entry-content")
+    article = page.select_one("article")
+    entry = page.select_one(".entry-content")
     if not entry and article:
         entry = article
     if not entry:
-        raise RuntimeError(f"Could not find article content for {url}")
+        raise htmlparse.ExtractError(f"Could not find article content for {url}")
 
     # Inner HTML of entry content.
     # If the post uses Divi builder markup, prefer the actual text-module bodies.
     divi_text_blocks = entry.select(".et_pb_text_inner")
     if divi_text_blocks:
-        content_html = "\n".join(block.decode_contents().strip() for block in divi_text_blocks if block.decode_contents().strip())
+        content_html = "\n".join(block.inner_html().strip() for block in divi_text_blocks if block.inner_html().strip())
     else:
-        content_html = entry.decode_contents().strip()
+        content_html = entry.inner_html().strip()
 
     # Try common WP meta patterns
     date_published = None
     date_modified = None
     author = None
 
-    time_published = soup.select_one("time.entry-date.published") or soup.select_one("time.published")
-    if time_published and time_published.get("datetime"):
-        date_published = time_published["datetime"]
+    time_published = page.select_one("time.entry-date.published") or page.select_one("time.published")
+    if time_published and time_published.attr("datetime"):
+        date_published = time_published.attr("datetime")
 
-    time_modified = soup.select_one("time.updated") or soup.select_one("time.entry-date.updated")
-    if time_modified and time_modified.get("datetime"):
-        date_modified = time_modified["datetime"]
+    time_modified = page.select_one("time.updated") or page.select_one("time.entry-date.updated")
+    if time_modified and time_modified.attr("datetime"):
+        date_modified = time_modified.attr("datetime")
 
-    author_el = soup.select_one(".author.vcard a") or soup.select_one(".author a") or soup.select_one("span.author a")
-    if author_el and author_el.get_text(strip=True):
-        author = author_el.get_text(strip=True)
+    author_el = page.select_one(".author.vcard a") or page.select_one(".author a") or page.select_one("span.author a")
+    if author_el and author_el.text().strip():
+        author = author_el.text().strip()
 
     return ScrapedArticle(
         title=title,
@@ -265,28 +164,6 @@ def dest_for_path(path: str) -> Path:
     return BASE_DIR / path.strip("/") / "index.html"
 
 
-def build_faq_jsonld(faq_items: list[tuple[str, str]], canonical_url: str) -> str:
-    entities = []
-    for q, a in faq_items:
-        entities.append(
-            {
-                "@type": "Question",
-                "name": q,
-                "acceptedAnswer": {"@type": "Answer", "text": a},
-            }
-        )
-
-    import json
-
-    payload = {
-        "@context": "https://schema.org",
-        "@type": "FAQPage",
-        "@id": f"{canonical_url}#faq",
-        "mainEntity": entities,
-    }
-    return json.dumps(payload, ensure_ascii=False)
-
-
 def render_page(
     path: str,
     scraped: ScrapedArticle,
@@ -297,16 +174,19 @@ def render_page(
 ) -> str:
     canonical_path = normalize_path(path)
     canonical_url = f"{ORIGIN}{canonical_path}"
-    is_medical = author_slug == "dr-mital-patel"
+    is_medical = author_slug == bylines.MEDICAL_REVIEWER
 
     title = scraped.title
     description = scraped.meta_description or ""
 
     extra_schema_blocks: list[str] = [
-        _build_article_schema(
-            canonical_url, title, description,
-            scraped.date_published, scraped.date_modified,
-            author_slug, authors,
+        jsonld.article_graph(
+            canonical_url,
+            title=title,
+            author_slug=author_slug,
+            description=description,
+            date_published=scraped.date_published,
+            date_modified=scraped.date_modified,
         )
     ]
     extra_body_blocks: list[str] = []
@@ -335,7 +215,7 @@ def render_page(
                 "Possible side effects include temporary irritation, watering, or inflammation. Rarely, plugs can shift or cause infection. Contact our office if you have increasing pain, discharge, or vision changes.",
             ),
         ]
-        extra_schema_blocks.append(build_faq_jsonld(faq_items, canonical_url))
+        extra_schema_blocks.append(jsonld.faq_page(canonical_url, faq_items))
 
         extra_body_blocks.append(
             """
@@ -371,11 +251,17 @@ def render_page(
             """.strip()
         )
 
+    # The article graph sits in the jsonld slot so migrate-authorship can
+    # rewrite it; FAQ blocks stay outside.
     schema_lines = "\n".join(
-        f'  <script type="application/ld+json">{block.replace("</", "<\\/")}</script>' for block in extra_schema_blocks
+        ["  " + slots.fence(slots.JSONLD, jsonld.script_tag(extra_schema_blocks[0], indent=""))]
+        + [jsonld.script_tag(block) for block in extra_schema_blocks[1:]]
     )
 
-    byline_html = _build_rich_byline(scraped.date_published, author_slug, authors)
+    byline_html = slots.fence(slots.BYLINE, bylines.rich_byline(authors[author_slug], scraped.date_published))
+    review_html = slots.fence(
+        slots.REVIEW, bylines.medical_review_footer(authors[bylines.MEDICAL_REVIEWER]) if is_medical else ""
+    )
 
     hero = f"""
     <section class=\"py-16 lg:py-20 bg-gradient-to-br from-cvc-teal-50 to-cvc-cream\">
@@ -427,7 +313,7 @@ def render_page(
 {scraped.content_html}
       </article>
 {'' if not extra_body_blocks else ('\\n'.join(extra_body_blocks[1:] if canonical_path.startswith('/eye-treatment/') else extra_body_blocks))}
-{_build_medical_review_footer(authors) if is_medical else ''}
+{review_html}
       <div class="mt-12 bg-cvc-cream rounded-2xl p-8">
         <h2 class="font-display text-2xl text-cvc-charcoal mb-3">Need help now?</h2>
         <p class="text-gray-600 mb-6">If you are dealing with symptoms and want a clear plan, we can help. Book an appointment or call the location closest to you.</p>
@@ -450,11 +336,31 @@ def render_page(
 def iter_paths(input_paths: list[str]) -> Iterable[str]:
     for p in input_paths:
         p = p.strip()
-        if not p:
+        if not p or p.startswith("#"):
             continue
         yield normalize_path(p)
 
 
+def manifest_paths() -> list[str]:
+    # Streamed: only the paths are kept, not the whole manifest.
+    return [str(post["path"]) for post in iter_records(MANIFEST_PATH) if isinstance(post, dict) and post.get("path")]
+
+
+def collect_paths(args: argparse.Namespace) -> list[str]:
+    raw = list(args.paths)
+    if args.paths_file:
+        raw.extend(Path(args.paths_file).read_text(encoding="utf-8").splitlines())
+    if args.from_manifest:
+        raw.extend(manifest_paths())
+    # De-duplicate, keeping the first occurrence's position.
+    return list(dict.fromkeys(iter_paths(raw)))
+
+
+def chunked(items: list[str], size: int) -> Iterable[list[str]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -462,35 +368,100 @@ def main() -> int:
         nargs="*",
         help="Canonical paths to scrape from classicvisioncare.com (e.g. /dry-eyes/what-is-mibo-thermoflo/)",
     )
+    parser.add_argument("--paths-file", help="File with one canonical path per line (# comments allowed).")
+    parser.add_argument(
+        "--from-manifest",
+        action="store_true",
+        help=f"Regenerate every post listed in {MANIFEST_PATH.relative_to(BASE_DIR)}.",
+    )
     parser.add_argument("--overwrite", action="store_true", help="Overwrite existing generated pages.")
+    parser.add_argument("--origin", default=ORIGIN, help="Site to scrape (default: %(default)s).")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint of an unfinished run.")
+    parser.add_argument(
+        "--error-report",
+        default=str(ERROR_REPORT_PATH),
+        help="Where to write failed paths and their errors (default: %(default)s).",
+    )
+    add_fetch_arguments(parser)
+    htmlparse.add_parser_argument(parser)
     args = parser.parse_args()
+    htmlparse.set_default_backend(args.parser)
 
-    if not args.paths:
+    paths = collect_paths(args)
+    if not paths:
         print("No paths provided. Example:\n  python3 scripts/generate-live-article-pages.py /ocular-rosacea/all-about-ocular-rosacea/")
         return 2
 
     header, footer = read_layout_blocks()
     authors, community_slugs = _load_authors()
+    fetcher = fetcher_from_args(args)
+    origin = args.origin.rstrip("/")
+
+    # The checkpoint belongs to one input set; a different path list starts over.
+    checkpoint = JsonCache("live-articles", version=CHECKPOINT_VERSION)
+    run_key = fingerprint(origin, paths)
+    if args.restart or checkpoint.data.get("run") != run_key:
+        checkpoint.data = {"run": run_key}
+        checkpoint.dirty = True
+    done = checkpoint.section("done")
+    if done:
+        print(f"Resuming: {len(done)} of {len(paths)} paths already done (--restart to redo them).")
 
     generated = 0
     skipped = 0
-    for path in iter_paths(args.paths):
-        dest = dest_for_path(path)
-        if dest.exists() and not args.overwrite:
-            print(f"[SKIP] {path} (exists)")
-            skipped += 1
-            continue
-
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        scraped = scrape_article(path)
-        author_slug = _assign_author(path, community_slugs)
-        page_html = render_page(path, scraped, header=header, footer=footer, author_slug=author_slug, authors=authors)
-        dest.write_text(page_html, encoding="utf-8")
-        print(f"[OK]   {path} → {dest.relative_to(BASE_DIR)}")
-        generated += 1
-
-    print(f"\nDone. Generated: {generated}, Skipped: {skipped}")
-    return 0
+    errors: dict[str, str] = {}
+    todo = [path for path in paths if path not in done]
+    try:
+        for batch in chunked(todo, fetcher.workers * 4):
+            pending = []
+            for path in batch:
+                if dest_for_path(path).exists() and not args.overwrite:
+                    print(f"[SKIP] {path} (exists)")
+                    skipped += 1
+                    checkpoint.set("done", path, "skipped")
+                else:
+                    pending.append(path)
+
+            outcomes = fetcher.map(lambda path: scrape_article(fetcher, path, origin=origin), pending)
+            for path, outcome in zip(pending, outcomes):
+                if outcome.error is not None:
+                    errors[path] = f"{type(outcome.error).__name__}: {outcome.error}"
+                    print(f"[FAIL] {path}: {errors[path]}")
+                    continue
+                dest = dest_for_path(path)
+                author_slug = _assign_author(path, community_slugs)
+                try:
+                    page_html = render_page(
+                        path, outcome.value, header=header, footer=footer, author_slug=author_slug, authors=authors
+                    )
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    dest.write_text(page_html, encoding="utf-8")
+                except Exception as exc:
+                    errors[path] = f"{type(exc).__name__}: {exc}"
+                    print(f"[FAIL] {path}: {errors[path]}")
+                    continue
+                print(f"[OK]   {path} → {dest.relative_to(BASE_DIR)}")
+                generated += 1
+                checkpoint.set("done", path, "generated")
+            checkpoint.save()
+    finally:
+        checkpoint.save()
+        fetcher.close()
+
+    error_report = Path(args.error_report)
+    if errors:
+        error_report.parent.mkdir(parents=True, exist_ok=True)
+        error_report.write_text(json.dumps(errors, indent=2) + "\n", encoding="utf-8")
+    else:
+        error_report.unlink(missing_ok=True)
+        checkpoint.path.unlink(missing_ok=True)
+
+    print(f"\nDone. Generated: {generated}, Skipped: {skipped}, Failed: {len(errors)}")
+    if errors:
+        print(f"Errors: {error_report} (rerun the same command to retry them)")
+    print("HTTP:")
+    print(fetcher.report())
+    return 1 if errors else 0
 
 
 if __name__ == "__main__":
@@ -1,34 +1,46 @@
 #!/usr/bin/env python3
 """
-Generate a static sitemap.xml for the "clean URL" site output.
+Generate the static sitemaps for the "clean URL" site output.
 
 Scope:
 - Includes only / (root index.html) and any */index.html under repo root.
 - Excludes source-only folders like ./pages, ./dev, ./partials, etc.
+  (classification lives in sitebuild.inventory).
+
+Output:
+- sitemap.xml is a <sitemapindex> pointing at typed shards in ./sitemaps/:
+  core.xml (service/info pages), blog.xml (articles, /blog/, /author/),
+  locations.xml and images.xml (page URLs with their content images).
+  Each shard also gets a .xml.gz copy; the index references the gzip copies.
+- Shards split into <type>-2.xml, ... past 50,000 URLs or 50 MB, and are only
+  rewritten when their contents change.
+- sitemap-core.xml is hand-curated and not touched here.
 """
 
 from __future__ import annotations
 
 import datetime as dt
-import subprocess
+import re
 from pathlib import Path
 
+from sitebuild import githistory, inventory
+from sitebuild import sitemap as sitemap_writer
+from sitebuild.jsonstream import iter_records
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 CANONICAL_ORIGIN = "https://classicvisioncare.com"
+MANIFEST_PATH = BASE_DIR / "content" / "wp_blog_posts.json"
+SITEMAP_INDEX = BASE_DIR / "sitemap.xml"
+SHARD_DIR = BASE_DIR / "sitemaps"
+
+SHARD_TYPES = ("core", "blog", "locations", "images")
 
-EXCLUDE_DIRS = {
-    ".git",
-    ".superdesign",
-    "api",
-    "content",
-    "dev",
-    "images",
-    "node_modules",
-    "pages",
-    "partials",
-    "scripts",
-    "styles",
+LOCATION_URL_PATHS = {
+    "/our-locations/",
+    "/eye-doctor-kennesaw-ga/",
+    "/eye-doctor-marietta/",
 }
+BLOG_URL_PREFIXES = ("/blog/", "/author/")
 
 EXCLUDE_URL_PATHS = {
     # Legacy URLs that now permanently redirect (keep out of sitemap).
@@ -37,25 +49,9 @@ EXCLUDE_URL_PATHS = {
 }
 
 
-def git_last_committed_date(file_path: Path) -> str | None:
-    """Return the ISO date of the last git commit that touched *file_path*."""
-    try:
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%aI", "--", str(file_path)],
-            capture_output=True,
-            text=True,
-            cwd=BASE_DIR,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()[:10]  # YYYY-MM-DD
-    except FileNotFoundError:
-        pass
-    return None
-
-
 def to_iso_date(file_path: Path) -> str:
     """Git commit date if available, else file mtime."""
-    git_date = git_last_committed_date(file_path)
+    git_date = githistory.load().last_modified_date(file_path.relative_to(BASE_DIR).as_posix())
     if git_date:
         return git_date
     return dt.datetime.fromtimestamp(
@@ -63,60 +59,84 @@ def to_iso_date(file_path: Path) -> str:
     ).date().isoformat()
 
 
-def path_to_url_path(file_path: Path) -> str:
-    if file_path == BASE_DIR / "index.html":
-        return "/"
-    if file_path.name != "index.html":
-        raise ValueError(f"Unexpected file: {file_path}")
-    rel_dir = file_path.parent.relative_to(BASE_DIR)
-    return f"/{rel_dir.as_posix().strip('/')}/"
+MAIN_RE = re.compile(r"<main\b.*?</main>", re.DOTALL | re.IGNORECASE)
+IMG_SRC_RE = re.compile(r"<img\b[^>]*?\ssrc=[\"']([^\"']+)[\"']", re.IGNORECASE)
+IMAGE_EXTENSIONS = (".avif", ".gif", ".jpeg", ".jpg", ".png", ".webp")
 
 
-def should_include(file_path: Path) -> bool:
+def load_article_paths() -> set[str]:
+    if not MANIFEST_PATH.exists():
+        return set()
     try:
-        rel = file_path.relative_to(BASE_DIR)
+        return {str(p.get("path")) for p in iter_records(MANIFEST_PATH) if isinstance(p, dict) and p.get("path")}
     except ValueError:
-        return False
-
-    parts = rel.parts
-    if not parts:
-        return False
-    if parts[0] in EXCLUDE_DIRS:
-        return False
-    return True
+        return set()
+
+
+def shard_type(url_path: str, article_paths: set[str]) -> str:
+    if url_path in LOCATION_URL_PATHS:
+        return "locations"
+    if url_path in article_paths or url_path.startswith(BLOG_URL_PREFIXES):
+        return "blog"
+    return "core"
+
+
+def content_images(file_path: Path) -> tuple[str, ...]:
+    """Absolute URLs of local raster images inside <main> (not nav/footer logos)."""
+    text = file_path.read_text(encoding="utf-8", errors="replace")
+    main_match = MAIN_RE.search(text)
+    if not main_match:
+        return ()
+    images: list[str] = []
+    for src in IMG_SRC_RE.findall(main_match.group(0)):
+        if src.startswith(CANONICAL_ORIGIN):
+            src = src[len(CANONICAL_ORIGIN):]
+        if not src.startswith("/") or src.startswith("//"):
+            continue
+        if not src.split("?", 1)[0].lower().endswith(IMAGE_EXTENSIONS):
+            continue
+        url = f"{CANONICAL_ORIGIN}{src}"
+        if url not in images:
+            images.append(url)
+    return tuple(images)
 
 
 def main() -> int:
-    candidates = []
-    for file_path in BASE_DIR.rglob("index.html"):
-        if file_path == BASE_DIR / "index.html":
-            candidates.append(file_path)
-            continue
-        if should_include(file_path):
-            candidates.append(file_path)
-
-    url_entries = []
-    for file_path in sorted(set(candidates)):
-        url_path = path_to_url_path(file_path)
+    SHARD_DIR.mkdir(exist_ok=True)
+    cache = sitemap_writer.open_cache()
+    writers = {
+        name: sitemap_writer.ShardWriter(SHARD_DIR, name, cache, images=(name == "images"))
+        for name in SHARD_TYPES
+    }
+    article_paths = load_article_paths()
+
+    n_urls = 0
+    for url_path, file_path in inventory.load().routes():
         if url_path in EXCLUDE_URL_PATHS:
             continue
+        loc = f"{CANONICAL_ORIGIN}{url_path}"
         lastmod = to_iso_date(file_path)
-        url_entries.append((url_path, lastmod))
-
-    lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-    ]
-    for url_path, lastmod in url_entries:
-        lines.append("  <url>")
-        lines.append(f"    <loc>{CANONICAL_ORIGIN}{url_path}</loc>")
-        lines.append(f"    <lastmod>{lastmod}</lastmod>")
-        lines.append("  </url>")
-    lines.append("</urlset>")
-    lines.append("")
-
-    (BASE_DIR / "sitemap.xml").write_text("\n".join(lines), encoding="utf-8")
-    print(f"Wrote sitemap.xml with {len(url_entries)} URLs")
+        writers[shard_type(url_path, article_paths)].add(sitemap_writer.UrlEntry(loc, lastmod))
+        images = content_images(file_path)
+        if images:
+            writers["images"].add(sitemap_writer.UrlEntry(loc, lastmod, images))
+        n_urls += 1
+
+    shards = [shard for name in SHARD_TYPES for shard in writers[name].close()]
+    removed = sitemap_writer.remove_stale(SHARD_DIR, shards)
+    index_changed = sitemap_writer.write_index(SITEMAP_INDEX, shards, f"{CANONICAL_ORIGIN}/sitemaps/")
+    cache.save()
+
+    for shard in shards:
+        status = "updated" if shard.changed else "unchanged"
+        print(f"  sitemaps/{shard.filename}: {shard.count} URLs ({status})")
+    for name in removed:
+        print(f"  Removed stale sitemaps/{name}")
+    rewritten = sum(1 for shard in shards if shard.changed)
+    print(
+        f"Wrote sitemap.xml index ({'updated' if index_changed else 'unchanged'}) with "
+        f"{len(shards)} shards ({rewritten} rewritten) covering {n_urls} URLs"
+    )
     return 0
 
 
@@ -3,13 +3,25 @@
 Import WordPress blog posts into the static site.
 
 Workflow:
-1) Use the WP REST API to enumerate published posts + Yoast metadata.
+1) Use the WP REST API to enumerate published posts + Yoast metadata, or
+   read them from an on-disk JSON / JSON Lines export (--from-export). Posts
+   stream through the render stage one API page at a time, so memory stays
+   bounded however large the catalogue is.
 2) For posts where `content.rendered` contains Divi shortcodes, scrape the
    rendered front-end HTML (because REST output is not usable).
+   API pages after the first and these scrapes are fetched concurrently over
+   one pooled session (see sitebuild.fetch; --workers / --per-host).
+   Responses are cached in .build-cache/http/ and revalidated with ETag /
+   Last-Modified on the next run; --offline replays the cache without network.
 3) Write each post to its existing permalink path (no redirects needed).
-4) Optionally copy referenced `/wp-content/uploads/...` assets from a local
+4) With --incremental, only posts modified since the last sync (a
+   `modified_gmt` high-water mark kept in .build-cache/wp-sync.json) are
+   fetched and re-rendered; a cheap ID-only listing detects deleted posts,
+   whose pages are removed. The manifest is merged and /blog/ regenerated.
+5) Optionally copy referenced `/wp-content/uploads/...` assets from a local
    export directory into `./wp-content/uploads/` so images keep working after
-   cutover.
+   cutover (see sitebuild.uploads: hashed, deduplicated via hardlinks, copied
+   in parallel, and summarized in content/wp_uploads_manifest.json).
 """
 
 from __future__ import annotations
@@ -19,14 +31,29 @@ import datetime as dt
 import html
 import json
 import re
-import shutil
+import subprocess
+import sys
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 from urllib.parse import urlparse, urlunparse
 
 import requests
-from bs4 import BeautifulSoup
+
+from sitebuild import bylines, htmlparse, jsonld, slots, uploads
+from sitebuild.buildcache import JsonCache
+from sitebuild.fetch import Fetcher, add_fetch_arguments, fetcher_from_args
+from sitebuild.jsonstream import batched, iter_records, write_records
+from sitebuild.postdoc import (
+    CollectUploads,
+    FaqExtractor,
+    PlainText,
+    PostDocument,
+    RewriteUrls,
+    WordCount,
+    upload_relpath,
+)
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -45,144 +72,6 @@ def _assign_author(slug: str, community_slugs: set[str]) -> str:
     return "ankit-patel" if slug in community_slugs else "dr-mital-patel"
 
 
-def _clean_headline(raw: str) -> str:
-    for sep in (" | ", " - Classic Vision Care"):
-        if sep in raw:
-            raw = raw.split(sep)[0]
-    return raw.strip()
-
-
-def _build_article_schema(
-    canonical_url: str,
-    meta: "PostMeta",
-    author_slug: str,
-    authors: dict[str, Any],
-) -> str:
-    origin = DEFAULT_ORIGIN
-    author = authors[author_slug]
-    is_medical = author_slug == "dr-mital-patel"
-    headline = _clean_headline(meta.title)
-
-    graph: list[dict[str, Any]] = []
-
-    article: dict[str, Any] = {
-        "@type": "MedicalWebPage" if is_medical else ["Article", "BlogPosting"],
-        "@id": f"{canonical_url}#article",
-        "headline": headline,
-        "author": {"@id": author["schema_id"]},
-        "publisher": {"@id": f"{origin}/#organization"},
-        "mainEntityOfPage": {"@id": canonical_url},
-        "inLanguage": "en-US",
-    }
-    if meta.date_published:
-        article["datePublished"] = meta.date_published
-    if meta.date_modified:
-        article["dateModified"] = meta.date_modified
-    if meta.description:
-        article["description"] = meta.description
-    if meta.featured_image:
-        img = meta.featured_image
-        article["image"] = img if img.startswith("http") else f"{origin}{img}"
-    graph.append(article)
-
-    webpage: dict[str, Any] = {
-        "@type": "WebPage",
-        "@id": canonical_url,
-        "url": canonical_url,
-        "name": meta.title,
-        "isPartOf": {"@id": f"{origin}/#website"},
-        "author": {"@id": author["schema_id"]},
-        "breadcrumb": {"@id": f"{canonical_url}#breadcrumb"},
-        "inLanguage": "en-US",
-    }
-    if meta.date_published:
-        webpage["datePublished"] = meta.date_published
-    if meta.date_modified:
-        webpage["dateModified"] = meta.date_modified
-    if meta.description:
-        webpage["description"] = meta.description
-    graph.append(webpage)
-
-    author_node: dict[str, Any] = {
-        "@type": author["schema_type"],
-        "@id": author["schema_id"],
-        "name": author["name"],
-        "url": f"{origin}{author['author_page']}",
-        "image": f"{origin}{author['image']}",
-        "jobTitle": author["title"],
-        "sameAs": author.get("sameAs", []),
-        "worksFor": {"@id": f"{origin}/#organization"},
-    }
-    graph.append(author_node)
-
-    graph.append({
-        "@type": "BreadcrumbList",
-        "@id": f"{canonical_url}#breadcrumb",
-        "itemListElement": [
-            {"@type": "ListItem", "position": 1, "name": "Home", "item": f"{origin}/"},
-            {"@type": "ListItem", "position": 2, "name": "Resources", "item": f"{origin}/blog/"},
-            {"@type": "ListItem", "position": 3, "name": headline},
-        ],
-    })
-
-    graph.append({
-        "@type": "Organization",
-        "@id": f"{origin}/#organization",
-        "name": "Classic Vision Care",
-        "url": f"{origin}/",
-        "logo": f"{origin}/images/logos/EOP1600_Classic_Logo_FN.png",
-    })
-
-    return json.dumps({"@context": "https://schema.org", "@graph": graph}, ensure_ascii=False)
-
-
-def _build_rich_byline(meta: "PostMeta", author_slug: str, authors: dict[str, Any]) -> str:
-    author = authors[author_slug]
-    date_text = ""
-    if meta.date_published:
-        try:
-            parsed = dt.datetime.fromisoformat(meta.date_published.replace("Z", "+00:00"))
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=dt.timezone.utc)
-            parsed = parsed.astimezone(dt.timezone.utc)
-            date_text = f"{parsed.strftime('%B')} {parsed.day}, {parsed.year}"
-        except Exception:
-            pass
-
-    safe_name = html.escape(author["name"])
-    safe_img = html.escape(author["image"], quote=True)
-    safe_alt = html.escape(author["image_alt"], quote=True)
-    safe_page = html.escape(author["author_page"], quote=True)
-    date_line = f'<p class="text-xs text-gray-500">{html.escape(date_text)}</p>' if date_text else ""
-
-    return (
-        f'<div class="mt-4 flex items-center gap-3">\n'
-        f'        <img src="{safe_img}" alt="{safe_alt}" '
-        f'class="w-10 h-10 rounded-full object-cover" width="40" height="40" loading="lazy">\n'
-        f'        <div>\n'
-        f'          <p class="text-sm font-medium text-cvc-charcoal">'
-        f'<a href="{safe_page}" class="hover:underline">{safe_name}</a></p>\n'
-        f'          {date_line}\n'
-        f'        </div>\n'
-        f'      </div>'
-    )
-
-
-def _build_medical_review_footer(authors: dict[str, Any]) -> str:
-    a = authors["dr-mital-patel"]
-    return (
-        f'<div class="mt-8 flex items-center gap-3 border-t border-gray-100 pt-6">\n'
-        f'        <img src="{a["image"]}" alt="{html.escape(a["image_alt"], quote=True)}" '
-        f'class="w-12 h-12 rounded-full object-cover" width="48" height="48" loading="lazy">\n'
-        f'        <div>\n'
-        f'          <p class="text-sm text-gray-500">Medically reviewed by</p>\n'
-        f'          <p class="text-sm font-medium text-cvc-charcoal">'
-        f'<a href="{a["author_page"]}" class="hover:underline">{html.escape(a["name"])}</a>'
-        f' &middot; Optometrist</p>\n'
-        f'        </div>\n'
-        f'      </div>'
-    )
-
 DEFAULT_ORIGIN = "https://classicvisioncare.com"
 
 DIVI_SHORTCODE_RE = re.compile(r"\[(?:/?et_pb|et_pb_section|et_pb_row|et_pb_text)\b", re.IGNORECASE)
@@ -194,6 +83,15 @@ DEFAULT_EXTRA_ORIGIN_HOSTS = {
     "classicvisioncare.us23.cdn-alpha.com",
 }
 
+DEFAULT_MANIFEST_PATH = (BASE_DIR / "content" / "wp_blog_posts.json").resolve()
+DEFAULT_UPLOADS_MANIFEST_PATH = (BASE_DIR / "content" / "wp_uploads_manifest.json").resolve()
+
+MIN_FAQ_ITEMS = 2
+POSTS_PER_PAGE = 100  # WP REST API maximum; also the render batch size for exports
+
+SYNC_CACHE_VERSION = 1
+WATERMARK_OVERLAP = dt.timedelta(days=1)
+
 
 @dataclass(frozen=True)
 class PostMeta:
@@ -231,7 +129,7 @@ def read_layout_blocks() -> tuple[str, str]:
         raise RuntimeError("Could not extract header from index.html")
 
     footer_match = re.search(
-        r"(<!-- Footer -->.*?<script src=\"/scripts/editorial-forest\.js\"></script>)",
+        r"(<!-- Footer -->.*?<script\b[^>]*\bsrc=[\"']/scripts/editorial-forest\.js[\"'][^>]*></script>)",
         index_text,
         flags=re.DOTALL,
     )
@@ -241,57 +139,110 @@ def read_layout_blocks() -> tuple[str, str]:
     return header_match.group(1), footer_match.group(1)
 
 
-def wp_api_get(session: requests.Session, url: str, *, params: dict[str, Any]) -> requests.Response:
-    resp = session.get(
-        url,
-        params=params,
-        timeout=60,
-        headers={
-            "User-Agent": "cvc-static-blog-import/1.0",
-            "Accept": "application/json",
-        },
-    )
-    resp.raise_for_status()
-    return resp
+def wp_api_get(fetcher: Fetcher, url: str, *, params: dict[str, Any]) -> requests.Response:
+    return fetcher.get(url, params=params, headers={"Accept": "application/json"})
 
 
-def fetch_posts(origin: str) -> list[dict[str, Any]]:
+def iter_post_pages(
+    fetcher: Fetcher,
+    origin: str,
+    *,
+    modified_after: str | None = None,
+    ids_only: bool = False,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield the posts one API page (up to 100 posts) at a time, in order.
+
+    Page 1 tells us how many pages there are; the rest are fetched ahead on
+    the thread pool, but only a worker-sized window of pages is held at once.
+    """
     api_url = f"{origin.rstrip('/')}/wp-json/wp/v2/posts"
-    session = requests.Session()
-
-    posts: list[dict[str, Any]] = []
-    page = 1
-    per_page = 100
-    total_pages = None
-
-    while True:
-        resp = wp_api_get(
-            session,
-            api_url,
-            params={
-                "per_page": per_page,
-                "page": page,
-                "_embed": 1,
-                "orderby": "date",
-                "order": "desc",
-            },
-        )
+    params: dict[str, Any] = {"per_page": POSTS_PER_PAGE, "orderby": "date", "order": "desc"}
+    if ids_only:
+        params["_fields"] = "id"
+    else:
+        params["_embed"] = 1
+    if modified_after:
+        params["modified_after"] = modified_after
+
+    def fetch_page(page: int) -> tuple[list[dict[str, Any]], requests.Response]:
+        resp = wp_api_get(fetcher, api_url, params={**params, "page": page})
         batch = resp.json()
         if not isinstance(batch, list):
             raise RuntimeError(f"Unexpected WP API response (page {page})")
-        posts.extend(batch)
+        return batch, resp
+
+    posts, first = fetch_page(1)
+    try:
+        total_pages = int(first.headers.get("X-WP-TotalPages", "1"))
+    except ValueError:
+        total_pages = 1
+    yield posts
+
+    for page, outcome in enumerate(fetcher.imap(fetch_page, range(2, total_pages + 1)), start=2):
+        if outcome.error is not None:
+            raise RuntimeError(f"WP API page {page} failed: {outcome.error}") from outcome.error
+        yield outcome.value[0]
+
+
+def iter_export_pages(path: Path) -> Iterator[list[dict[str, Any]]]:
+    """Posts from an on-disk export (a JSON array or JSON Lines of WP REST post objects), read incrementally."""
+    posts = (post for post in iter_records(path) if isinstance(post, dict) and post.get("status", "publish") == "publish")
+    return batched(posts, POSTS_PER_PAGE)
+
+
+def fetch_posts(
+    fetcher: Fetcher,
+    origin: str,
+    *,
+    modified_after: str | None = None,
+    ids_only: bool = False,
+) -> list[dict[str, Any]]:
+    return [
+        post
+        for page in iter_post_pages(fetcher, origin, modified_after=modified_after, ids_only=ids_only)
+        for post in page
+    ]
+
+
+def fetch_post_ids(fetcher: Fetcher, origin: str) -> set[int]:
+    """IDs of every published post (a few bytes each; used to spot deletions)."""
+    return {int(post["id"]) for post in fetch_posts(fetcher, origin, ids_only=True) if post.get("id")}
+
 
-        if total_pages is None:
-            try:
-                total_pages = int(resp.headers.get("X-WP-TotalPages", "1"))
-            except ValueError:
-                total_pages = 1
+def post_modified_gmt(post: dict[str, Any]) -> str | None:
+    value = post.get("modified_gmt")
+    return value if isinstance(value, str) and value else None
 
-        if page >= (total_pages or 1):
-            break
-        page += 1
 
-    return posts
+def modified_after_param(watermark: str) -> str:
+    # WordPress compares modified_after against the site-local post_modified
+    # column, so step back far enough to cover any UTC offset; posts whose
+    # modified_gmt is unchanged are filtered out afterwards.
+    since = dt.datetime.fromisoformat(watermark) - WATERMARK_OVERLAP
+    return since.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def load_manifest(path: Path) -> list[dict[str, Any]] | None:
+    try:
+        return list(iter_records(path))
+    except (OSError, ValueError):
+        return None
+
+
+def remove_post_page(path: str) -> bool:
+    dest = dest_for_path(path)
+    if not dest.exists():
+        return False
+    dest.unlink()
+    try:
+        dest.parent.rmdir()
+    except OSError:
+        pass  # directory still holds other files (or child posts)
+    return True
+
+
+def regenerate_blog_index() -> None:
+    subprocess.run([sys.executable, str(BASE_DIR / "scripts" / "generate-blog-index.py")], check=True)
 
 
 def to_root_relative(url: str, origin_hosts: set[str]) -> str | None:
@@ -319,64 +270,31 @@ def to_root_relative(url: str, origin_hosts: set[str]) -> str | None:
     return None
 
 
-def rewrite_fragment_urls(html_fragment: str, origin_hosts: set[str]) -> str:
-    # Parse as fragment by wrapping in a root container.
-    soup = BeautifulSoup(f"<div id=\"__cvc_root__\">{html_fragment}</div>", "lxml")
-    root = soup.select_one("#__cvc_root__")
-    if not root:
-        return html_fragment
-
-    attrs_to_rewrite = ("href", "src", "data-src", "data-lazy-src")
-    for el in root.find_all(True):
-        for attr in attrs_to_rewrite:
-            if not el.has_attr(attr):
-                continue
-            value = str(el.get(attr))
-            rewritten = to_root_relative(value, origin_hosts=origin_hosts)
-            if rewritten:
-                el[attr] = rewritten
-
-        if el.has_attr("srcset"):
-            srcset = str(el.get("srcset") or "")
-            if not srcset.strip():
-                continue
-            parts_out: list[str] = []
-            for part in [p.strip() for p in srcset.split(",") if p.strip()]:
-                tokens = part.split()
-                if not tokens:
-                    continue
-                url_token = tokens[0]
-                rewritten = to_root_relative(url_token, origin_hosts=origin_hosts)
-                if rewritten:
-                    tokens[0] = rewritten
-                parts_out.append(" ".join(tokens))
-            el["srcset"] = ", ".join(parts_out)
+def scrape_rendered_entry_content(fetcher: Fetcher, url: str) -> str:
+    resp = fetcher.get(url, headers={"Accept": "text/html"})
 
-    return root.decode_contents().strip()
+    def entry_html(page: htmlparse.Node) -> str:
+        entry = page.select_one(".entry-content") or page.select_one("article")
+        if entry is None:
+            raise htmlparse.ExtractError(f"Could not find entry content for {url}")
 
+        divi_text_blocks = entry.select(".et_pb_text_inner")
+        if divi_text_blocks:
+            parts = []
+            for block in divi_text_blocks:
+                inner = block.inner_html().strip()
+                if inner:
+                    parts.append(inner)
+            return "\n".join(parts).strip()
 
-def scrape_rendered_entry_content(url: str) -> str:
-    resp = requests.get(url, timeout=60, headers={"User-Agent": "cvc-static-blog-import/1.0", "Accept": "text/html"})
-    resp.raise_for_status()
+        return entry.inner_html().strip()
 
-    soup = BeautifulSoup(resp.text, "lxml")
-    entry = soup.select_one(".entry-content")
-    article = soup.find("article")
-    if not entry and article:
-        entry = article
-    if not entry:
-        raise RuntimeError(f"Could not find entry content for {url}")
+    return htmlparse.extract(resp.text, entry_html)
 
-    divi_text_blocks = entry.select(".et_pb_text_inner")
-    if divi_text_blocks:
-        parts = []
-        for block in divi_text_blocks:
-            inner = block.decode_contents().strip()
-            if inner:
-                parts.append(inner)
-        return "\n".join(parts).strip()
 
-    return entry.decode_contents().strip()
+def rendered_content(post: dict[str, Any]) -> str:
+    rendered = post.get("content", {}).get("rendered", "")
+    return rendered if isinstance(rendered, str) else ""
 
 
 def looks_like_divi_shortcodes(html_fragment: str) -> bool:
@@ -384,8 +302,9 @@ def looks_like_divi_shortcodes(html_fragment: str) -> bool:
 
 
 def strip_html_tags(html_text: str) -> str:
-    soup = BeautifulSoup(html_text, "lxml")
-    return soup.get_text(" ", strip=True)
+    text = PlainText()
+    PostDocument.parse(html_text).visit(text)
+    return text.value
 
 
 def yoast_title(post: dict[str, Any]) -> str | None:
@@ -494,34 +413,28 @@ def render_post_page(
     footer: str,
     author_slug: str,
     authors: dict[str, Any],
+    faq_items: list[tuple[str, str]] | None = None,
 ) -> str:
     canonical_url = f"{origin.rstrip('/')}{meta.path}"
-    is_medical = author_slug == "dr-mital-patel"
-
-    def build_faq_jsonld(faq_items: list[tuple[str, str]]) -> str:
-        payload = {
-            "@context": "https://schema.org",
-            "@type": "FAQPage",
-            "@id": f"{canonical_url}#faq",
-            "mainEntity": [
-                {
-                    "@type": "Question",
-                    "name": q,
-                    "acceptedAnswer": {"@type": "Answer", "text": a},
-                }
-                for q, a in faq_items
-            ],
-        }
-        return json.dumps(payload, ensure_ascii=False)
-
-    schema_blocks: list[str] = []
-    schema_blocks.append(_build_article_schema(canonical_url, meta, author_slug, authors))
+    is_medical = author_slug == bylines.MEDICAL_REVIEWER
+
+    schema_blocks: list[str] = [
+        jsonld.article_graph(
+            canonical_url,
+            title=meta.title,
+            author_slug=author_slug,
+            description=meta.description,
+            date_published=meta.date_published,
+            date_modified=meta.date_modified,
+            image=meta.featured_image,
+        )
+    ]
 
     extra_section_blocks: list[str] = []
 
     # P0 requirement: add punctal plug "fell out" FAQ + FAQPage schema.
     if meta.path == "/dry-eyes/punctal-plugs-for-dry-eyes-guide/":
-        faq_items = [
+        punctal_faq_items = [
             (
                 "How do I know if my punctal plug fell out?",
                 "Common signs include a return of dry eye symptoms, new irritation near the inner corner of the eyelid, or feeling like something is stuck in the eye. Some people have no symptoms at all. If you are unsure, we can check the plug position during an exam.",
@@ -543,7 +456,7 @@ def render_post_page(
                 "Possible side effects include temporary irritation, watering, or inflammation. Rarely, plugs can shift or cause infection. Contact our office if you have increasing pain, discharge, or vision changes.",
             ),
         ]
-        schema_blocks.append(build_faq_jsonld(faq_items))
+        schema_blocks.append(jsonld.faq_page(canonical_url, punctal_faq_items))
 
         extra_section_blocks.append(
             """
@@ -568,15 +481,19 @@ def render_post_page(
             """.strip()
         )
 
-    schema_block = ""
-    if schema_blocks:
-        lines = []
-        for block in schema_blocks:
-            block = block.replace("</", "<\\/")
-            lines.append(f'  <script type="application/ld+json">{block}</script>')
-        schema_block = "\n".join(lines) + "\n"
+    elif faq_items and len(faq_items) >= MIN_FAQ_ITEMS:
+        # The post has its own FAQ section; mirror it as FAQPage schema.
+        schema_blocks.append(jsonld.faq_page(canonical_url, faq_items))
+
+    # The article graph sits in the jsonld slot so migrate-authorship can
+    # rewrite it; FAQ blocks stay outside.
+    schema_block = "  " + slots.fence(slots.JSONLD, jsonld.script_tag(schema_blocks[0], indent="")) + "\n"
+    schema_block += "".join(jsonld.script_tag(block) + "\n" for block in schema_blocks[1:])
 
-    byline_html = _build_rich_byline(meta, author_slug, authors)
+    byline_html = slots.fence(slots.BYLINE, bylines.rich_byline(authors[author_slug], meta.date_published))
+    review_html = slots.fence(
+        slots.REVIEW, bylines.medical_review_footer(authors[bylines.MEDICAL_REVIEWER]) if is_medical else ""
+    )
 
     description = meta.description or ""
     safe_title = html.escape(meta.title)
@@ -653,7 +570,7 @@ def render_post_page(
 {content_html}
       </article>
 {'' if not extra_section_blocks else ('\\n'.join(extra_section_blocks))}
-{_build_medical_review_footer(authors) if is_medical else ''}
+{review_html}
       <div class="mt-12 bg-cvc-cream rounded-2xl p-8">
         <h2 class="font-display text-2xl text-cvc-charcoal mb-3">Need help now?</h2>
         <p class="text-gray-600 mb-6">If you are dealing with symptoms and want a clear plan, we can help. Book an appointment or call the location closest to you.</p>
@@ -673,79 +590,14 @@ def render_post_page(
 """
 
 
-def collect_upload_paths_from_fragment(html_fragment: str) -> set[str]:
-    soup = BeautifulSoup(f"<div id=\"__cvc_root__\">{html_fragment}</div>", "lxml")
-    root = soup.select_one("#__cvc_root__")
-    if not root:
-        return set()
-
-    uploads: set[str] = set()
-    attrs = ("src", "href", "data-src", "data-lazy-src", "srcset")
-    for el in root.find_all(True):
-        for attr in attrs:
-            if not el.has_attr(attr):
-                continue
-            value = str(el.get(attr) or "")
-            if not value:
-                continue
-            if attr == "srcset":
-                for part in [p.strip() for p in value.split(",") if p.strip()]:
-                    url_token = part.split()[0]
-                    if "/wp-content/uploads/" in url_token:
-                        uploads.add(url_token.split("/wp-content/uploads/", 1)[1].split("?", 1)[0].split("#", 1)[0])
-                continue
-            if "/wp-content/uploads/" in value:
-                uploads.add(value.split("/wp-content/uploads/", 1)[1].split("?", 1)[0].split("#", 1)[0])
-    return uploads
-
-
-def copy_uploads(
-    upload_relpaths: set[str],
-    *,
-    uploads_source: Path,
-    uploads_dest: Path,
-    download_missing: bool,
-    origin: str,
-) -> tuple[int, int]:
-    copied = 0
-    missing = 0
-
-    uploads_dest.mkdir(parents=True, exist_ok=True)
-    session = requests.Session()
-
-    for rel in sorted(upload_relpaths):
-        src = uploads_source / rel
-        dest = uploads_dest / rel
-        if dest.exists():
-            continue
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        if src.exists():
-            shutil.copy2(src, dest)
-            copied += 1
-            continue
-
-        if not download_missing:
-            missing += 1
-            continue
-
-        url = f"{origin.rstrip('/')}/wp-content/uploads/{rel}"
-        try:
-            resp = session.get(url, timeout=60, headers={"User-Agent": "cvc-static-blog-import/1.0"})
-            if resp.status_code != 200:
-                missing += 1
-                continue
-            dest.write_bytes(resp.content)
-            copied += 1
-        except Exception:
-            missing += 1
-
-    return copied, missing
-
-
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--origin", default=DEFAULT_ORIGIN, help="WordPress origin (default: classicvisioncare.com)")
-    parser.add_argument("--overwrite", action="store_true", help="Overwrite existing generated blog pages.")
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Overwrite existing generated blog pages (and copied uploads that differ from the export).",
+    )
     parser.add_argument(
         "--uploads-source",
         default=str((BASE_DIR.parent / "wp_export" / "public_html" / "wp-content" / "uploads").resolve()),
@@ -761,12 +613,32 @@ def main() -> int:
         action="store_true",
         help="If an upload asset is missing locally, download it from the WP origin.",
     )
+    parser.add_argument(
+        "--uploads-manifest-out",
+        default=str(DEFAULT_UPLOADS_MANIFEST_PATH),
+        help="Where to write the referenced/copied/orphaned uploads manifest (with --copy-uploads).",
+    )
     parser.add_argument(
         "--manifest-out",
-        default=str((BASE_DIR / "content" / "wp_blog_posts.json").resolve()),
+        default=str(DEFAULT_MANIFEST_PATH),
         help="Where to write a JSON manifest of imported posts.",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only fetch and re-render posts modified since the last sync; remove deleted posts.",
+    )
+    parser.add_argument(
+        "--from-export",
+        metavar="PATH",
+        help="Read posts from a JSON array / JSON Lines export of WP REST post objects instead of the API.",
+    )
+    add_fetch_arguments(parser)
+    htmlparse.add_parser_argument(parser)
     args = parser.parse_args()
+    if args.from_export and args.incremental:
+        parser.error("--from-export cannot be combined with --incremental")
+    htmlparse.set_default_backend(args.parser)
 
     origin = args.origin.rstrip("/")
     origin_host = urlparse(origin).netloc.lower() or "classicvisioncare.com"
@@ -775,104 +647,223 @@ def main() -> int:
     header, footer = read_layout_blocks()
     authors, community_slugs = _load_authors()
 
-    posts = fetch_posts(origin)
-    print(f"Found {len(posts)} published posts via WP API")
+    manifest_out = Path(args.manifest_out)
+    sync_state = JsonCache("wp-sync", version=SYNC_CACHE_VERSION)
+    known_modified = sync_state.section("posts")
+    watermark = sync_state.data.get("watermark")
+    previous = load_manifest(manifest_out) if args.incremental else None
+    incremental = previous is not None and isinstance(watermark, str)
+    if args.incremental and not incremental:
+        print("No previous sync state or manifest; running a full import.")
+
+    fetcher = fetcher_from_args(args)
+    t0 = time.perf_counter()
+    live_ids: set[int] = set()
+    if incremental:
+        live_ids = fetch_post_ids(fetcher, origin)
+        since = modified_after_param(watermark)
+        previous_ids = {entry.get("id") for entry in previous}
+
+        def is_changed(post: dict[str, Any]) -> bool:
+            return known_modified.get(str(post.get("id"))) != post_modified_gmt(post) or post.get("id") not in previous_ids
+
+        pages = ([post for post in page if is_changed(post)] for page in iter_post_pages(fetcher, origin, modified_after=since))
+    elif args.from_export:
+        pages = iter_export_pages(Path(args.from_export))
+    else:
+        pages = iter_post_pages(fetcher, origin)
 
+    rewrite_urls = RewriteUrls(lambda url: to_root_relative(url, origin_hosts=origin_hosts))
     uploads_source = Path(args.uploads_source)
     uploads_dest = BASE_DIR / "wp-content" / "uploads"
 
     manifest: list[dict[str, Any]] = []
+    post_modified: dict[str, str] = {}
 
     written = 0
     skipped = 0
+    scraped_count = 0
+    scrape_seconds = 0.0
     upload_paths: set[str] = set()
 
-    for post in posts:
-        meta = build_post_meta(origin, post)
-
-        rendered = post.get("content", {}).get("rendered", "")
-        if not isinstance(rendered, str):
-            rendered = ""
-
-        if looks_like_divi_shortcodes(rendered):
-            try:
-                content_html = scrape_rendered_entry_content(meta.url)
-            except Exception as exc:
-                print(f"[WARN] scrape failed for {meta.url}: {exc}. Falling back to REST content.")
-                content_html = rendered
-        else:
-            content_html = rendered
-
-        content_html = rewrite_fragment_urls(content_html, origin_hosts=origin_hosts)
-        # Content cleanup: fix a known corrupted token in the WP HTML export.
-        content_html = content_html.replace(
-            "rehttps://classicvisioncare.us23.cdn-alpha.com/blog/are-glasses-better-than-contacts/placement",
-            "replacement",
+    # Posts stream in one API page (or export batch) at a time; each batch is
+    # scraped, rendered and dropped before the next, so only the slim manifest
+    # entries accumulate.
+    for posts in pages:
+        for post in posts:
+            modified_gmt = post_modified_gmt(post)
+            if modified_gmt:
+                post_modified[str(post.get("id"))] = modified_gmt
+
+        # Scrape the batch's Divi posts concurrently; results keep post order.
+        metas = [build_post_meta(origin, post) for post in posts]
+        rendered_by_post = [rendered_content(post) for post in posts]
+        del posts
+        to_scrape = [i for i, rendered in enumerate(rendered_by_post) if looks_like_divi_shortcodes(rendered)]
+        t1 = time.perf_counter()
+        scraped = dict(
+            zip(to_scrape, fetcher.map(lambda i: scrape_rendered_entry_content(fetcher, metas[i].url), to_scrape))
         )
+        scraped_count += len(to_scrape)
+        scrape_seconds += time.perf_counter() - t1
+
+        for i, meta in enumerate(metas):
+            rendered = rendered_by_post[i]
+
+            outcome = scraped.pop(i, None)
+            if outcome is None:
+                doc = PostDocument.parse(rendered)
+            elif outcome.error is not None:
+                print(f"[WARN] scrape failed for {meta.url}: {outcome.error}. Falling back to REST content.")
+                doc = PostDocument.parse(rendered)
+            else:
+                doc = PostDocument.parse(outcome.value)
+
+            # One walk over the post: rewrite URLs, then read what the page needs.
+            upload_refs, faq, words = CollectUploads(), FaqExtractor(), WordCount()
+            doc.visit(rewrite_urls, upload_refs, faq, words)
+            content_html = doc.html()
+            del doc
+            # Content cleanup: fix a known corrupted token in the WP HTML export.
+            content_html = content_html.replace(
+                "rehttps://classicvisioncare.us23.cdn-alpha.com/blog/are-glasses-better-than-contacts/placement",
+                "replacement",
+            )
 
-        # Featured image URL should be root-relative as well, for preview parity.
-        if meta.featured_image:
-            rewritten = to_root_relative(meta.featured_image, origin_hosts=origin_hosts)
-            if rewritten:
-                meta = PostMeta(**{**meta.__dict__, "featured_image": rewritten})
-
-        upload_paths |= collect_upload_paths_from_fragment(content_html)
-        if meta.featured_image and "/wp-content/uploads/" in meta.featured_image:
-            upload_paths.add(meta.featured_image.split("/wp-content/uploads/", 1)[1].split("?", 1)[0].split("#", 1)[0])
-
-        author_slug = _assign_author(meta.slug, community_slugs)
-
-        dest = dest_for_path(meta.path)
-        if dest.exists() and not args.overwrite:
-            skipped += 1
-        else:
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            page_html = render_post_page(
-                origin,
-                meta,
-                content_html=content_html,
-                header=header,
-                footer=footer,
-                author_slug=author_slug,
-                authors=authors,
+            # Featured image URL should be root-relative as well, for preview parity.
+            if meta.featured_image:
+                rewritten = to_root_relative(meta.featured_image, origin_hosts=origin_hosts)
+                if rewritten:
+                    meta = PostMeta(**{**meta.__dict__, "featured_image": rewritten})
+
+            upload_paths |= upload_refs.paths
+            if meta.featured_image and "/wp-content/uploads/" in meta.featured_image:
+                upload_paths.add(upload_relpath(meta.featured_image))
+
+            author_slug = _assign_author(meta.slug, community_slugs)
+
+            dest = dest_for_path(meta.path)
+            # In incremental mode every fetched post has changed, so always re-render it.
+            if dest.exists() and not (args.overwrite or incremental):
+                skipped += 1
+            else:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                page_html = render_post_page(
+                    origin,
+                    meta,
+                    content_html=content_html,
+                    header=header,
+                    footer=footer,
+                    author_slug=author_slug,
+                    authors=authors,
+                    faq_items=faq.items,
+                )
+                dest.write_text(page_html, encoding="utf-8")
+                written += 1
+
+            manifest.append(
+                {
+                    "id": meta.id,
+                    "slug": meta.slug,
+                    "path": meta.path,
+                    "title": meta.title,
+                    "description": meta.description,
+                    "date_published": meta.date_published,
+                    "date_modified": meta.date_modified,
+                    "author": authors[author_slug]["name"],
+                    "author_slug": author_slug,
+                    "content_type": "community" if author_slug == "ankit-patel" else "medical",
+                    "featured_image": meta.featured_image,
+                    "word_count": words.count,
+                }
             )
-            dest.write_text(page_html, encoding="utf-8")
-            written += 1
-
-        manifest.append(
-            {
-                "id": meta.id,
-                "slug": meta.slug,
-                "path": meta.path,
-                "title": meta.title,
-                "description": meta.description,
-                "date_published": meta.date_published,
-                "date_modified": meta.date_modified,
-                "author": authors[author_slug]["name"],
-                "author_slug": author_slug,
-                "content_type": "community" if author_slug == "ankit-patel" else "medical",
-                "featured_image": meta.featured_image,
-            }
+
+    seconds = time.perf_counter() - t0
+    if incremental:
+        print(
+            f"Incremental sync since {watermark}: {len(manifest)} changed of {len(live_ids)} published posts "
+            f"({seconds:.1f}s)"
         )
+    else:
+        source = args.from_export if args.from_export else "WP API"
+        print(f"Imported {len(manifest)} published posts from {source} ({seconds:.1f}s)")
+    if scraped_count:
+        print(f"Scraped {scraped_count} Divi posts ({scrape_seconds:.1f}s)")
+
+    removed = 0
+    if incremental:
+        changed = {entry["id"]: entry for entry in manifest}
+        live_paths = {entry["path"] for entry in previous if entry.get("id") in live_ids} | {
+            entry["path"] for entry in manifest
+        }
+        merged = []
+        for entry in previous:
+            post_id = entry.get("id")
+            if post_id not in live_ids:
+                known_modified.pop(str(post_id), None)
+                sync_state.dirty = True
+                path = entry.get("path")
+                if isinstance(path, str) and path not in live_paths and remove_post_page(path):
+                    removed += 1
+                continue
+            merged.append(changed.pop(post_id, entry))
+        merged.extend(changed.values())
+        # Same order a full import produces (newest first); sort is stable.
+        merged.sort(key=lambda entry: entry.get("date_published") or "", reverse=True)
+        manifest = merged
+    else:
+        sync_state.data["posts"] = known_modified = {}
 
-    manifest_out = Path(args.manifest_out)
+    for post_id, modified_gmt in post_modified.items():
+        sync_state.set("posts", post_id, modified_gmt)
+    if known_modified:
+        sync_state.data["watermark"] = max(known_modified.values())
+    sync_state.dirty = True
     manifest_out.parent.mkdir(parents=True, exist_ok=True)
-    manifest_out.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    write_records(manifest_out, manifest)
 
-    copied = missing = 0
+    copy_report = None
     if args.copy_uploads:
-        copied, missing = copy_uploads(
+
+        def download_upload(rel: str) -> bytes:
+            return fetcher.get(f"{origin}/wp-content/uploads/{rel}", cache=False).content
+
+        t0 = time.perf_counter()
+        copy_report = uploads.copy_uploads(
             upload_paths,
             uploads_source=uploads_source,
             uploads_dest=uploads_dest,
-            download_missing=args.download_missing,
-            origin=origin,
+            download=download_upload if args.download_missing else None,
+            overwrite=args.overwrite,
+            workers=args.workers,
+        )
+        copy_seconds = time.perf_counter() - t0
+        uploads_manifest_out = Path(args.uploads_manifest_out)
+        uploads_manifest_out.parent.mkdir(parents=True, exist_ok=True)
+        uploads_manifest_out.write_text(
+            json.dumps(copy_report.as_manifest(), ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
         )
 
     print(f"Pages written: {written}, skipped: {skipped}")
+    if incremental:
+        print(f"Pages removed (deleted posts): {removed}")
     print(f"Manifest: {manifest_out.relative_to(BASE_DIR)} ({len(manifest)} posts)")
-    if args.copy_uploads:
-        print(f"Uploads copied: {copied}, missing: {missing} (dest: {uploads_dest.relative_to(BASE_DIR)}/)")
+    if copy_report is not None:
+        print(
+            f"Uploads: {len(copy_report.referenced)} referenced, {len(copy_report.copied)} copied, "
+            f"{len(copy_report.downloaded)} downloaded, {len(copy_report.linked)} hardlinked, "
+            f"{len(copy_report.unchanged)} unchanged, {len(copy_report.missing)} missing, "
+            f"{len(copy_report.orphaned)} orphaned ({copy_seconds:.1f}s, dest: {uploads_dest.relative_to(BASE_DIR)}/)"
+        )
+        if copy_report.differing:
+            print(f"  {len(copy_report.differing)} uploads differ from the export; rerun with --overwrite to replace them")
+    print("HTTP:")
+    print(fetcher.report())
+    fetcher.close()
+    sync_state.save()
+
+    if incremental and (written or removed) and manifest_out.resolve() == DEFAULT_MANIFEST_PATH:
+        regenerate_blog_index()
     return 0
 
 
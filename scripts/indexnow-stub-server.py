@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Local stand-in for the IndexNow API, for testing indexnow-submit.py.
+
+Usage:
+    python scripts/indexnow-stub-server.py                 # listen on 127.0.0.1:8765
+    python scripts/indexnow-stub-server.py --fail-first 2  # answer 429 to the first 2 POSTs
+    python scripts/indexnow-submit.py --changed --endpoint http://127.0.0.1:8765/indexnow
+
+Accepts POST /indexnow with the IndexNow JSON body, validates it the way the
+real endpoint does (host, key, urlList of 1-10,000 URLs on that host) and
+answers 200, 400 or 422. Speaks HTTP/1.1 so clients can reuse the connection.
+Each request is logged with its connection number and URL count.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+MAX_URLS = 10_000
+
+
+class StubState:
+    def __init__(self, fail_first: int, fail_status: int) -> None:
+        self.fail_remaining = fail_first
+        self.fail_status = fail_status
+        self.connections = itertools.count(1)
+        self.received = 0
+
+
+def make_handler(state: StubState) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self) -> None:
+            super().setup()
+            self.connection_id = next(state.connections)
+
+        def _reply(self, status: int, message: str = "") -> None:
+            body = message.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            if status == 429:
+                self.send_header("Retry-After", "1")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length)
+            if urlsplit(self.path).path != "/indexnow":
+                self._reply(404, "not found")
+                return
+            if state.fail_remaining > 0:
+                state.fail_remaining -= 1
+                self.log_message("conn %d: simulated %d", self.connection_id, state.fail_status)
+                self._reply(state.fail_status, "simulated failure")
+                return
+            try:
+                payload = json.loads(raw)
+            except ValueError:
+                self._reply(400, "invalid JSON")
+                return
+            host = payload.get("host")
+            urls = payload.get("urlList")
+            if not host or not payload.get("key") or not isinstance(urls, list):
+                self._reply(400, "missing host, key or urlList")
+                return
+            if not 1 <= len(urls) <= MAX_URLS:
+                self._reply(422, f"urlList must contain 1-{MAX_URLS} URLs")
+                return
+            foreign = [u for u in urls if urlsplit(str(u)).hostname != host]
+            if foreign:
+                self._reply(422, f"URL not on host {host}: {foreign[0]}")
+                return
+            state.received += len(urls)
+            self.log_message("conn %d: accepted %d URLs (%d total)", self.connection_id, len(urls), state.received)
+            self._reply(200, "OK")
+
+        def do_GET(self) -> None:
+            self._reply(405, "use POST")
+
+    return Handler
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Local IndexNow stub endpoint.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fail-first", type=int, default=0, help="Fail this many POSTs before accepting.")
+    parser.add_argument("--fail-status", type=int, default=429, help="Status for simulated failures (default: %(default)s).")
+    args = parser.parse_args()
+
+    state = StubState(args.fail_first, args.fail_status)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(state))
+    print(f"IndexNow stub listening on http://{args.host}:{args.port}/indexnow")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
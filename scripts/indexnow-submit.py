@@ -4,53 +4,264 @@
 Usage:
     python scripts/indexnow-submit.py https://classicvisioncare.com/ai-profile/
     python scripts/indexnow-submit.py https://classicvisioncare.com/page1/ https://classicvisioncare.com/page2/
+
+    # Submit only pages whose content changed since the last successful submission
+    python scripts/indexnow-submit.py --changed
+    python scripts/indexnow-submit.py --changed --dry-run
+
+    # Show / retry URLs still pending from an earlier (partially failed) run
+    python scripts/indexnow-submit.py --pending
+    python scripts/indexnow-submit.py --drain
+
+    # Exercise the client against the local stub (scripts/indexnow-stub-server.py)
+    python scripts/indexnow-submit.py --changed --endpoint http://127.0.0.1:8765/indexnow
+
+--changed hashes every public page, compares against the hashes recorded in
+the submission ledger (.build-cache/indexnow.sqlite3, see sitebuild.ledger)
+and queues only new or changed canonical URLs. URLs are POSTed in batches of
+up to 10,000 over one keep-alive connection; 429 and 5xx responses are retried
+with exponential backoff (honouring Retry-After), and POSTs to the endpoint
+host are capped by --rate-limit per minute across runs. Each batch's outcome
+is committed to the ledger as soon as it returns, so URLs from a failed batch
+stay pending for --drain.
 """
 
-import sys
+from __future__ import annotations
+
+import argparse
+import http.client
 import json
-import urllib.request
+import re
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from sitebuild import inventory
+from sitebuild.buildcache import sha256_bytes
+from sitebuild.ledger import Ledger, RateLimiter
 
+BASE_DIR = Path(__file__).resolve().parent.parent
 INDEXNOW_KEY = "6ff6962686d14de48b844bea300b6570"
 HOST = "classicvisioncare.com"
+ORIGIN = f"https://{HOST}"
 ENDPOINT = "https://api.indexnow.org/indexnow"
 
+BATCH_SIZE = 10_000  # IndexNow accepts at most 10,000 URLs per POST
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0  # seconds; doubles on each retry
+MAX_BACKOFF = 60.0
+TIMEOUT = 30
+RATE_LIMIT = 10  # POSTs per minute per endpoint host
+
+CANONICAL_RE = re.compile(
+    r'<link\s+[^>]*rel=["\']canonical["\'][^>]*href=["\']([^"\']+)["\']', re.IGNORECASE
+)
+
 
-def submit_urls(urls):
-    if len(urls) == 1:
-        # Single URL submission via GET
-        url = f"{ENDPOINT}?url={urls[0]}&key={INDEXNOW_KEY}"
-        req = urllib.request.Request(url)
+class IndexNowClient:
+    """POSTs URL batches to one IndexNow endpoint over a reused connection."""
+
+    def __init__(self, endpoint: str = ENDPOINT, limiter: RateLimiter | None = None) -> None:
+        parts = urlsplit(endpoint)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise SystemExit(f"Unsupported endpoint: {endpoint}")
+        self.limiter = limiter
+        self.scheme = parts.scheme
+        self.netloc = parts.netloc
+        self.path = parts.path or "/"
+        self._conn: http.client.HTTPConnection | None = None
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            self._conn = cls(self.netloc, timeout=TIMEOUT)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _post_once(self, body: bytes) -> tuple[int, str, str | None]:
+        conn = self._connection()
         try:
-            resp = urllib.request.urlopen(req)
-            print(f"OK ({resp.status}): {urls[0]}")
-        except urllib.error.HTTPError as e:
-            print(f"ERROR ({e.code}): {urls[0]} — {e.reason}")
-    else:
-        # Batch submission via POST
+            conn.request(
+                "POST",
+                self.path,
+                body=body,
+                headers={"Content-Type": "application/json; charset=utf-8", "Connection": "keep-alive"},
+            )
+            resp = conn.getresponse()
+            resp.read()  # drain so the connection can be reused
+        except (OSError, http.client.HTTPException):
+            # Stale keep-alive socket or network error: reconnect on the next attempt.
+            self.close()
+            return 0, "connection error", None
+        if resp.will_close:
+            self.close()
+        return resp.status, resp.reason, resp.getheader("Retry-After")
+
+    def submit(self, urls: list[str]) -> tuple[int, str]:
+        """Submit one batch; returns the final (status, reason). 0 = no response."""
         payload = {
             "host": HOST,
             "key": INDEXNOW_KEY,
-            "keyLocation": f"https://{HOST}/{INDEXNOW_KEY}.txt",
-            "urlList": urls
+            "keyLocation": f"{ORIGIN}/{INDEXNOW_KEY}.txt",
+            "urlList": urls,
         }
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            ENDPOINT,
-            data=data,
-            headers={"Content-Type": "application/json; charset=utf-8"}
-        )
-        try:
-            resp = urllib.request.urlopen(req)
-            print(f"OK ({resp.status}): submitted {len(urls)} URLs")
-        except urllib.error.HTTPError as e:
-            print(f"ERROR ({e.code}): {e.reason}")
+        body = json.dumps(payload).encode("utf-8")
+        status, reason = 0, ""
+        for attempt in range(MAX_RETRIES + 1):
+            if self.limiter is not None:
+                waited = self.limiter.wait()
+                if waited:
+                    print(f"  Rate limit: waited {waited:.0f}s")
+            status, reason, retry_after = self._post_once(body)
+            if self.limiter is not None:
+                self.limiter.record(len(urls), status)
+            if status and status != 429 and status < 500:
+                return status, reason
+            if attempt == MAX_RETRIES:
+                break
+            delay = min(MAX_BACKOFF, BACKOFF_BASE * (2 ** attempt))
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            print(f"  Retry {attempt + 1}/{MAX_RETRIES} in {delay:.0f}s ({status or 'no response'} {reason})")
+            time.sleep(delay)
+        return status, reason
+
+
+def is_success(status: int) -> bool:
+    return status in (200, 202)
 
+
+def batched(urls: list[str], size: int) -> list[list[str]]:
+    return [urls[i : i + size] for i in range(0, len(urls), size)]
+
+
+def redirect_sources() -> set[str]:
+    """Exact-path redirect sources from vercel.json (not canonical, never submit)."""
+    try:
+        vercel = json.loads((BASE_DIR / "vercel.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return set()
+    return {
+        r["source"]
+        for r in vercel.get("redirects", [])
+        if isinstance(r, dict) and isinstance(r.get("source"), str) and not re.search(r"[:(*]", r["source"])
+    }
+
+
+def current_page_hashes() -> dict[str, str]:
+    """Canonical URL -> content hash for every public route in this build."""
+    skip = redirect_sources()
+    hashes: dict[str, str] = {}
+    for url_path, file_path in inventory.load().routes():
+        if url_path in skip:
+            continue
+        data = file_path.read_bytes()
+        match = CANONICAL_RE.search(data.decode("utf-8", errors="replace"))
+        url = match.group(1) if match else f"{ORIGIN}{url_path}"
+        if not url.startswith(ORIGIN):
+            continue
+        hashes[url] = sha256_bytes(data)
+    return hashes
+
+
+def submit_batches(client: IndexNowClient, ledger: Ledger, urls: list[str], batch_size: int) -> list[str]:
+    """Submit *urls* in batches; returns the URLs that were accepted."""
+    accepted: list[str] = []
+    for batch in batched(urls, batch_size):
+        status, reason = client.submit(batch)
+        ledger.record_result(batch, status, accepted=is_success(status))
+        if is_success(status):
+            print(f"OK ({status}): submitted {len(batch)} URLs")
+            accepted.extend(batch)
+        else:
+            print(f"ERROR ({status or 'no response'}): {reason} — {len(batch)} URLs not submitted")
+    return accepted
+
+
+def submit_changed(client: IndexNowClient, ledger: Ledger, *, batch_size: int, dry_run: bool) -> int:
+    hashes = current_page_hashes()
+    if dry_run:
+        submitted = ledger.submitted_hashes()
+        queue = [url for url, digest in sorted(hashes.items()) if submitted.get(url) != digest]
+    else:
+        ledger.record_hashes(hashes)
+        queue = [p.url for p in ledger.pending()]
+
+    print(f"Scanned {len(hashes)} canonical URLs; {len(queue)} pending submission.")
+    if dry_run:
+        for url in queue:
+            print(f"  {url}")
+        return 0
+    return drain(client, ledger, queue, batch_size=batch_size)
+
+
+def drain(client: IndexNowClient, ledger: Ledger, queue: list[str], *, batch_size: int) -> int:
+    if not queue:
+        return 0
+    accepted = submit_batches(client, ledger, queue, batch_size)
+    left = len(queue) - len(accepted)
+    if left:
+        print(f"{left} URLs still pending; rerun with --drain to retry.")
+    return 0 if not left else 1
+
+
+def print_pending(ledger: Ledger) -> int:
+    pending = ledger.pending()
+    for p in pending:
+        if p.last_attempt_at is None:
+            detail = "never attempted"
+        else:
+            when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(p.last_attempt_at))
+            detail = f"last status {p.last_status or 'no response'} at {when}, {p.attempts} failed attempt(s)"
+        print(f"  {p.url} ({detail})")
+    print(f"{len(pending)} URLs pending.")
     return 0
 
 
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Submit URLs to IndexNow.")
+    parser.add_argument("urls", nargs="*", help="URLs to submit.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--changed", action="store_true", help="Submit pages changed since the last submission.")
+    mode.add_argument("--drain", action="store_true", help="Retry URLs left pending by earlier runs.")
+    mode.add_argument("--pending", action="store_true", help="List pending URLs and exit.")
+    parser.add_argument("--dry-run", action="store_true", help="With --changed: list the queue without submitting.")
+    parser.add_argument("--endpoint", default=ENDPOINT, help="IndexNow endpoint (default: %(default)s).")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="URLs per POST (default: %(default)s).")
+    parser.add_argument(
+        "--rate-limit",
+        type=int,
+        default=RATE_LIMIT,
+        help="Max POSTs per minute to the endpoint host, 0 = unlimited (default: %(default)s).",
+    )
+    args = parser.parse_args(argv)
+
+    if not (args.urls or args.changed or args.drain or args.pending):
+        parser.print_usage()
+        return 1
+    batch_size = max(1, min(args.batch_size, BATCH_SIZE))
+
+    ledger = Ledger()
+    limiter = RateLimiter(ledger, urlsplit(args.endpoint).netloc, args.rate_limit)
+    client = IndexNowClient(args.endpoint, limiter)
+    try:
+        if args.pending:
+            return print_pending(ledger)
+        if args.changed:
+            return submit_changed(client, ledger, batch_size=batch_size, dry_run=args.dry_run)
+        if args.drain:
+            return drain(client, ledger, [p.url for p in ledger.pending()], batch_size=batch_size)
+        accepted = submit_batches(client, ledger, args.urls, batch_size)
+        return 0 if len(accepted) == len(args.urls) else 1
+    finally:
+        client.close()
+        ledger.close()
+
+
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python scripts/indexnow-submit.py <url> [<url2> ...]")
-        sys.exit(1)
-    urls = sys.argv[1:]
-    sys.exit(submit_urls(urls))
+    sys.exit(main())
@@ -11,20 +11,42 @@ What this script does:
 5. Generates Ankit Patel's author page (/author/ankit-patel/).
 6. Adds Physician schema + articles section to Dr. Mital Patel's page.
 7. Updates wp_blog_posts.json manifest with author_slug and content_type.
+
+Steps 2-4 rewrite the jsonld / byline / review slots (sitebuild.slots) that
+the generators fence in every article, in one pass per page. Pages from
+before the fences are matched the old way once and get fenced on the way.
+
+Re-runs are incremental: .build-cache/authorship.json maps each author to
+the pages that embed them (sitebuild.authordeps), so editing one entry in
+content/authors.json rebuilds only that author's articles and archive
+pages. Pages whose post, assigned author or file changed are rebuilt too;
+--no-cache rebuilds everything.
 """
 
 from __future__ import annotations
 
-import datetime as dt
+import argparse
 import html
 import json
 import re
 import sys
 from pathlib import Path
-from typing import Any
+from functools import partial
+from typing import Any, Callable, Iterator
+
+from sitebuild import bylines, jsonld, slots
+from sitebuild.authordeps import DependencyIndex
+from sitebuild.buildcache import fingerprint
+from sitebuild.jsonstream import iter_records, write_records
 
 BASE_DIR = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = BASE_DIR / "content" / "wp_blog_posts.json"
 ORIGIN = "https://classicvisioncare.com"
+# Part of every page's dependency key; bump when article or author page
+# markup changes so the next run rebuilds everything.
+RENDER_VERSION = 1
+ARTICLE_FIELDS = ("path", "title", "description", "date_published", "date_modified", "featured_image")
+CARD_FIELDS = ("path", "title", "description", "date_published")
 
 
 # ---------------------------------------------------------------------------
@@ -38,9 +60,9 @@ def load_authors() -> tuple[dict[str, Any], set[str]]:
     return data, community_slugs
 
 
-def load_manifest() -> list[dict[str, Any]]:
-    path = BASE_DIR / "content" / "wp_blog_posts.json"
-    return json.loads(path.read_text(encoding="utf-8"))
+def iter_manifest() -> Iterator[dict[str, Any]]:
+    """Manifest entries one at a time, without loading the whole file."""
+    return iter_records(MANIFEST_PATH)
 
 
 def read_layout_blocks() -> tuple[str, str]:
@@ -53,7 +75,7 @@ def read_layout_blocks() -> tuple[str, str]:
         raise RuntimeError("Could not extract header from index.html")
 
     footer_match = re.search(
-        r'(<!-- Footer -->.*?<script src="/scripts/editorial-forest\.js"></script>)',
+        r"""(<!-- Footer -->.*?<script\b[^>]*\bsrc=["']/scripts/editorial-forest\.js["'][^>]*></script>)""",
         index_text,
         flags=re.DOTALL,
     )
@@ -78,177 +100,21 @@ def assign_author(slug: str, community_slugs: set[str]) -> str:
 # Schema builders
 # ---------------------------------------------------------------------------
 
-def _clean_title(raw: str) -> str:
-    """Strip site-name suffixes like ' | Classic Vision Care'."""
-    for sep in (" | ", " - Classic Vision Care"):
-        if sep in raw:
-            raw = raw.split(sep)[0]
-    return raw.strip()
-
-
-def build_article_schema(
-    post: dict[str, Any], author_slug: str, authors: dict[str, Any]
-) -> str:
-    author = authors[author_slug]
-    canonical = f"{ORIGIN}{post['path']}"
-    is_medical = author_slug == "dr-mital-patel"
-    headline = _clean_title(post.get("title") or "")
-
-    graph: list[dict[str, Any]] = []
-
-    # -- Article / MedicalWebPage --
-    article: dict[str, Any] = {
-        "@type": "MedicalWebPage" if is_medical else ["Article", "BlogPosting"],
-        "@id": f"{canonical}#article",
-        "headline": headline,
-        "author": {"@id": author["schema_id"]},
-        "publisher": {"@id": f"{ORIGIN}/#organization"},
-        "mainEntityOfPage": {"@id": canonical},
-        "inLanguage": "en-US",
-    }
-    if post.get("date_published"):
-        article["datePublished"] = post["date_published"]
-    if post.get("date_modified"):
-        article["dateModified"] = post["date_modified"]
-    if post.get("description"):
-        article["description"] = post["description"]
-    if post.get("featured_image"):
-        img = post["featured_image"]
-        article["image"] = img if img.startswith("http") else f"{ORIGIN}{img}"
-    graph.append(article)
-
-    # -- WebPage --
-    webpage: dict[str, Any] = {
-        "@type": "WebPage",
-        "@id": canonical,
-        "url": canonical,
-        "name": post.get("title") or headline,
-        "isPartOf": {"@id": f"{ORIGIN}/#website"},
-        "author": {"@id": author["schema_id"]},
-        "breadcrumb": {"@id": f"{canonical}#breadcrumb"},
-        "inLanguage": "en-US",
-    }
-    if post.get("date_published"):
-        webpage["datePublished"] = post["date_published"]
-    if post.get("date_modified"):
-        webpage["dateModified"] = post["date_modified"]
-    if post.get("description"):
-        webpage["description"] = post["description"]
-    graph.append(webpage)
-
-    # -- Author (Person or Physician) --
-    author_node: dict[str, Any] = {
-        "@type": author["schema_type"],
-        "@id": author["schema_id"],
-        "name": author["name"],
-        "url": f"{ORIGIN}{author['author_page']}",
-        "image": f"{ORIGIN}{author['image']}",
-        "sameAs": author.get("sameAs", []),
-        "worksFor": {"@id": f"{ORIGIN}/#organization"},
-    }
-    if author.get("credentials"):
-        author_node["jobTitle"] = author["title"]
-        if author["credentials"].get("specialties"):
-            author_node["knowsAbout"] = author["credentials"]["specialties"]
-    else:
-        author_node["jobTitle"] = author["title"]
-    graph.append(author_node)
-
-    # -- BreadcrumbList --
-    graph.append(
-        {
-            "@type": "BreadcrumbList",
-            "@id": f"{canonical}#breadcrumb",
-            "itemListElement": [
-                {
-                    "@type": "ListItem",
-                    "position": 1,
-                    "name": "Home",
-                    "item": f"{ORIGIN}/",
-                },
-                {
-                    "@type": "ListItem",
-                    "position": 2,
-                    "name": "Resources",
-                    "item": f"{ORIGIN}/blog/",
-                },
-                {"@type": "ListItem", "position": 3, "name": headline},
-            ],
-        }
-    )
-
-    # -- Organization --
-    graph.append(
-        {
-            "@type": "Organization",
-            "@id": f"{ORIGIN}/#organization",
-            "name": "Classic Vision Care",
-            "url": f"{ORIGIN}/",
-            "logo": f"{ORIGIN}/images/logos/EOP1600_Classic_Logo_FN.png",
-        }
-    )
-
-    return json.dumps({"@context": "https://schema.org", "@graph": graph}, ensure_ascii=False)
-
-
-# ---------------------------------------------------------------------------
-# Byline + review footer builders
-# ---------------------------------------------------------------------------
-
-def _fmt_date(date_str: str | None) -> str:
-    if not date_str:
-        return ""
-    try:
-        parsed = dt.datetime.fromisoformat(str(date_str).replace("Z", "+00:00"))
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=dt.timezone.utc)
-        parsed = parsed.astimezone(dt.timezone.utc)
-        return f"{parsed.strftime('%B')} {parsed.day}, {parsed.year}"
-    except Exception:
-        return ""
-
-
-def build_rich_byline(
-    post: dict[str, Any], author_slug: str, authors: dict[str, Any]
-) -> str:
-    author = authors[author_slug]
-    date_text = _fmt_date(post.get("date_published"))
-
-    safe_name = html.escape(author["name"])
-    safe_img = html.escape(author["image"], quote=True)
-    safe_alt = html.escape(author["image_alt"], quote=True)
-    safe_page = html.escape(author["author_page"], quote=True)
-
-    date_line = ""
-    if date_text:
-        date_line = f'<p class="text-xs text-gray-500">{html.escape(date_text)}</p>'
-
-    return (
-        f'<div class="mt-4 flex items-center gap-3">\n'
-        f'        <img src="{safe_img}" alt="{safe_alt}" '
-        f'class="w-10 h-10 rounded-full object-cover" width="40" height="40" loading="lazy">\n'
-        f"        <div>\n"
-        f'          <p class="text-sm font-medium text-cvc-charcoal">'
-        f'<a href="{safe_page}" class="hover:underline">{safe_name}</a></p>\n'
-        f"          {date_line}\n"
-        f"        </div>\n"
-        f"      </div>"
-    )
-
-
-def build_medical_review_footer(authors: dict[str, Any]) -> str:
-    a = authors["dr-mital-patel"]
-    return (
-        f'<div class="mt-8 flex items-center gap-3 border-t border-gray-100 pt-6">\n'
-        f'        <img src="{a["image"]}" alt="{html.escape(a["image_alt"], quote=True)}" '
-        f'class="w-12 h-12 rounded-full object-cover" width="48" height="48" loading="lazy">\n'
-        f"        <div>\n"
-        f'          <p class="text-sm text-gray-500">Medically reviewed by</p>\n'
-        f'          <p class="text-sm font-medium text-cvc-charcoal">'
-        f'<a href="{a["author_page"]}" class="hover:underline">{html.escape(a["name"])}</a>'
-        f" &middot; Optometrist</p>\n"
-        f"        </div>\n"
-        f"      </div>"
+def article_date_modified(post: dict[str, Any]) -> str | None:
+    # From the post's manifest entry only: the page's own commit date would
+    # change with every commit of this script's output.
+    return post.get("date_modified")
+
+
+def build_article_schema(post: dict[str, Any], author_slug: str) -> str:
+    return jsonld.article_graph(
+        f"{ORIGIN}{post['path']}",
+        title=post.get("title") or "",
+        author_slug=author_slug,
+        description=post.get("description"),
+        date_published=post.get("date_published"),
+        date_modified=article_date_modified(post),
+        image=post.get("featured_image"),
     )
 
 
@@ -259,16 +125,15 @@ def build_medical_review_footer(authors: dict[str, Any]) -> str:
 JSONLD_RE = re.compile(
     r'\s*<script type="application/ld\+json">.*?</script>', re.DOTALL
 )
-FAQPAGE_RE = re.compile(
-    r'(<script type="application/ld\+json">\s*\{[^<]*?"@type"\s*:\s*"FAQPage"[^<]*?</script>)',
-    re.DOTALL,
+JSONLD_BLOCK_RE = re.compile(
+    r'<script type="application/ld\+json">(?P<body>.*?)</script>', re.DOTALL
 )
 BYLINE_RE = re.compile(
     r'<p class="mt-4 text-sm text-gray-500">[^<]*</p>'
 )
 RICH_BYLINE_RE = re.compile(
     r'<div class="mt-4 flex items-center gap-3">\s*'
-    r'<img src="[^"]*"[^>]*>\s*'
+    r'<img\b[^>]*>\s*'
     r'<div>\s*'
     r'<p class="text-sm font-medium text-cvc-charcoal">[^<]*<a[^>]*>[^<]*</a></p>\s*'
     r'(?:<p class="text-xs text-gray-500">[^<]*</p>\s*)?'
@@ -276,6 +141,117 @@ RICH_BYLINE_RE = re.compile(
     r'</div>',
     re.DOTALL,
 )
+REVIEW_FOOTER_RE = re.compile(
+    r'<div class="mt-8 flex items-center gap-3 border-t border-gray-100 pt-6">\s*'
+    r'<img\b[^>]*>\s*'
+    r'<div>\s*'
+    r'<p class="text-sm text-gray-500">Medically reviewed by</p>\s*'
+    r'<p class="text-sm font-medium text-cvc-charcoal">[^<]*<a[^>]*>[^<]*</a>[^<]*</p>\s*'
+    r'</div>\s*'
+    r'</div>',
+    re.DOTALL,
+)
+HERO_DESCRIPTION_RE = re.compile(r'<p class="text-lg text-gray-600 max-w-2xl">[^<]*</p>')
+REVIEW_ANCHOR = '<div class="mt-12 bg-cvc-cream rounded-2xl p-8">'
+# Opening of the rich byline; if RICH_BYLINE_RE misses a page that has it,
+# the markup has drifted and a second byline must not be added.
+RICH_BYLINE_START = '<div class="mt-4 flex items-center gap-3">'
+
+
+def faq_blocks(text: str) -> list[str]:
+    """FAQPage JSON-LD to keep after the new article graph.
+
+    A block whose top-level @type is FAQPage is kept as it is. An FAQPage node
+    inside a combined @graph (an older article graph) is moved into a block of
+    its own, so the rest of that graph goes with the other old blocks.
+    """
+    blocks: list[str] = []
+    seen: set[str] = set()
+    for m in JSONLD_BLOCK_RE.finditer(text):
+        try:
+            data = json.loads(m.group("body"))
+        except ValueError:
+            continue
+        if not isinstance(data, dict):
+            continue
+        if data.get("@type") == "FAQPage":
+            blocks.append(m.group(0))
+            seen.add(data.get("@id") or m.group(0))
+            continue
+        for node in data.get("@graph") or []:
+            if isinstance(node, dict) and node.get("@type") == "FAQPage" and node.get("@id") not in seen:
+                schema = jsonld.dumps({"@context": data.get("@context", jsonld.CONTEXT), **node})
+                blocks.append(jsonld.script_tag(schema, indent=""))
+                seen.add(node.get("@id"))
+    return blocks
+
+
+def install_slots(text: str, contents: dict[str, str]) -> tuple[str, list[str]]:
+    """Put fenced slots into a page generated before slots existed.
+
+    Legacy pages are matched the old way (JSON-LD blocks, byline markup,
+    review footer or its anchor); once fenced, later runs only use
+    slots.fill(). Returns the new text and the slots that found no place
+    (or whose old markup is there but no longer matches).
+    """
+    unplaced: list[str] = []
+
+    if slots.JSONLD in contents:
+        # Drop every JSON-LD block; FAQPage data (punctal plugs, etc.) stays
+        # after the article graph.
+        insert = "  " + slots.fence(slots.JSONLD, contents[slots.JSONLD])
+        insert += "".join(f"\n{block}" for block in faq_blocks(text))
+        text = JSONLD_RE.sub("", text)
+        if "</head>" in text:
+            text = text.replace("</head>", f"{insert}\n</head>", 1)
+        else:
+            unplaced.append(slots.JSONLD)
+
+    if slots.BYLINE in contents:
+        byline = slots.fence(slots.BYLINE, contents[slots.BYLINE])
+        m = RICH_BYLINE_RE.search(text) or BYLINE_RE.search(text)
+        if m:
+            text = text[: m.start()] + byline + text[m.end() :]
+        elif RICH_BYLINE_START in text:
+            unplaced.append(slots.BYLINE)
+        else:
+            # Insert after the hero description, else after </h1>.
+            m = HERO_DESCRIPTION_RE.search(text)
+            if m:
+                end = m.end()
+            elif "</h1>" in text:
+                end = text.index("</h1>") + len("</h1>")
+            else:
+                end = -1
+            if end >= 0:
+                text = text[:end] + f"\n      {byline}" + text[end:]
+            else:
+                unplaced.append(slots.BYLINE)
+
+    if slots.REVIEW in contents:
+        review = slots.fence(slots.REVIEW, contents[slots.REVIEW])
+        m = REVIEW_FOOTER_RE.search(text)
+        if m:
+            text = text[: m.start()] + review + text[m.end() :]
+        elif REVIEW_ANCHOR in text:
+            text = text.replace(REVIEW_ANCHOR, f"{review}\n      {REVIEW_ANCHOR}", 1)
+        else:
+            unplaced.append(slots.REVIEW)
+
+    return text, unplaced
+
+
+def article_slots(post: dict[str, Any], author_slug: str, authors: dict[str, Any]) -> dict[str, str]:
+    """Slot contents for one article: schema, byline and review footer.
+
+    Community articles keep an empty review slot.
+    """
+    is_medical = author_slug == bylines.MEDICAL_REVIEWER
+    return {
+        slots.JSONLD: jsonld.script_tag(build_article_schema(post, author_slug), indent=""),
+        slots.BYLINE: bylines.rich_byline(authors[author_slug], post.get("date_published")),
+        slots.REVIEW: bylines.medical_review_footer(authors[bylines.MEDICAL_REVIEWER]) if is_medical else "",
+    }
 
 
 def migrate_article(
@@ -289,68 +265,21 @@ def migrate_article(
         print(f"  [MISS] {file_path.relative_to(BASE_DIR)}")
         return False
 
-    text = file_path.read_text(encoding="utf-8")
-    original = text
-    is_medical = author_slug == "dr-mital-patel"
-
-    # ---- 1. Replace JSON-LD schema ----
-    new_schema = build_article_schema(post, author_slug, authors)
-    new_schema_escaped = new_schema.replace("</", "<\\/")
-    new_schema_tag = f'  <script type="application/ld+json">{new_schema_escaped}</script>'
-
-    # Preserve FAQPage schema if present (punctal plugs, etc.)
-    faq_match = FAQPAGE_RE.search(text)
-    faq_tag = faq_match.group(1) if faq_match else ""
-
-    # Remove ALL existing JSON-LD blocks
-    text = JSONLD_RE.sub("", text)
-
-    # Insert new schema before </head>
-    insert = new_schema_tag
-    if faq_tag:
-        insert += f"\n{faq_tag}"
-    text = text.replace("</head>", f"{insert}\n</head>")
-
-    # ---- 2. Replace byline ----
-    new_byline = build_rich_byline(post, author_slug, authors)
-
-    if RICH_BYLINE_RE.search(text):
-        text = RICH_BYLINE_RE.sub(new_byline, text, count=1)
-    elif BYLINE_RE.search(text):
-        text = BYLINE_RE.sub(new_byline, text, count=1)
-    else:
-        # Try to insert after description <p> in hero
-        desc_m = re.search(
-            r'(<p class="text-lg text-gray-600 max-w-2xl">[^<]*</p>)', text
-        )
-        if desc_m:
-            text = text[: desc_m.end()] + f"\n      {new_byline}" + text[desc_m.end() :]
-        else:
-            # Fallback: insert after </h1>
-            h1_m = re.search(r"(</h1>)", text)
-            if h1_m:
-                text = text[: h1_m.end()] + f"\n      {new_byline}" + text[h1_m.end() :]
-
-    # ---- 3. Add or update medical review footer ----
-    if is_medical:
-        new_footer = build_medical_review_footer(authors)
-        # Replace existing footer if present
-        existing_footer_re = re.compile(
-            r'<div class="mt-8 flex items-center gap-3 border-t border-gray-100 pt-6">\s*'
-            r'<img src="[^"]*"[^>]*>\s*'
-            r'<div>\s*'
-            r'<p class="text-sm text-gray-500">Medically reviewed by</p>\s*'
-            r'<p class="text-sm font-medium text-cvc-charcoal">[^<]*<a[^>]*>[^<]*</a>[^<]*</p>\s*'
-            r'</div>\s*'
-            r'</div>',
-            re.DOTALL,
-        )
-        if existing_footer_re.search(text):
-            text = existing_footer_re.sub(new_footer, text, count=1)
-        elif "Medically reviewed by" not in text:
-            anchor = '<div class="mt-12 bg-cvc-cream rounded-2xl p-8">'
-            if anchor in text:
-                text = text.replace(anchor, f"{new_footer}\n      {anchor}", 1)
+    original = file_path.read_text(encoding="utf-8")
+
+    # Schema, byline and review footer live in fenced slots: one pass
+    # replaces all three.
+    contents = article_slots(post, author_slug, authors)
+    text, found = slots.fill(original, contents)
+    missing = {name: body for name, body in contents.items() if name not in found}
+    if missing:
+        text, unplaced = install_slots(text, missing)
+        rel = file_path.relative_to(BASE_DIR)
+        placed = [name for name in missing if name not in unplaced]
+        if placed:
+            print(f"  [SLOTS] {rel}: added {', '.join(placed)}")
+        if unplaced:
+            print(f"  [WARN] {rel}: no place for {', '.join(unplaced)}")
 
     if text != original:
         file_path.write_text(text, encoding="utf-8")
@@ -372,15 +301,15 @@ def generate_ankit_author_page(
     a = authors["ankit-patel"]
 
     # Collect community posts
-    posts = [p for p in manifest if p["slug"] in community_slugs]
+    posts = [p for p in manifest if p.get("slug") in community_slugs]
     posts.sort(key=lambda p: str(p.get("date_published") or ""), reverse=True)
 
     post_cards = ""
     for p in posts:
         safe_path = html.escape(p["path"], quote=True)
-        safe_title = html.escape(_clean_title(p.get("title") or ""))
+        safe_title = html.escape(jsonld.clean_headline(p.get("title") or ""))
         safe_desc = html.escape(p.get("description") or "")
-        date_text = _fmt_date(p.get("date_published"))
+        date_text = bylines.fmt_date(p.get("date_published"))
         post_cards += f"""
           <a href="{safe_path}" class="block rounded-2xl border border-gray-100 bg-white p-6 hover:shadow-md transition-shadow">
             {f'<p class="text-xs text-gray-500 mb-2">{html.escape(date_text)}</p>' if date_text else ''}
@@ -456,7 +385,7 @@ def generate_ankit_author_page(
             person_node,
         ],
     }
-    schema_json = json.dumps(schema_obj, ensure_ascii=False).replace("</", "<\\/")
+    schema_json = jsonld.dumps(schema_obj)
 
     page_html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -562,15 +491,15 @@ def generate_dr_mital_author_page(
     a = authors["dr-mital-patel"]
 
     # Collect medical posts
-    posts = [p for p in manifest if p["slug"] not in community_slugs]
+    posts = [p for p in manifest if p.get("slug") not in community_slugs]
     posts.sort(key=lambda p: str(p.get("date_published") or ""), reverse=True)
 
     post_cards = ""
     for p in posts[:12]:
         safe_path = html.escape(p["path"], quote=True)
-        safe_title = html.escape(_clean_title(p.get("title") or ""))
+        safe_title = html.escape(jsonld.clean_headline(p.get("title") or ""))
         safe_desc = html.escape(p.get("description") or "")
-        date_text = _fmt_date(p.get("date_published"))
+        date_text = bylines.fmt_date(p.get("date_published"))
         post_cards += f"""
           <a href="{safe_path}" class="block rounded-2xl border border-gray-100 bg-white p-6 hover:shadow-md transition-shadow">
             {f'<p class="text-xs text-gray-500 mb-2">{html.escape(date_text)}</p>' if date_text else ''}
@@ -616,7 +545,7 @@ def generate_dr_mital_author_page(
             },
         ],
     }
-    schema_json = json.dumps(schema_obj, ensure_ascii=False).replace("</", "<\\/")
+    schema_json = jsonld.dumps(schema_obj)
 
     # Build credentials HTML
     creds = a.get("credentials", {})
@@ -759,7 +688,7 @@ def enhance_dr_mital_page(
     text = page_path.read_text(encoding="utf-8")
 
     # Collect medical posts for her articles section
-    posts = [p for p in manifest if p["slug"] not in community_slugs]
+    posts = [p for p in manifest if p.get("slug") not in community_slugs]
     posts.sort(key=lambda p: str(p.get("date_published") or ""), reverse=True)
 
     # ---- 1. Update Physician schema (replace if present, add if not) ----
@@ -799,7 +728,7 @@ def enhance_dr_mital_page(
             },
         ],
     }
-    schema_json = json.dumps(schema_obj, ensure_ascii=False).replace("</", "<\\/")
+    schema_json = jsonld.dumps(schema_obj)
     schema_tag = f'  <script type="application/ld+json">{schema_json}</script>\n'
 
     # Remove existing JSON-LD, then insert fresh
@@ -813,9 +742,9 @@ def enhance_dr_mital_page(
         cards_html = ""
         for p in shown:
             safe_path = html.escape(p["path"], quote=True)
-            safe_title = html.escape(_clean_title(p.get("title") or ""))
+            safe_title = html.escape(jsonld.clean_headline(p.get("title") or ""))
             safe_desc = html.escape(p.get("description") or "")
-            date_text = _fmt_date(p.get("date_published"))
+            date_text = bylines.fmt_date(p.get("date_published"))
             cards_html += f"""
             <a href="{safe_path}" class="block rounded-2xl border border-gray-100 bg-white p-6 hover:shadow-md transition-shadow">
               {f'<p class="text-xs text-gray-500 mb-2">{html.escape(date_text)}</p>' if date_text else ''}
@@ -861,24 +790,65 @@ def enhance_dr_mital_page(
 # Main
 # ---------------------------------------------------------------------------
 
+def article_authors(author_slug: str) -> set[str]:
+    """Authors an article embeds: the byline/schema author and, on medical posts, the reviewer."""
+    is_medical = author_slug == bylines.MEDICAL_REVIEWER
+    return {author_slug, bylines.MEDICAL_REVIEWER} if is_medical else {author_slug}
+
+
+def article_key(post: dict[str, Any], author_slug: str) -> str:
+    fields = {name: post.get(name) for name in ARTICLE_FIELDS}
+    return fingerprint(RENDER_VERSION, author_slug, fields)
+
+
+def archive_key(posts: list[dict[str, Any]], *layout: str) -> str:
+    cards = [{name: p.get(name) for name in CARD_FIELDS} for p in posts]
+    return fingerprint(RENDER_VERSION, cards, layout)
+
+
+def rebuild_if_stale(
+    index: DependencyIndex, rel: str, author_slug: str, key: str, build: Callable[[], None]
+) -> None:
+    if index.is_current(rel, [author_slug], key):
+        print(f"  [UP TO DATE] {rel}")
+        return
+    build()
+    index.record(rel, [author_slug], key)
+
+
 def main() -> int:
+    parser = argparse.ArgumentParser(description="Apply E-E-A-T authorship to article and author pages.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore .build-cache/authorship.json and rebuild every page.",
+    )
+    args = parser.parse_args()
+
     print("=== E-E-A-T Authorship Migration ===\n")
 
     authors, community_slugs = load_authors()
-    manifest = load_manifest()
     header, footer = read_layout_blocks()
 
-    print(f"Loaded {len(manifest)} posts from manifest")
     print(f"Community slugs: {len(community_slugs)}")
     print(f"Authors: {', '.join(authors.keys())}\n")
 
+    index = DependencyIndex(authors, enabled=not args.no_cache)
+    for author_slug, pages in index.changed_authors().items():
+        print(f"Author entry changed: {author_slug} ({len(pages)} dependent pages)")
+
     # ---- Step 1: Migrate all article pages ----
     print("--- Migrating article pages ---")
     migrated = 0
     skipped = 0
     missing = 0
+    current = 0
 
-    for post in manifest:
+    # Posts stream from the manifest one at a time; only the (small) manifest
+    # entries are kept, for the author pages and the rewritten manifest.
+    manifest: list[dict[str, Any]] = []
+    for post in iter_manifest():
+        manifest.append(post)
         slug = post.get("slug", "")
         path = post.get("path", "")
         if not path:
@@ -886,37 +856,56 @@ def main() -> int:
 
         author_slug = assign_author(slug, community_slugs)
         file_path = BASE_DIR / path.strip("/") / "index.html"
+        rel = file_path.relative_to(BASE_DIR).as_posix()
+        deps = article_authors(author_slug)
+        key = article_key(post, author_slug)
 
-        if migrate_article(file_path, post, author_slug, authors):
+        if index.is_current(rel, deps, key):
+            current += 1
+        elif migrate_article(file_path, post, author_slug, authors):
             migrated += 1
             print(f"  [OK] {path} → {authors[author_slug]['short_name']}")
         elif file_path.exists():
             skipped += 1
         else:
             missing += 1
+        index.record(rel, deps, key)
 
         # Update manifest entry
         post["author_slug"] = author_slug
         post["content_type"] = "community" if author_slug == "ankit-patel" else "medical"
         post["author"] = authors[author_slug]["name"]
 
-    print(f"\nArticles: migrated={migrated}, unchanged={skipped}, missing={missing}\n")
+    print(
+        f"\nArticles ({len(manifest)} posts in manifest): migrated={migrated}, unchanged={skipped}, "
+        f"up to date={current}, missing={missing}\n"
+    )
 
     # ---- Step 2: Generate author pages ----
+    # Author archives (and the doctor page, step 3) depend on their author's
+    # entry and the posts they list.
+    community = [p for p in manifest if p.get("slug") in community_slugs]
+    medical = [p for p in manifest if p.get("slug") not in community_slugs]
     print("--- Generating author pages ---")
-    generate_ankit_author_page(authors, manifest, community_slugs, header, footer)
-    generate_dr_mital_author_page(authors, manifest, community_slugs, header, footer)
+    rebuild_if_stale(
+        index, "author/ankit-patel/index.html", "ankit-patel", archive_key(community, header, footer),
+        partial(generate_ankit_author_page, authors, manifest, community_slugs, header, footer),
+    )
+    rebuild_if_stale(
+        index, "author/dr-mital-patel/index.html", "dr-mital-patel", archive_key(medical, header, footer),
+        partial(generate_dr_mital_author_page, authors, manifest, community_slugs, header, footer),
+    )
 
-    # ---- Step 3: Enhance Dr. Mital Patel's doctor page ----
     print("\n--- Enhancing Dr. Mital Patel doctor page ---")
-    enhance_dr_mital_page(authors, manifest, community_slugs)
+    rebuild_if_stale(
+        index, "dr-mital-patel-od/index.html", "dr-mital-patel", archive_key(medical),
+        partial(enhance_dr_mital_page, authors, manifest, community_slugs),
+    )
+    index.save()
 
     # ---- Step 4: Write updated manifest ----
-    manifest_path = BASE_DIR / "content" / "wp_blog_posts.json"
-    manifest_path.write_text(
-        json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
-    )
-    print(f"\n--- Updated {manifest_path.relative_to(BASE_DIR)} ---")
+    write_records(MANIFEST_PATH, manifest)
+    print(f"\n--- Updated {MANIFEST_PATH.relative_to(BASE_DIR)} ---")
 
     print("\n=== Migration complete ===")
     return 0
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Run the site QA rules in one pass and write a combined report.
+
+Every page is read and parsed once; all selected rules (sitebuild/checks/)
+run on the parsed page, then the site-level checks run. The combined report
+is written as JSON and Markdown. The go-live, blog-writer and feedback
+scripts each run a single group of the same rules.
+
+Verdicts are cached per page and rule in .build-cache/qa.json, so only pages
+edited since the last run (or whose rules looked up a file that has since
+appeared or disappeared) are re-read; on an unchanged tree the run is fast
+enough for a pre-commit hook. --no-cache re-checks every page.
+
+Exit status is 1 if any error is found (or any warning, with --strict).
+
+Usage:
+    python scripts/run-qa.py
+    python scripts/run-qa.py --groups golive,feedback-2026-02-09
+    python scripts/run-qa.py --list
+    python scripts/run-qa.py --no-cache
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from collections import Counter
+from pathlib import Path
+
+from sitebuild import qa
+from sitebuild.buildcache import CACHE_DIR
+from sitebuild.parallel import add_jobs_argument
+
+DEFAULT_JSON = CACHE_DIR / "qa-report.json"
+DEFAULT_MD = CACHE_DIR / "qa-report.md"
+MAX_LISTED = 30
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run every QA rule in one pass over the site.")
+    parser.add_argument("--groups", help="Comma-separated rule groups to run (default: all).")
+    parser.add_argument("--list", action="store_true", help="List the registered rules and exit.")
+    parser.add_argument("--json-out", default=str(DEFAULT_JSON), help="JSON report path (default: %(default)s).")
+    parser.add_argument("--md-out", default=str(DEFAULT_MD), help="Markdown report path (default: %(default)s).")
+    parser.add_argument("--strict", action="store_true", help="Exit non-zero on warnings as well as errors.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore .build-cache/qa.json and re-check every page.",
+    )
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    group_names = [g.strip() for g in args.groups.split(",") if g.strip()] if args.groups else None
+    rules, checks = qa.select(group_names)
+    if args.list:
+        for r in rules:
+            print(f"{r.group:22} {r.name:34} page  {r.title}")
+        for c in checks:
+            print(f"{c.group:22} {c.name:34} site  {c.title}")
+        return 0
+
+    report = qa.run(rules, checks, jobs=args.jobs, use_cache=not args.no_cache)
+    errors, warnings = report.errors, report.warnings
+    print(
+        f"Checked {len(report.results)} pages ({report.cached} unchanged since last run) "
+        f"with {len(rules)} page rules and {len(checks)} site checks ({report.seconds:.2f}s)"
+    )
+    listed = errors + warnings
+    for f in listed[:MAX_LISTED]:
+        print(f"  [{f.severity.upper()}] {f.rule} {f.page}: {f.message}")
+    if len(listed) > MAX_LISTED:
+        print(f"  ...and {len(listed) - MAX_LISTED} more")
+        print("By rule:")
+        for name, count in Counter(f.rule for f in listed).most_common():
+            print(f"  {count:5} {name}")
+    print(f"Errors: {len(errors)}, warnings: {len(warnings)}")
+
+    for out, text in (
+        (Path(args.json_out), json.dumps(report.as_dict(), ensure_ascii=False, indent=2) + "\n"),
+        (Path(args.md_out), report.to_markdown("QA Report — Classic Vision Care")),
+    ):
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(text, encoding="utf-8")
+        print(f"Report: {out}")
+
+    if errors or (args.strict and warnings):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,13 @@
+"""
+Shared build helpers for the static site scripts.
+
+Scripts in ./scripts are run directly (python3 scripts/<name>.py), which puts
+./scripts on sys.path, so `import sitebuild` works without any install step.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+CANONICAL_ORIGIN = "https://classicvisioncare.com"
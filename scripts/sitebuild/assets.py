@@ -0,0 +1,123 @@
+"""
+Index of the site's static assets.
+
+Every file under images/, styles/, scripts/ and fonts/ plus the root static
+files (favicons, robots.txt, sitemaps, ...) comes from the inventory's
+cached directory walk; each is stat'ed once when the index is built. After
+that, existence, size and content type are dictionary lookups, so QA rules
+can check every <img>, srcset candidate, <script src> and CSS url() on every
+page without touching the filesystem again.
+
+The index is memoized for the life of the process, like the inventory;
+pass refresh=True after a step that creates or deletes assets.
+"""
+
+from __future__ import annotations
+
+import mimetypes
+import os
+import posixpath
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Collection, Iterable, Iterator
+
+from sitebuild import BASE_DIR, inventory
+
+# Suffixes mimetypes does not know on every platform.
+EXTRA_TYPES = {
+    ".avif": "image/avif",
+    ".webp": "image/webp",
+    ".woff": "font/woff",
+    ".woff2": "font/woff2",
+    ".webmanifest": "application/manifest+json",
+}
+
+# Asset types a page can reference; anything else under the asset folders
+# (build scripts, sitemaps, verification files) is not expected to be linked.
+WEB_TYPE_PREFIXES = ("image/", "font/", "text/css", "text/javascript", "application/javascript")
+
+
+@lru_cache(maxsize=None)
+def content_type(rel: str) -> str:
+    suffix = posixpath.splitext(rel)[1].lower()
+    if suffix in EXTRA_TYPES:
+        return EXTRA_TYPES[suffix]
+    guessed, _ = mimetypes.guess_type(rel, strict=False)
+    return guessed or "application/octet-stream"
+
+
+def is_asset_path(rel: str) -> bool:
+    """Whether *rel* lies where the index looks (so a miss means the file does not exist)."""
+    return inventory.classify(rel) == inventory.ASSET
+
+
+@dataclass(frozen=True)
+class Asset:
+    rel: str
+    size: int
+    mtime_ns: int
+
+    @property
+    def content_type(self) -> str:
+        return content_type(self.rel)
+
+    @property
+    def is_web_asset(self) -> bool:
+        return self.content_type.startswith(WEB_TYPE_PREFIXES)
+
+
+class AssetIndex:
+    def __init__(self, assets: Iterable[Asset]) -> None:
+        self._by_rel = {a.rel: a for a in assets}
+
+    def __len__(self) -> int:
+        return len(self._by_rel)
+
+    def __contains__(self, rel: str) -> bool:
+        return rel in self._by_rel
+
+    def __iter__(self) -> Iterator[Asset]:
+        return iter(self._by_rel.values())
+
+    def get(self, rel: str) -> Asset | None:
+        return self._by_rel.get(rel)
+
+    def exists(self, rel: str) -> bool:
+        return rel in self._by_rel
+
+    def size(self, rel: str) -> int | None:
+        asset = self._by_rel.get(rel)
+        return asset.size if asset else None
+
+    def content_type(self, rel: str) -> str | None:
+        return content_type(rel) if rel in self._by_rel else None
+
+    def unreferenced(self, referenced: Collection[str]) -> list[Asset]:
+        """Web assets (images, fonts, stylesheets, scripts) not in *referenced*, by path."""
+        return sorted(
+            (a for a in self._by_rel.values() if a.is_web_asset and a.rel not in referenced),
+            key=lambda a: a.rel,
+        )
+
+
+def _scan(entries: Iterable[inventory.Entry]) -> list[Asset]:
+    assets: list[Asset] = []
+    for e in entries:
+        try:
+            st = os.stat(BASE_DIR / e.rel)
+        except FileNotFoundError:
+            continue
+        assets.append(Asset(e.rel, st.st_size, st.st_mtime_ns))
+    return assets
+
+
+_INDEX: AssetIndex | None = None
+
+
+def load(*, refresh: bool = False) -> AssetIndex:
+    """Return the asset index, built once per process from the inventory."""
+    global _INDEX
+    if _INDEX is not None and not refresh:
+        return _INDEX
+    _INDEX = AssetIndex(_scan(inventory.load(refresh=refresh).files(inventory.ASSET)))
+    return _INDEX
@@ -0,0 +1,76 @@
+"""
+Author -> page dependency index for migrate-authorship.py.
+
+Every page the migration writes (articles, author archives, the doctor
+profile) is recorded in .build-cache/authorship.json together with:
+
+- the authors it embeds, each with a fingerprint of that author's
+  content/authors.json entry as of the build (byline and schema node for the
+  article's author, the review footer's reviewer, the archive's owner);
+- a key over the page's other inputs (post fields, assigned author, layout);
+- the size and mtime of the file it left behind.
+
+A page is current while its key and file are unchanged and every author it
+depends on still has the recorded fingerprint. Editing one author's entry
+therefore invalidates exactly the pages that embed that author, and the
+inverted view (dependents()) reports which pages and archives those are.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping
+
+from sitebuild import BASE_DIR
+from sitebuild.buildcache import FileStamp, JsonCache, fingerprint
+
+CACHE_VERSION = 1
+
+
+class DependencyIndex:
+    def __init__(self, authors: Mapping[str, Any], *, enabled: bool = True) -> None:
+        self.cache = JsonCache("authorship", version=CACHE_VERSION, enabled=enabled)
+        self.entries = self.cache.section("pages")
+        self.authors = {slug: fingerprint(entry) for slug, entry in authors.items() if not slug.startswith("_")}
+        self.seen: set[str] = set()
+
+    def _author_stamps(self, deps: Iterable[str]) -> dict[str, str | None]:
+        return {slug: self.authors.get(slug) for slug in sorted(set(deps))}
+
+    def dependents(self, slug: str) -> list[str]:
+        """Pages recorded as embedding *slug*."""
+        return sorted(rel for rel, entry in self.entries.items() if slug in entry.get("authors", {}))
+
+    def changed_authors(self) -> dict[str, list[str]]:
+        """Authors whose entry changed since their dependents were built -> those pages."""
+        changed: dict[str, list[str]] = {}
+        for rel, entry in sorted(self.entries.items()):
+            for slug, recorded in entry.get("authors", {}).items():
+                if self.authors.get(slug) != recorded:
+                    changed.setdefault(slug, []).append(rel)
+        return changed
+
+    def is_current(self, rel: str, deps: Iterable[str], key: str) -> bool:
+        self.seen.add(rel)
+        entry = self.entries.get(rel)
+        if not entry or entry.get("key") != key or entry.get("authors") != self._author_stamps(deps):
+            return False
+        stamp = FileStamp.of(BASE_DIR / rel)
+        return stamp is not None and [stamp.size, stamp.mtime_ns] == entry.get("stamp")
+
+    def record(self, rel: str, deps: Iterable[str], key: str) -> None:
+        self.seen.add(rel)
+        stamp = FileStamp.of(BASE_DIR / rel)
+        if stamp is None:
+            return
+        self.cache.set(
+            "pages",
+            rel,
+            {"key": key, "authors": self._author_stamps(deps), "stamp": [stamp.size, stamp.mtime_ns]},
+        )
+
+    def save(self) -> None:
+        """Drop pages not seen this run (no longer in the manifest) and write the index."""
+        for rel in [rel for rel in self.entries if rel not in self.seen]:
+            del self.entries[rel]
+            self.cache.dirty = True
+        self.cache.save()
@@ -0,0 +1,98 @@
+"""
+Persistent build cache under ./.build-cache/.
+
+Each cache is a small JSON manifest keyed by page path. The transform engine
+records, per page, the hash of the chain that last ran over it (transform
+names + versions + hashes of the layout partials it copied in) and the hash,
+size and mtime of the file it left behind. On the next run a page whose file
+and chain key are both unchanged is skipped without being transformed or
+written, so a no-op rebuild touches zero files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from sitebuild import BASE_DIR
+
+CACHE_DIR = BASE_DIR / ".build-cache"
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def fingerprint(*parts: object) -> str:
+    """Stable short hash of arbitrary JSON-serializable parts."""
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return sha256_text(payload)[:16]
+
+
+@dataclass(frozen=True)
+class FileStamp:
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def of(cls, path: Path) -> "FileStamp | None":
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return cls(size=st.st_size, mtime_ns=st.st_mtime_ns)
+
+
+class JsonCache:
+    """A versioned JSON manifest stored at .build-cache/<name>.json."""
+
+    def __init__(self, name: str, *, version: int = 1, enabled: bool = True) -> None:
+        self.path = CACHE_DIR / f"{name}.json"
+        self.version = version
+        self.enabled = enabled
+        self.data: dict[str, Any] = {}
+        self.dirty = False
+        if enabled:
+            self.data = self._load()
+
+    def _load(self) -> dict[str, Any]:
+        if not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.version:
+            return {}
+        return data
+
+    def section(self, name: str) -> dict[str, Any]:
+        value = self.data.get(name)
+        if not isinstance(value, dict):
+            value = {}
+            self.data[name] = value
+        return value
+
+    def set(self, section: str, key: str, value: Any) -> None:
+        bucket = self.section(section)
+        if bucket.get(key) != value:
+            bucket[key] = value
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.enabled or not self.dirty:
+            return
+        self.data["version"] = self.version
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(self.data, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+        self.dirty = False
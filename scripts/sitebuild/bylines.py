@@ -0,0 +1,64 @@
+"""
+Author byline and medical review footer markup for article pages.
+
+import-wp-blog.py, generate-live-article-pages.py and migrate-authorship.py
+all render the same two blocks from content/authors.json entries; generated
+pages wrap them in the byline / review slots (sitebuild.slots).
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import html
+from typing import Any
+
+MEDICAL_REVIEWER = "dr-mital-patel"
+
+
+def fmt_date(date_str: str | None) -> str:
+    """'2024-03-05T10:00:00' -> 'March 5, 2024' (UTC); '' if missing or unparseable."""
+    if not date_str:
+        return ""
+    try:
+        parsed = dt.datetime.fromisoformat(str(date_str).replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=dt.timezone.utc)
+        parsed = parsed.astimezone(dt.timezone.utc)
+        return f"{parsed.strftime('%B')} {parsed.day}, {parsed.year}"
+    except Exception:
+        return ""
+
+
+def rich_byline(author: dict[str, Any], date_published: str | None) -> str:
+    date_text = fmt_date(date_published)
+    safe_name = html.escape(author["name"])
+    safe_img = html.escape(author["image"], quote=True)
+    safe_alt = html.escape(author["image_alt"], quote=True)
+    safe_page = html.escape(author["author_page"], quote=True)
+    date_line = f'<p class="text-xs text-gray-500">{html.escape(date_text)}</p>' if date_text else ""
+    return (
+        f'<div class="mt-4 flex items-center gap-3">\n'
+        f'        <img src="{safe_img}" alt="{safe_alt}" '
+        f'class="w-10 h-10 rounded-full object-cover" width="40" height="40" loading="lazy">\n'
+        f"        <div>\n"
+        f'          <p class="text-sm font-medium text-cvc-charcoal">'
+        f'<a href="{safe_page}" class="hover:underline">{safe_name}</a></p>\n'
+        f"          {date_line}\n"
+        f"        </div>\n"
+        f"      </div>"
+    )
+
+
+def medical_review_footer(reviewer: dict[str, Any]) -> str:
+    return (
+        f'<div class="mt-8 flex items-center gap-3 border-t border-gray-100 pt-6">\n'
+        f'        <img src="{reviewer["image"]}" alt="{html.escape(reviewer["image_alt"], quote=True)}" '
+        f'class="w-12 h-12 rounded-full object-cover" width="48" height="48" loading="lazy">\n'
+        f"        <div>\n"
+        f'          <p class="text-sm text-gray-500">Medically reviewed by</p>\n'
+        f'          <p class="text-sm font-medium text-cvc-charcoal">'
+        f'<a href="{reviewer["author_page"]}" class="hover:underline">{html.escape(reviewer["name"])}</a>'
+        f" &middot; Optometrist</p>\n"
+        f"        </div>\n"
+        f"      </div>"
+    )
@@ -0,0 +1,9 @@
+"""
+Built-in QA rules. Importing this package registers them with sitebuild.qa.
+"""
+
+from sitebuild import contentrules
+from sitebuild.checks import assets, blogwriter, feedback, golive, links  # noqa: F401
+
+# Content rules of groups no module above registers (in their own position).
+contentrules.register()
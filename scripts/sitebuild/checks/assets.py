@@ -0,0 +1,105 @@
+"""
+Static asset checks (group "assets").
+
+Every asset reference on a public page (<img>/<source> src and srcset,
+<script src>, <link href>, og:/twitter: and JSON-LD images, CSS url() in
+<style> blocks and style attributes) and every url() in the site's stylesheets must point
+at an existing file. Lookups go through the asset index (sitebuild.assets),
+built once from the inventory, so shared images are never stat'ed twice.
+
+The site check lists images, fonts, stylesheets and scripts that nothing
+references.
+"""
+
+from __future__ import annotations
+
+import posixpath
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+from sitebuild import BASE_DIR, assets, linkgraph
+from sitebuild.qa import ASSET, PUBLIC, WARNING, Link, QaPage, SiteContext, parse_page, rule, site_check
+
+GROUP = "assets"
+
+# Build inputs that are never served by reference.
+UNREFERENCED_EXEMPT = {"styles/tailwind-input.css"}
+
+# (tag, attribute) pairs that load an asset.
+ASSET_REFS = {
+    ("img", "src"),
+    ("img", "srcset"),
+    ("source", "src"),
+    ("source", "srcset"),
+    ("script", "src"),
+    ("script", "ld+json"),
+    ("link", "href"),
+    ("meta", "content"),
+    ("style", "url"),
+}
+
+
+def is_stylesheet(rel: str) -> bool:
+    return rel.endswith(".css")
+
+
+@lru_cache(maxsize=None)
+def _asset_target(folder: str, url: str) -> str | None:
+    path = linkgraph.internal_path(posixpath.join(folder, "index.html"), url)
+    if path is None:
+        return None
+    target = path.lstrip("/")
+    return target if assets.is_asset_path(target) else None
+
+
+def asset_references(rel: str, links: Iterable[Link]) -> Iterator[tuple[Link, str]]:
+    """(link, asset path) for every link on page/stylesheet *rel* that loads a file from the asset folders."""
+    folder = posixpath.dirname(rel)
+    for link in links:
+        if (link.tag, link.attr) not in ASSET_REFS:
+            continue
+        # Only relative URLs depend on where the page is.
+        target = _asset_target("" if link.url.startswith(("/", "http")) else folder, link.url)
+        if target is not None:
+            yield link, target
+
+
+def _label(target: str) -> str:
+    kind = assets.content_type(target)
+    if kind == "text/css":
+        return "stylesheet"
+    if kind.endswith("javascript"):
+        return "script"
+    return kind.split("/", 1)[0] if kind.startswith(("image/", "font/")) else "file"
+
+
+@rule(
+    "assets-missing",
+    group=GROUP,
+    title="Referenced assets exist",
+    kinds=(PUBLIC, ASSET),
+    predicate=lambda rel: rel.endswith(".html") or is_stylesheet(rel),
+)
+def referenced_assets_exist(page: QaPage) -> Iterator[str]:
+    seen: set[str] = set()
+    for link, target in asset_references(page.rel, page.links):
+        if target in seen:
+            continue
+        seen.add(target)
+        if not page.exists(target):
+            yield f"missing {_label(target)}: {link.url}"
+
+
+@site_check("assets-unreferenced", group=GROUP, title="Every asset is used", severity=WARNING, kinds=(PUBLIC,))
+def unreferenced_assets(ctx: SiteContext) -> Iterator[tuple[str, str]]:
+    index = assets.load()
+    referenced: set[str] = set()
+    for rel, result in ctx.results.items():
+        referenced.update(target for _, target in asset_references(rel, result.links))
+    # Stylesheets are usually covered by assets-missing; parse any that were not.
+    for asset in index:
+        if is_stylesheet(asset.rel) and asset.rel not in ctx.results:
+            text = (BASE_DIR / asset.rel).read_text(encoding="utf-8", errors="replace")
+            referenced.update(t for _, t in asset_references(asset.rel, parse_page(asset.rel, ASSET, text).links))
+    for asset in index.unreferenced(referenced | UNREFERENCED_EXEMPT):
+        yield asset.rel, f"not referenced by any page or stylesheet ({asset.content_type}, {asset.size / 1024:.0f} KB)"
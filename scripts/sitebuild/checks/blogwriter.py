@@ -0,0 +1,75 @@
+"""
+Blog-writer checks (group "blog-writer") for the pages in
+content/page_manifest.json, reported by blog-writer-qa.py.
+
+Structure (title, meta description, <h1>, hero value points, a book/call
+CTA), banned filler phrases (declared in content/qa_content_rules.json), and
+local images that do not exist.
+"""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from typing import Callable, Iterator
+
+from sitebuild import BASE_DIR, contentrules
+from sitebuild.qa import PUBLIC, SOURCE, PageRuleFunc, QaPage, rule
+
+GROUP = "blog-writer"
+MANIFEST_PATH = BASE_DIR / "content" / "page_manifest.json"
+
+
+@lru_cache(maxsize=None)
+def manifest_pages() -> frozenset[str]:
+    if not MANIFEST_PATH.exists():
+        return frozenset()
+    return frozenset(json.loads(MANIFEST_PATH.read_text(encoding="utf-8", errors="ignore")))
+
+
+def _blog_rule(name: str, title: str) -> Callable[[PageRuleFunc], PageRuleFunc]:
+    return rule(name, group=GROUP, title=title, kinds=(PUBLIC, SOURCE), pages=manifest_pages)
+
+
+@_blog_rule("blog-title", "Title present")
+def title_present(page: QaPage) -> Iterator[str]:
+    if not page.title:
+        yield "Missing <title>"
+
+
+@_blog_rule("blog-meta-description", "Meta description present")
+def meta_description_present(page: QaPage) -> Iterator[str]:
+    if not page.meta_description:
+        yield "Missing meta description"
+
+
+@_blog_rule("blog-h1", "H1 present")
+def h1_present(page: QaPage) -> Iterator[str]:
+    if not page.h1_count:
+        yield "Missing <h1>"
+
+
+@_blog_rule("blog-hero-points", "Hero value points")
+def hero_points_present(page: QaPage) -> Iterator[str]:
+    if "Hero value points" not in page.text:
+        yield "Missing hero value points block"
+
+
+@_blog_rule("blog-cta", "CTA present")
+def cta_present(page: QaPage) -> Iterator[str]:
+    if "pages/patients/book.html" not in page.text and 'href="tel:' not in page.text:
+        yield "Missing clear CTA (book or call)"
+
+
+# Banned filler phrases: content/qa_content_rules.json.
+contentrules.register(GROUP)
+
+
+@_blog_rule("blog-local-images", "Local images exist")
+def local_images_exist(page: QaPage) -> Iterator[str]:
+    for link in page.links:
+        if link.tag != "img" or link.attr != "src":
+            continue
+        target = page.local_target(link.url)
+        if target is not None and not page.exists(target):
+            yield f"Missing image: {link.url.split('#', 1)[0].split('?', 1)[0]}"
@@ -0,0 +1,60 @@
+"""
+Targeted checks for the fixes requested in website_feedback.pdf (2026-02-09),
+group "feedback-2026-02-09", reported by verify-feedback-2026-02-09.py.
+
+Intentionally narrow: only the pages/strings mentioned in the feedback email
+and PDF, so the checks stay stable as the site grows. The page text checks
+are declared in content/qa_content_rules.json (sitebuild.contentrules); the
+redirect and sitemap checks are here.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Iterator
+
+from sitebuild import BASE_DIR, contentrules
+from sitebuild.qa import SiteContext, site_check
+
+GROUP = "feedback-2026-02-09"
+
+
+# The per-page text checks live in content/qa_content_rules.json.
+contentrules.register(GROUP)
+
+# Legacy MiBoFlo URLs should redirect to Radio Frequency, and the sitemap
+# should not list them.
+LEGACY_REDIRECTS = [
+    ("/dry-eye-treatment-miboflo/", "/dry-eye-treatment-radio-frequency/"),
+    ("/dry-eyes/what-is-mibo-thermoflo/", "/dry-eye-treatment-radio-frequency/"),
+]
+
+
+def has_redirect(vercel_config: object, source: str, destination: str) -> bool:
+    if not isinstance(vercel_config, dict):
+        return False
+    redirects = vercel_config.get("redirects")
+    if not isinstance(redirects, list):
+        return False
+    return any(
+        isinstance(r, dict) and r.get("source") == source and r.get("destination") == destination for r in redirects
+    )
+
+
+@site_check("feedback-legacy-redirects", group=GROUP, title="Legacy MiBoFlo URLs redirect to Radio Frequency")
+def legacy_redirects(ctx: SiteContext) -> Iterator[tuple[str, str]]:
+    vercel = json.loads((BASE_DIR / "vercel.json").read_text(encoding="utf-8", errors="replace"))
+    for source, destination in LEGACY_REDIRECTS:
+        if not has_redirect(vercel, source, destination):
+            yield "vercel.json", f"missing redirect {source} -> {destination}"
+
+
+@site_check("feedback-sitemap-legacy-urls", group=GROUP, title="Sitemap excludes redirected legacy URLs")
+def sitemap_excludes_legacy(ctx: SiteContext) -> Iterator[tuple[str, str]]:
+    # sitemap.xml is an index; page URLs live in the ./sitemaps shards.
+    sitemap = (BASE_DIR / "sitemap.xml").read_text(encoding="utf-8", errors="replace") + "".join(
+        fp.read_text(encoding="utf-8", errors="replace") for fp in sorted((BASE_DIR / "sitemaps").glob("*.xml"))
+    )
+    for source, _ in LEGACY_REDIRECTS:
+        if source in sitemap:
+            yield "sitemap.xml", f"contains legacy URL {source} (should be excluded)"
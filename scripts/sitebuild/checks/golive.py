@@ -0,0 +1,119 @@
+"""
+Go-live checks (group "golive"), reported by generate-go-live-qa-report.py.
+
+- sitemap, robots + contact APIs and favicon present
+- top GSC URLs exist as local files (or are vercel.json redirect sources)
+- redirect destinations exist and the minimal redirects are in vercel.json
+- canonical tag present on public pages
+- no lingering /pages/... internal links on public pages
+
+The GSC/redirect CSVs live in the analysis folder next to the site checkout.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import re
+from pathlib import Path
+from typing import Any, Iterator
+
+from sitebuild import BASE_DIR
+from sitebuild.qa import QaPage, SiteContext, rule, site_check
+
+GROUP = "golive"
+
+COMPARISONS_DIR = Path("/mnt/d_drive/repos/cvc_site_comparisons")
+DATA_DIR = COMPARISONS_DIR / "cvc_analysis" / "data"
+TOP60_CSV = DATA_DIR / "launch_url_plan_gsc12m_top60.csv"
+REDIRECTS_CSV = DATA_DIR / "redirects_minimal.csv"
+VERCEL_JSON = BASE_DIR / "vercel.json"
+
+# (check name, title, file) for files that must exist at go-live.
+CORE_FILES = [
+    ("golive-sitemap", "sitemap.xml present", "sitemap.xml"),
+    ("golive-robots-api", "robots API present", "api/robots.js"),
+    ("golive-contact-api", "contact API present", "api/contact.js"),
+    ("golive-favicon", "favicon.ico present", "favicon.ico"),
+]
+
+PAGES_LINK_RE = re.compile(r"^(?:\./|\.\./)*pages/", re.IGNORECASE)
+
+
+def path_to_file(site_path: str) -> Path:
+    if not site_path.startswith("/"):
+        site_path = "/" + site_path
+    if site_path == "/":
+        return BASE_DIR / "index.html"
+    return BASE_DIR / site_path.lstrip("/") / "index.html"
+
+
+def read_csv_rows(path: Path) -> list[dict[str, str]]:
+    with path.open("r", encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def load_vercel_redirects() -> list[dict[str, Any]]:
+    if not VERCEL_JSON.exists():
+        return []
+    cfg = json.loads(VERCEL_JSON.read_text(encoding="utf-8"))
+    return [r for r in cfg.get("redirects", []) if isinstance(r, dict)]
+
+
+def _register_core_file(name: str, title: str, rel: str) -> None:
+    def check(ctx: SiteContext) -> Iterator[tuple[str, str]]:
+        if not (BASE_DIR / rel).exists():
+            yield rel, f"Missing {rel}"
+
+    site_check(name, group=GROUP, title=title)(check)
+
+
+for _name, _title, _rel in CORE_FILES:
+    _register_core_file(_name, _title, _rel)
+
+
+@site_check("golive-top60-urls", group=GROUP, title="Top60 URLs exist")
+def top60_urls_exist(ctx: SiteContext) -> Iterator[tuple[str, str]]:
+    redirect_sources = {
+        r["source"] for r in load_vercel_redirects() if isinstance(r.get("source"), str) and r["source"].startswith("/")
+    }
+    for row in read_csv_rows(TOP60_CSV):
+        p = row.get("current_path") or ""
+        # Acceptable if this path is a 301 source in vercel.json
+        if p and not path_to_file(p).exists() and p not in redirect_sources:
+            yield TOP60_CSV.name, p
+
+
+@site_check("golive-redirect-destinations", group=GROUP, title="Redirect destinations exist")
+def redirect_destinations_exist(ctx: SiteContext) -> Iterator[tuple[str, str]]:
+    for row in read_csv_rows(REDIRECTS_CSV):
+        dest = row.get("to_path") or ""
+        if dest.startswith("/") and not path_to_file(dest).exists():
+            yield REDIRECTS_CSV.name, dest
+
+
+@site_check("golive-minimal-redirects", group=GROUP, title="Minimal redirects implemented")
+def minimal_redirects_present(ctx: SiteContext) -> Iterator[tuple[str, str]]:
+    if not VERCEL_JSON.exists():
+        yield "vercel.json", "Missing vercel.json"
+        return
+    redirect_pairs = {(r.get("source"), r.get("destination")) for r in load_vercel_redirects()}
+    for row in read_csv_rows(REDIRECTS_CSV):
+        src = row.get("from_path") or ""
+        dest = row.get("to_path") or ""
+        if (src, dest) not in redirect_pairs:
+            yield "vercel.json", f"{src} -> {dest}"
+
+
+@rule("golive-canonical", group=GROUP, title="Canonical tag on public pages")
+def canonical_present(page: QaPage) -> Iterator[str]:
+    if page.canonical is None:
+        yield "missing canonical tag"
+
+
+@rule("golive-no-pages-links", group=GROUP, title="No /pages links on public pages")
+def no_pages_links(page: QaPage) -> Iterator[str]:
+    for link in page.links:
+        if link.attr == "href" and PAGES_LINK_RE.match(link.url):
+            yield f"links to {link.url}"
+            return
@@ -0,0 +1,99 @@
+"""
+Internal link checks (group "links"), reported by validate-links.py.
+
+Built on the site link graph (sitebuild.linkgraph) over every public page:
+
+- links that resolve to no page, file or redirect (or into a redirect loop)
+- links that go through a vercel.json redirect instead of the final URL
+- vercel.json redirects that chain, loop or lead nowhere
+- pages a vercel.json redirect makes unreachable
+- public pages no other page links to
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, Mapping
+
+from sitebuild import inventory, linkgraph
+from sitebuild.qa import PUBLIC, WARNING, PageResult, QaReport, SiteContext, site_check
+
+GROUP = "links"
+GRAPH_KEY = "links.graph"
+
+# Entry points that are reached without an internal link.
+ORPHAN_EXEMPT = {"index.html", "404.html"}
+
+
+def site_graph(results: Mapping[str, PageResult]) -> tuple[linkgraph.LinkGraph, linkgraph.Resolver]:
+    resolver = linkgraph.Resolver(inventory.load(), linkgraph.RedirectTable.load())
+    pages = {rel: result.links for rel, result in results.items() if result.kind == PUBLIC}
+    return linkgraph.build(pages, resolver), resolver
+
+
+def _graph(ctx: SiteContext) -> tuple[linkgraph.LinkGraph, linkgraph.Resolver]:
+    return ctx.get(GRAPH_KEY, lambda: site_graph(ctx.results))
+
+
+def report_graph(report: QaReport) -> linkgraph.LinkGraph:
+    """The graph the checks of a finished run used (built now if none of them ran)."""
+    graph, _ = report.shared.get(GRAPH_KEY) or site_graph(report.results)
+    return graph
+
+
+def _via(resolution: linkgraph.Resolution) -> str:
+    return " -> ".join(resolution.hops)
+
+
+def _final(resolution: linkgraph.Resolution) -> str:
+    if resolution.kind == linkgraph.PAGE:
+        return f"/{resolution.target}".removesuffix("index.html")
+    if resolution.kind == linkgraph.FILE:
+        return f"/{resolution.target}"
+    return resolution.target
+
+
+@site_check("links-broken", group=GROUP, title="Internal links resolve", kinds=(PUBLIC,))
+def broken_links(ctx: SiteContext) -> Iterator[tuple[str, str]]:
+    graph, _ = _graph(ctx)
+    for rel, edge in graph.broken():
+        if edge.resolution.kind == linkgraph.LOOP:
+            yield rel, f"redirect loop: {edge.url} ({_via(edge.resolution)})"
+        else:
+            yield rel, f"broken link: {edge.url}"
+
+
+@site_check(
+    "links-via-redirect", group=GROUP, title="Internal links skip redirects", severity=WARNING, kinds=(PUBLIC,)
+)
+def links_via_redirect(ctx: SiteContext) -> Iterator[tuple[str, str]]:
+    graph, _ = _graph(ctx)
+    for rel, edge in graph.redirected():
+        yield rel, f"{edge.url} redirects to {_final(edge.resolution)} ({len(edge.resolution.hops)} hop(s))"
+
+
+@site_check("links-redirect-chains", group=GROUP, title="Redirects land in one hop", kinds=(PUBLIC,))
+def redirect_chains(ctx: SiteContext) -> Iterator[tuple[str, str]]:
+    _, resolver = _graph(ctx)
+    for redirect, resolution in linkgraph.chains(resolver):
+        if resolution.kind == linkgraph.LOOP:
+            yield "vercel.json", f"redirect loop: {_via(resolution)}"
+        elif resolution.kind == linkgraph.BROKEN:
+            yield "vercel.json", f"{redirect.source} -> {redirect.destination}: destination does not resolve"
+        else:
+            yield "vercel.json", f"redirect chain: {_via(resolution)} -> {_final(resolution)}"
+
+
+@site_check(
+    "links-shadowed-pages", group=GROUP, title="No page hidden behind a redirect", severity=WARNING, kinds=(PUBLIC,)
+)
+def shadowed_pages(ctx: SiteContext) -> Iterator[tuple[str, str]]:
+    _, resolver = _graph(ctx)
+    for redirect, rel in linkgraph.shadowed(resolver):
+        yield rel, f"unreachable: vercel.json redirects {redirect.source} to {redirect.destination}"
+
+
+@site_check("links-orphans", group=GROUP, title="Every page is linked", severity=WARNING, kinds=(PUBLIC,))
+def orphan_pages(ctx: SiteContext) -> Iterator[tuple[str, str]]:
+    graph, _ = _graph(ctx)
+    for rel in graph.orphans(ORPHAN_EXEMPT):
+        yield rel, "no internal links point to this page"
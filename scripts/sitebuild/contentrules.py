@@ -0,0 +1,428 @@
+"""
+Declarative content checks, compiled into one matcher per page class.
+
+content/qa_content_rules.json lists text rules: for a set of pages (an
+explicit list, or every page of a JSON manifest such as
+content/page_manifest.json), strings and regexes that must ("require") or
+must not ("forbid") appear. Each rule registers as an ordinary QA rule in
+its group, so reports, "missing file" findings and the per-page cache work
+as for rules written in Python; the data file is part of every content
+rule's cache key. The feedback fixes and the blog-writer banned phrases live
+there, and a new compliance phrase or banned device name is a data edit.
+
+Rules are not run one by one. The content rules that apply to a page (its
+page class) are compiled once into a Matcher, and each page is scanned once
+for all of them:
+
+- literal terms go into one Aho-Corasick automaton over the lowercased
+  text; case-sensitive and whole-word terms are confirmed at each hit.
+  Below AC_MIN_LITERALS literals, one `in` scan per literal (C speed) is
+  faster than a pass of the pure-Python automaton, so small classes use
+  those instead;
+- regex terms are joined into one alternation (flags scoped per term). At
+  each match every remaining term is tried at that position and the ones
+  that match are retired, so an earlier alternative never hides a later one.
+
+Term keys (exactly one of the first four per term):
+
+    require / forbid                  literal, or list of alternatives
+    require_pattern / forbid_pattern  regex, or list of alternatives
+    ignore_case, word                 case-insensitive; whole words only (literals)
+    label, message                    message template; {text} is the first
+                                      alternative, {label} the label (default: text)
+
+A rule-level "message" applies to every term of the rule; "note" is for
+the reader and ignored. Regexes may not use named groups or backreferences,
+since a page class joins them into one alternation; the loader rejects them.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Sequence
+
+from sitebuild import BASE_DIR
+from sitebuild.qa import ERROR, PUBLIC, RULES, QaPage, rule
+
+RULES_PATH = BASE_DIR / "content" / "qa_content_rules.json"
+SCAN_KEY = "contentrules.scan"
+
+# One pass of the pure-Python automaton over a typical page (~75K chars)
+# costs about as much as 200 `in` scans; below that, scan per literal.
+AC_MIN_LITERALS = 200
+
+REQUIRE = "require"
+FORBID = "forbid"
+REQUIRE_PATTERN = "require_pattern"
+FORBID_PATTERN = "forbid_pattern"
+# Numbered backreferences and conditionals (named groups show in groupindex).
+# Group numbers and names do not survive joining terms into one alternation.
+_GROUP_REF_RE = re.compile(r"(?<!\\)(?:\\\\)*\\[1-9]|\(\?\(")
+
+DEFAULT_MESSAGES = {
+    REQUIRE: "missing required text: {text!r}",
+    FORBID: "contains forbidden text: {text!r}",
+    REQUIRE_PATTERN: "missing required pattern: {text!r}",
+    FORBID_PATTERN: "contains forbidden pattern: {text!r}",
+}
+
+
+# ---------------------------------------------------------------------------
+# Rules
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Term:
+    mode: str  # REQUIRE, FORBID, REQUIRE_PATTERN or FORBID_PATTERN
+    texts: tuple[str, ...]  # alternatives; the term is present if any is
+    ignore_case: bool = False
+    word: bool = False
+    label: str = ""
+    message: str = ""
+
+    @property
+    def is_pattern(self) -> bool:
+        return self.mode in (REQUIRE_PATTERN, FORBID_PATTERN)
+
+    @property
+    def required(self) -> bool:
+        return self.mode in (REQUIRE, REQUIRE_PATTERN)
+
+    def describe(self) -> str:
+        text = self.texts[0]
+        return (self.message or DEFAULT_MESSAGES[self.mode]).format(text=text, label=self.label or text)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], message: str = "") -> "Term":
+        modes = [mode for mode in DEFAULT_MESSAGES if mode in data]
+        if len(modes) != 1:
+            raise ValueError(f"term needs exactly one of {', '.join(DEFAULT_MESSAGES)}: {dict(data)!r}")
+        mode = modes[0]
+        value = data[mode]
+        texts = (value,) if isinstance(value, str) else tuple(value)
+        if not texts or not all(isinstance(t, str) and t for t in texts):
+            raise ValueError(f"{mode} needs a non-empty string or list of strings: {value!r}")
+        term = cls(
+            mode,
+            texts,
+            bool(data.get("ignore_case", False)),
+            bool(data.get("word", False)),
+            str(data.get("label", "")),
+            str(data.get("message", message)),
+        )
+        if term.is_pattern:
+            try:
+                compiled = re.compile(_term_regex(term))
+            except re.error as exc:
+                raise ValueError(f"bad regex {value!r}: {exc}") from None
+            if compiled.groupindex or any(_GROUP_REF_RE.search(t) for t in texts):
+                raise ValueError(f"named groups and backreferences are not supported: {value!r}")
+        return term
+
+
+@dataclass(frozen=True)
+class ContentRule:
+    name: str
+    group: str
+    title: str
+    terms: tuple[Term, ...]
+    kinds: tuple[str, ...] = (PUBLIC,)
+    pages: frozenset[str] | None = None  # explicit page list
+    pages_from: str | None = None  # or: the keys of this JSON file (repo-relative)
+    severity: str = ERROR
+
+    def page_set(self) -> frozenset[str]:
+        return listed_pages(self.pages_from) if self.pages_from else self.pages or frozenset()
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ContentRule":
+        for key in ("name", "group", "title", "terms"):
+            if not data.get(key):
+                raise ValueError(f"missing {key!r}")
+        message = str(data.get("message", ""))
+        pages = data.get("pages")
+        return cls(
+            name=str(data["name"]),
+            group=str(data["group"]),
+            title=str(data["title"]),
+            terms=tuple(Term.from_dict(t, message) for t in data["terms"]),
+            kinds=tuple(data.get("kinds", (PUBLIC,))),
+            pages=None if pages is None else frozenset(pages),
+            pages_from=data.get("pages_from"),
+            severity=str(data.get("severity", ERROR)),
+        )
+
+
+@lru_cache(maxsize=None)
+def listed_pages(rel: str) -> frozenset[str]:
+    """Pages named by a JSON file: the keys of an object or the items of a list."""
+    path = BASE_DIR / rel
+    if not path.exists():
+        return frozenset()
+    return frozenset(json.loads(path.read_text(encoding="utf-8", errors="ignore")))
+
+
+@lru_cache(maxsize=None)
+def load(path: Path = RULES_PATH) -> dict[str, ContentRule]:
+    """Content rules by name, in file order."""
+    if not path.exists():
+        return {}
+    where = path.relative_to(BASE_DIR) if path.is_relative_to(BASE_DIR) else path
+    rules: dict[str, ContentRule] = {}
+    for i, data in enumerate(json.loads(path.read_text(encoding="utf-8")).get("rules", [])):
+        try:
+            content_rule = ContentRule.from_dict(data)
+        except (ValueError, TypeError) as exc:
+            raise SystemExit(f"{where}: rule {data.get('name') or i}: {exc}") from None
+        if content_rule.name in rules:
+            raise SystemExit(f"{where}: duplicate rule {content_rule.name}")
+        rules[content_rule.name] = content_rule
+    # Page classes join their regex terms into one alternation; make sure any can be.
+    try:
+        re.compile("|".join(_term_regex(t) for r in rules.values() for t in r.terms if t.is_pattern))
+    except re.error as exc:
+        raise SystemExit(f"{where}: regex terms cannot be combined: {exc}") from None
+    return rules
+
+
+# ---------------------------------------------------------------------------
+# Matching
+# ---------------------------------------------------------------------------
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _whole_word(text: str, start: int, end: int) -> bool:
+    return (start == 0 or not _is_word_char(text[start - 1])) and (end == len(text) or not _is_word_char(text[end]))
+
+
+def _fold(text: str) -> str:
+    """text.lower(), one character for one, so offsets still line up with *text*."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # e.g. "İ" lowercases to "i" + a combining dot; keep the "i", as re.IGNORECASE does.
+    return "".join(ch.lower()[0] for ch in text)
+
+
+def _find(text: str, haystack: str, needle: str, word: bool) -> bool:
+    """Whether *needle* occurs in *haystack* (*text* or its fold); word boundaries are read from *text*."""
+    if not word:
+        return needle in haystack
+    start = haystack.find(needle)
+    while start != -1:
+        if _whole_word(text, start, start + len(needle)):
+            return True
+        start = haystack.find(needle, start + 1)
+    return False
+
+
+def _term_regex(term: Term) -> str:
+    body = "|".join(f"(?:{t})" for t in term.texts)
+    return f"(?i:{body})" if term.ignore_case else f"(?:{body})"
+
+
+class Automaton:
+    """Aho-Corasick automaton over a set of keys, flattened so each character is one dict lookup."""
+
+    def __init__(self, keys: Sequence[str]) -> None:
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[tuple[int, ...]] = [()]
+        for i, key in enumerate(keys):
+            state = 0
+            for ch in key:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = goto[state][ch] = len(goto)
+                    goto.append({})
+                    outputs.append(())
+                state = nxt
+            outputs[state] += (i,)
+
+        # Breadth-first, so a state's fallback is complete before the state.
+        fail = [0] * len(goto)
+        delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            outputs[state] += outputs[fail[state]]
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                queue.append(nxt)
+        self._delta = delta
+        self._outputs = outputs
+
+    def hits(self, text: str) -> Iterator[tuple[int, int]]:
+        """(end offset, key index) for every occurrence of every key."""
+        delta, outputs = self._delta, self._outputs
+        state = 0
+        for end, ch in enumerate(text, 1):
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                for key in outputs[state]:
+                    yield end, key
+
+
+@dataclass(frozen=True)
+class _Literal:
+    term: int  # index into Matcher.terms
+    text: str
+    ignore_case: bool
+    word: bool
+
+    @property
+    def key(self) -> str:
+        return _fold(self.text) if self.ignore_case else self.text
+
+
+class Matcher:
+    """Every term of a page class, compiled for one scan of the page."""
+
+    def __init__(self, terms: Sequence[Term], *, ac_min_literals: int = AC_MIN_LITERALS) -> None:
+        self.terms = tuple(terms)
+        self._literals = [
+            _Literal(i, text, term.ignore_case, term.word)
+            for i, term in enumerate(self.terms)
+            if not term.is_pattern
+            for text in term.texts
+        ]
+        self._any_ignore_case = any(lit.ignore_case for lit in self._literals)
+        self._automaton: Automaton | None = None
+        self._by_key: list[list[_Literal]] = []
+        if len(self._literals) >= ac_min_literals:
+            by_key: dict[str, list[_Literal]] = {}
+            for lit in self._literals:
+                by_key.setdefault(_fold(lit.text), []).append(lit)
+            self._automaton = Automaton(list(by_key))
+            self._by_key = list(by_key.values())
+        self._patterns = {i: re.compile(_term_regex(term)) for i, term in enumerate(self.terms) if term.is_pattern}
+        self._combined: dict[tuple[int, ...], re.Pattern[str]] = {}
+
+    def scan(self, text: str) -> set[int]:
+        """Indices of the terms present in *text*."""
+        found: set[int] = set()
+        if self._literals:
+            lowered = _fold(text) if self._any_ignore_case or self._automaton else text
+            if self._automaton is not None:
+                self._scan_automaton(text, lowered, found)
+            else:
+                self._scan_literals(text, lowered, found)
+        if self._patterns:
+            self._scan_patterns(text, found)
+        return found
+
+    def _scan_literals(self, text: str, lowered: str, found: set[int]) -> None:
+        for lit in self._literals:
+            if lit.term not in found and _find(text, lowered if lit.ignore_case else text, lit.key, lit.word):
+                found.add(lit.term)
+
+    def _scan_automaton(self, text: str, lowered: str, found: set[int]) -> None:
+        assert self._automaton is not None
+        for end, key in self._automaton.hits(lowered):
+            for lit in self._by_key[key]:
+                if lit.term in found:
+                    continue
+                start = end - len(lit.text)
+                if not lit.ignore_case and text[start:end] != lit.text:
+                    continue
+                if lit.word and not _whole_word(text, start, end):
+                    continue
+                found.add(lit.term)
+
+    def _alternation(self, remaining: tuple[int, ...]) -> re.Pattern[str]:
+        if len(remaining) == 1:
+            return self._patterns[remaining[0]]
+        combined = self._combined.get(remaining)
+        if combined is None:
+            combined = self._combined[remaining] = re.compile(
+                "|".join(_term_regex(self.terms[i]) for i in remaining)
+            )
+        return combined
+
+    def _scan_patterns(self, text: str, found: set[int]) -> None:
+        remaining = tuple(self._patterns)
+        pos = 0
+        while remaining:
+            m = self._alternation(remaining).search(text, pos)
+            if m is None:
+                break
+            at = m.start()
+            hit = {i for i in remaining if self._patterns[i].match(text, at)}
+            found |= hit
+            remaining = tuple(i for i in remaining if i not in hit)
+            pos = at + 1
+
+
+@dataclass(frozen=True)
+class CompiledClass:
+    matcher: Matcher
+    offsets: dict[str, int]  # rule name -> index of its first term
+
+
+@lru_cache(maxsize=None)
+def compile_class(names: tuple[str, ...]) -> CompiledClass:
+    rules = load()
+    terms: list[Term] = []
+    offsets: dict[str, int] = {}
+    for name in names:
+        offsets[name] = len(terms)
+        terms.extend(rules[name].terms)
+    return CompiledClass(Matcher(terms), offsets)
+
+
+def page_class(page: QaPage) -> tuple[str, ...]:
+    """Names of the registered content rules that apply to *page*."""
+    return tuple(
+        name for name in load() if name in RULES and RULES[name].applies_to(page.rel, page.kind)
+    )
+
+
+def scan(page: QaPage) -> tuple[CompiledClass, set[int]]:
+    """One scan of *page* for every content rule of its class, shared by those rules."""
+
+    def build() -> tuple[CompiledClass, set[int]]:
+        compiled = compile_class(page_class(page))
+        return compiled, compiled.matcher.scan(page.text)
+
+    return page.get(SCAN_KEY, build)
+
+
+# ---------------------------------------------------------------------------
+# Registration
+# ---------------------------------------------------------------------------
+
+
+def _register(content_rule: ContentRule) -> None:
+    def page_rule(page: QaPage) -> Iterator[str]:
+        compiled, found = scan(page)
+        first = compiled.offsets[content_rule.name]
+        for i, term in enumerate(content_rule.terms, first):
+            if (i in found) != term.required:
+                yield term.describe()
+
+    has_pages = content_rule.pages is not None or content_rule.pages_from is not None
+    rule(
+        content_rule.name,
+        group=content_rule.group,
+        title=content_rule.title,
+        kinds=content_rule.kinds,
+        pages=content_rule.page_set if has_pages else None,
+        severity=content_rule.severity,
+        inputs=(RULES_PATH.relative_to(BASE_DIR).as_posix(),),
+    )(page_rule)
+
+
+def register(group: str | None = None) -> None:
+    """Register the content rules of *group* (every group when None) not registered yet, in file order."""
+    for content_rule in load().values():
+        if content_rule.name not in RULES and (group is None or content_rule.group == group):
+            _register(content_rule)
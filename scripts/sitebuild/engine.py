@@ -0,0 +1,369 @@
+"""
+Single-pass transform engine for the static site.
+
+Each HTML page is read once, run through a chain of registered transforms in
+memory, and written back only if the final text differs from what was read.
+The per-concern maintenance scripts (sync-nav.py, add-gtm.py, ...) are thin
+wrappers that run one transform; scripts/sync-all.py runs the whole chain.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Callable, Iterable
+
+from sitebuild import BASE_DIR, inventory
+from sitebuild.buildcache import FileStamp, JsonCache, fingerprint, sha256_text
+from sitebuild.parallel import add_jobs_argument, map_ordered
+
+# Page kinds (see sitebuild.inventory)
+PUBLIC = inventory.PUBLIC  # clean-route output: /<route>/index.html and root *.html
+SOURCE = inventory.SOURCE  # build-source pages under ./pages (not served)
+
+LAYOUT_SOURCE = "index.html"
+
+NAV_RE = re.compile(r"(<!-- Top Phone Bar -->.*?</header>)", re.DOTALL)
+FOOTER_RE = re.compile(
+    r"(<!-- Footer -->.*?<script\b[^>]*\bsrc=[\"']/scripts/editorial-forest\.js[\"'][^>]*></script>)",
+    re.DOTALL,
+)
+
+
+@dataclass
+class Page:
+    path: Path
+    rel: str
+    kind: str
+    notes: list[str] = field(default_factory=list)
+
+    @property
+    def is_layout_source(self) -> bool:
+        return self.rel == LAYOUT_SOURCE
+
+
+@dataclass
+class BuildContext:
+    """Shared, lazily-computed inputs for transforms (e.g. layout blocks)."""
+
+    layout_text: str | None = None
+    _blocks: dict[str, str | None] = field(default_factory=dict)
+
+    def set_layout_text(self, text: str) -> None:
+        self.layout_text = text
+        self._blocks.clear()
+
+    def _layout(self) -> str:
+        if self.layout_text is None:
+            self.layout_text = (BASE_DIR / LAYOUT_SOURCE).read_text(encoding="utf-8")
+        return self.layout_text
+
+    def layout_block(self, name: str) -> str | None:
+        """Return the `nav` or `footer` block extracted from index.html."""
+        if name not in self._blocks:
+            pattern = {"nav": NAV_RE, "footer": FOOTER_RE}[name]
+            match = pattern.search(self._layout())
+            self._blocks[name] = match.group(1) if match else None
+        return self._blocks[name]
+
+    def block_hash(self, name: str) -> str:
+        return sha256_text(self.layout_block(name) or "")[:16]
+
+    def require_layout_blocks(self, chain: list["Transform"]) -> None:
+        for transform in chain:
+            for name in transform.requires:
+                if not self.layout_block(name):
+                    raise SystemExit(f"ERROR: Could not extract {name} block from {LAYOUT_SOURCE}")
+
+
+TransformFunc = Callable[[str, Page, BuildContext], str]
+
+
+@dataclass(frozen=True)
+class Transform:
+    name: str
+    func: TransformFunc
+    kinds: frozenset[str]
+    skip_layout_source: bool = False
+    predicate: Callable[[Page], bool] | None = None
+    requires: tuple[str, ...] = ()
+    version: int = 1
+
+    def applies_to(self, page: Page) -> bool:
+        if page.kind not in self.kinds:
+            return False
+        if self.skip_layout_source and page.is_layout_source:
+            return False
+        if self.predicate is not None and not self.predicate(page):
+            return False
+        return True
+
+
+TRANSFORMS: dict[str, Transform] = {}
+
+# Chain order for a full refresh. Layout sync runs first so later transforms
+# see the final nav/footer markup.
+DEFAULT_CHAIN = ("nav", "footer", "links", "tailwind", "theme", "gtm", "canonical")
+
+
+def register(
+    name: str,
+    *,
+    kinds: Iterable[str] = (PUBLIC,),
+    skip_layout_source: bool = False,
+    predicate: Callable[[Page], bool] | None = None,
+    requires: Iterable[str] = (),
+    version: int = 1,
+) -> Callable[[TransformFunc], TransformFunc]:
+    def decorator(func: TransformFunc) -> TransformFunc:
+        TRANSFORMS[name] = Transform(
+            name=name,
+            func=func,
+            kinds=frozenset(kinds),
+            skip_layout_source=skip_layout_source,
+            predicate=predicate,
+            requires=tuple(requires),
+            version=version,
+        )
+        return func
+
+    return decorator
+
+
+def resolve_chain(names: Iterable[str]) -> list[Transform]:
+    import sitebuild.transforms  # noqa: F401  (registers the built-in transforms)
+
+    chain: list[Transform] = []
+    for name in names:
+        if name not in TRANSFORMS:
+            raise SystemExit(f"Unknown transform: {name} (known: {', '.join(sorted(TRANSFORMS))})")
+        chain.append(TRANSFORMS[name])
+    return chain
+
+
+def iter_pages(kinds: Iterable[str]) -> list[Page]:
+    pages = [Page(path=e.path, rel=e.rel, kind=e.kind) for e in inventory.load().files(*kinds)]
+    # index.html goes first: it is the layout source for nav/footer sync, so the
+    # other transforms must settle it before its blocks are copied elsewhere.
+    pages.sort(key=lambda p: not p.is_layout_source)
+    return pages
+
+
+@dataclass
+class EngineReport:
+    scanned: int = 0
+    cached: int = 0
+    updated: list[str] = field(default_factory=list)
+    notes: list[tuple[str, str]] = field(default_factory=list)
+    changed_partials: list[str] = field(default_factory=list)
+    unstable: list[str] = field(default_factory=list)
+
+
+def apply_chain(text: str, page: Page, chain: list[Transform], ctx: BuildContext) -> str:
+    for transform in chain:
+        if transform.applies_to(page):
+            text = transform.func(text, page, ctx)
+    return text
+
+
+def is_stable(text: str, page: Page, chain: list[Transform], ctx: BuildContext) -> bool:
+    """Whether running the chain over its own output changes nothing more."""
+    return apply_chain(text, replace(page, notes=[]), chain, ctx) == text
+
+
+def chain_key(chain: list[Transform], page: Page, ctx: BuildContext) -> str:
+    """Hash of everything besides the page itself that decides the output."""
+    applicable = [t for t in chain if t.applies_to(page)]
+    partials = sorted({name for t in applicable for name in t.requires})
+    return fingerprint(
+        [(t.name, t.version) for t in applicable],
+        {name: ctx.block_hash(name) for name in partials},
+    )
+
+
+@dataclass(frozen=True)
+class PageTask:
+    rel: str
+    kind: str
+    key: str
+    cached_hash: str | None
+    dry_run: bool
+
+
+@dataclass(frozen=True)
+class PageOutcome:
+    rel: str
+    cached: bool
+    updated: bool
+    text_hash: str
+    stamp: tuple[int, int] | None
+    notes: tuple[str, ...]
+    stable: bool = True
+
+
+# Per-process state for process_page(); set by init_worker() in each worker
+# (or once in-process for serial runs).
+_WORKER_CHAIN: list[Transform] = []
+_WORKER_CTX = BuildContext()
+
+
+def init_worker(chain_names: tuple[str, ...], layout_text: str | None) -> None:
+    global _WORKER_CHAIN, _WORKER_CTX
+    _WORKER_CHAIN = resolve_chain(chain_names)
+    _WORKER_CTX = BuildContext()
+    if layout_text is not None:
+        _WORKER_CTX.set_layout_text(layout_text)
+
+
+def process_page(task: PageTask) -> PageOutcome:
+    """Read, transform and (if changed) write one page. Runs in a worker."""
+    page = Page(path=BASE_DIR / task.rel, rel=task.rel, kind=task.kind)
+    before = page.path.read_text(encoding="utf-8")
+    before_hash = sha256_text(before)
+    if task.cached_hash == before_hash:
+        # Touched but not edited since the last run: nothing to transform.
+        return PageOutcome(task.rel, True, False, before_hash, _stamp(page.path), ())
+
+    after = apply_chain(before, page, _WORKER_CHAIN, _WORKER_CTX)
+    updated = after != before
+    if updated and not task.dry_run:
+        page.path.write_text(after, encoding="utf-8")
+    stable = not updated or is_stable(after, page, _WORKER_CHAIN, _WORKER_CTX)
+    return PageOutcome(task.rel, False, updated, sha256_text(after), _stamp(page.path), tuple(page.notes), stable)
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    stamp = FileStamp.of(path)
+    return (stamp.size, stamp.mtime_ns) if stamp else None
+
+
+def run(chain: list[Transform], *, dry_run: bool = False, use_cache: bool = True, jobs: int = 0) -> EngineReport:
+    kinds = set().union(*(t.kinds for t in chain)) if chain else set()
+    ctx = BuildContext()
+    report = EngineReport()
+    cache = JsonCache("transforms", enabled=use_cache)
+    # One section per chain, so running a single-transform script does not
+    # invalidate the entries recorded by a full sync-all run (and vice versa).
+    section = "pages:" + ",".join(t.name for t in chain)
+    entries = cache.section(section)
+    chain_names = tuple(t.name for t in chain)
+
+    def record(outcome: PageOutcome, key: str) -> None:
+        if outcome.cached:
+            report.cached += 1
+            notes = entries.get(outcome.rel, {}).get("notes", [])
+        else:
+            notes = list(outcome.notes)
+        report.notes.extend((outcome.rel, note) for note in notes)
+        if outcome.updated:
+            report.updated.append(outcome.rel)
+        if not outcome.stable:
+            # A rerun would change the page again: leave it uncached so it does.
+            report.unstable.append(outcome.rel)
+        elif outcome.stamp:
+            cache.set(
+                section,
+                outcome.rel,
+                {"chain": key, "hash": outcome.text_hash, "stamp": list(outcome.stamp), "notes": notes},
+            )
+
+    pending: list[PageTask] = []
+    for page in iter_pages(kinds):
+        if not any(t.applies_to(page) for t in chain):
+            continue
+        report.scanned += 1
+        key = chain_key(chain, page, ctx)
+        entry = entries.get(page.rel) or {}
+        same_chain = entry.get("chain") == key
+        stamp = _stamp(page.path)
+
+        if same_chain and stamp and list(stamp) == entry.get("stamp"):
+            report.cached += 1
+            report.notes.extend((page.rel, note) for note in entry.get("notes", []))
+            continue
+
+        task = PageTask(page.rel, page.kind, key, entry.get("hash") if same_chain else None, dry_run)
+        if not page.is_layout_source:
+            pending.append(task)
+            continue
+
+        # The layout source is settled first, in-process, so the nav/footer
+        # blocks every other page copies come from its final text.
+        before = page.path.read_text(encoding="utf-8")
+        after = apply_chain(before, page, chain, ctx)
+        ctx.set_layout_text(after)
+        ctx.require_layout_blocks(chain)
+        if after != before and not dry_run:
+            page.path.write_text(after, encoding="utf-8")
+        stable = after == before or is_stable(after, page, chain, ctx)
+        record(
+            PageOutcome(
+                page.rel, False, after != before, sha256_text(after), _stamp(page.path), tuple(page.notes), stable
+            ),
+            key,
+        )
+
+    if pending:
+        # Fail before the first write if a layout block cannot be extracted.
+        ctx.require_layout_blocks(chain)
+        layout_text = ctx.layout_text if any(t.requires for t in chain) else None
+        outcomes = map_ordered(
+            process_page,
+            pending,
+            jobs=jobs,
+            initializer=init_worker,
+            initargs=(chain_names, layout_text),
+        )
+        for task, outcome in zip(pending, outcomes):
+            record(outcome, task.key)
+
+    for name in sorted({name for t in chain for name in t.requires}):
+        digest = ctx.block_hash(name)
+        previous = cache.section("partials").get(name)
+        if previous is not None and previous != digest:
+            report.changed_partials.append(name)
+        cache.set("partials", name, digest)
+
+    if not dry_run:
+        cache.save()
+    return report
+
+
+def main(default_chain: Iterable[str], *, description: str | None = None, argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=description, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--transforms",
+        default=",".join(default_chain),
+        help="Comma-separated transform chain to run (default: %(default)s).",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without writing files.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore .build-cache/transforms.json and re-run the chain on every page.",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="List every updated file.")
+    add_jobs_argument(parser)
+    args = parser.parse_args(argv)
+
+    chain = resolve_chain(n.strip() for n in args.transforms.split(",") if n.strip())
+    report = run(chain, dry_run=args.dry_run, use_cache=not args.no_cache, jobs=args.jobs)
+
+    for name in report.changed_partials:
+        print(f"Layout partial changed since last run: {name}")
+    for rel, note in report.notes:
+        print(f"  Skipped ({note}): {rel}")
+    for rel in report.unstable:
+        print(f"  Not stable (a second run would change it again; not cached): {rel}")
+    if args.verbose:
+        for rel in report.updated:
+            print(f"  Updated: {rel}")
+
+    verb = "Would update" if args.dry_run else "Updated"
+    print(
+        f"Scanned {report.scanned} HTML files ({report.cached} unchanged since last run). "
+        f"{verb} {len(report.updated)}. Chain: {', '.join(t.name for t in chain)}"
+    )
+    return 0
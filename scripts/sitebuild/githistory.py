@@ -0,0 +1,133 @@
+"""
+Last-commit dates for every tracked path, from one `git log` pass.
+
+The index maps each path (relative to BASE_DIR) to the author date of the
+newest commit that touched it -- the same answer as `git log -1 -- <path>` --
+and is persisted in .build-cache/git-history.json together with the commit
+it was built at. Later runs only read `git log <indexed>..HEAD`; a full pass
+is needed only on first use or when the indexed commit is no longer an
+ancestor of HEAD (rebase, branch switch).
+"""
+
+from __future__ import annotations
+
+import subprocess
+
+from sitebuild import BASE_DIR
+from sitebuild.buildcache import JsonCache
+
+CACHE_VERSION = 1
+
+# Record separator before each commit header, unit separator inside it.
+_COMMIT_MARK = "\x1e"
+_FIELD_SEP = "\x1f"
+
+
+def _git(*args: str) -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "-c", "core.quotePath=false", *args],
+            capture_output=True,
+            text=True,
+            cwd=BASE_DIR,
+        )
+    except FileNotFoundError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _head() -> str | None:
+    out = _git("rev-parse", "--verify", "-q", "HEAD")
+    return out.strip() if out else None
+
+
+def _is_ancestor(commit: str, head: str) -> bool:
+    try:
+        result = subprocess.run(
+            ["git", "merge-base", "--is-ancestor", commit, head],
+            capture_output=True,
+            cwd=BASE_DIR,
+        )
+    except FileNotFoundError:
+        return False
+    return result.returncode == 0
+
+
+def _read_log(rev_range: str) -> dict[str, str] | None:
+    """Newest author date per path for commits in *rev_range*."""
+    out = _git(
+        "log",
+        "--name-only",
+        "--no-renames",
+        "--relative",
+        f"--format={_COMMIT_MARK}%H{_FIELD_SEP}%aI",
+        rev_range,
+        "--",
+    )
+    if out is None:
+        return None
+    dates: dict[str, str] = {}
+    for chunk in out.split(_COMMIT_MARK):
+        if not chunk.strip():
+            continue
+        header, _, names = chunk.partition("\n")
+        _sha, _, authored = header.partition(_FIELD_SEP)
+        for name in names.splitlines():
+            # git log is newest first, so the first date seen for a path wins.
+            if name and name not in dates:
+                dates[name] = authored
+    return dates
+
+
+class GitHistory:
+    def __init__(self, dates: dict[str, str]) -> None:
+        self.dates = dates
+
+    def last_modified(self, rel: str) -> str | None:
+        """ISO 8601 author date of the last commit touching *rel*, if any."""
+        return self.dates.get(rel)
+
+    def last_modified_date(self, rel: str) -> str | None:
+        """Like last_modified(), as YYYY-MM-DD."""
+        value = self.dates.get(rel)
+        return value[:10] if value else None
+
+
+_HISTORY: GitHistory | None = None
+
+
+def load(*, use_cache: bool = True) -> GitHistory:
+    """Return the history index for HEAD, updating the cached copy as needed.
+
+    Outside a git checkout (or without git) the index is empty and every
+    lookup returns None, so callers keep their existing fallbacks.
+    """
+    global _HISTORY
+    if _HISTORY is not None:
+        return _HISTORY
+
+    cache = JsonCache("git-history", version=CACHE_VERSION, enabled=use_cache)
+    head = _head()
+    if head is None:
+        _HISTORY = GitHistory({})
+        return _HISTORY
+
+    indexed = cache.data.get("head")
+    dates = cache.section("paths")
+    if indexed != head:
+        if indexed and _is_ancestor(indexed, head):
+            newer = _read_log(f"{indexed}..{head}")
+        else:
+            dates = {}
+            newer = _read_log(head)
+        if newer is not None:
+            dates.update(newer)
+            cache.data["paths"] = dates
+            cache.data["head"] = head
+            cache.dirty = True
+            cache.save()
+
+    _HISTORY = GitHistory(dict(dates))
+    return _HISTORY
@@ -0,0 +1,204 @@
+"""
+Pluggable HTML parser backends for the scrapers.
+
+The importers only need a handful of simple selector queries on each fetched
+page (`.entry-content`, `.et_pb_text_inner`, `meta[property="og:title"]`,
+`time.published`, ...), yet building a full BeautifulSoup tree for every page
+dominated their CPU time. Pages are therefore parsed through a Backend:
+
+- "lxml" (default): raw lxml.html, with selectors compiled once to XPath.
+- "soup": BeautifulSoup on the lxml tree builder, the previous behaviour.
+
+Both return Nodes with the same small API (select, select_one, attr, text,
+inner_html). extract() runs a scraper function on the default backend and
+re-runs it on BeautifulSoup if the fast path cannot parse the markup or the
+scraper raises ExtractError, so malformed pages still get the lenient parser.
+
+Only the selector subset used here is supported: descendant combinators over
+compound selectors made of a tag name (or *), .class, #id, [attr] and
+[attr="value"].
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import re
+from functools import lru_cache
+from typing import Callable, Protocol, TypeVar
+
+import lxml.etree
+import lxml.html
+from bs4 import BeautifulSoup, Tag
+
+T = TypeVar("T")
+
+DEFAULT_BACKEND = "lxml"
+FALLBACK_BACKEND = "soup"
+
+
+class ExtractError(RuntimeError):
+    """Raised by a scraper when the page lacks what it needs."""
+
+
+class Node(Protocol):
+    def select(self, selector: str) -> list["Node"]: ...
+
+    def select_one(self, selector: str) -> "Node | None": ...
+
+    def attr(self, name: str) -> str | None: ...
+
+    def text(self) -> str: ...
+
+    def inner_html(self) -> str: ...
+
+
+# ---------------------------------------------------------------------------
+# Selector -> XPath
+# ---------------------------------------------------------------------------
+
+_COMPOUND_RE = re.compile(
+    r"""
+    (?P<tag>\*|[a-zA-Z][a-zA-Z0-9-]*)?
+    (?P<rest>(?:\.[\w-]+|\#[\w-]+|\[[\w-]+(?:=(?:"[^"]*"|'[^']*'|[\w-]+))?\])*)
+    """,
+    re.VERBOSE,
+)
+_PART_RE = re.compile(r"""\.([\w-]+)|\#([\w-]+)|\[([\w-]+)(?:=("[^"]*"|'[^']*'|[\w-]+))?\]""")
+
+
+def _xpath_literal(value: str) -> str:
+    if '"' not in value:
+        return f'"{value}"'
+    if "'" not in value:
+        return f"'{value}'"
+    parts = value.split('"')
+    return "concat(" + ", '\"', ".join(f'"{p}"' for p in parts) + ")"
+
+
+@lru_cache(maxsize=None)
+def css_to_xpath(selector: str) -> lxml.etree.XPath:
+    steps = []
+    for compound in selector.split():
+        match = _COMPOUND_RE.fullmatch(compound)
+        if not match:
+            raise ValueError(f"Unsupported selector: {selector!r}")
+        conditions = []
+        for cls, id_, attr, value in _PART_RE.findall(match.group("rest") or ""):
+            if cls:
+                conditions.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')")
+            elif id_:
+                conditions.append(f"@id={_xpath_literal(id_)}")
+            elif value:
+                literal = _xpath_literal(value.strip("\"'"))
+                conditions.append(f"@{attr}={literal}")
+            else:
+                conditions.append(f"@{attr}")
+        step = (match.group("tag") or "*").lower()
+        steps.append(step + "".join(f"[{c}]" for c in conditions))
+    if not steps:
+        raise ValueError(f"Unsupported selector: {selector!r}")
+    return lxml.etree.XPath(".//" + "//".join(steps))
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+
+class LxmlNode:
+    __slots__ = ("el",)
+
+    def __init__(self, el: lxml.html.HtmlElement) -> None:
+        self.el = el
+
+    def select(self, selector: str) -> list[LxmlNode]:
+        return [LxmlNode(el) for el in css_to_xpath(selector)(self.el)]
+
+    def select_one(self, selector: str) -> LxmlNode | None:
+        found = css_to_xpath(selector)(self.el)
+        return LxmlNode(found[0]) if found else None
+
+    def attr(self, name: str) -> str | None:
+        return self.el.get(name)
+
+    def text(self) -> str:
+        return self.el.text_content()
+
+    def inner_html(self) -> str:
+        parts = [html.escape(self.el.text, quote=False)] if self.el.text else []
+        parts.extend(lxml.html.tostring(child, encoding="unicode", with_tail=True) for child in self.el)
+        return "".join(parts)
+
+
+class SoupNode:
+    __slots__ = ("el",)
+
+    def __init__(self, el: Tag) -> None:
+        self.el = el
+
+    def select(self, selector: str) -> list[SoupNode]:
+        return [SoupNode(el) for el in self.el.select(selector)]
+
+    def select_one(self, selector: str) -> SoupNode | None:
+        el = self.el.select_one(selector)
+        return SoupNode(el) if el is not None else None
+
+    def attr(self, name: str) -> str | None:
+        value = self.el.get(name)
+        if isinstance(value, list):  # multi-valued attributes such as class
+            return " ".join(value)
+        return value
+
+    def text(self) -> str:
+        return self.el.get_text()
+
+    def inner_html(self) -> str:
+        return self.el.decode_contents()
+
+
+def _parse_lxml(markup: str) -> LxmlNode:
+    return LxmlNode(lxml.html.document_fromstring(markup))
+
+
+def _parse_soup(markup: str) -> SoupNode:
+    return SoupNode(BeautifulSoup(markup, "lxml"))
+
+
+BACKENDS: dict[str, Callable[[str], Node]] = {
+    "lxml": _parse_lxml,
+    "soup": _parse_soup,
+}
+
+_default = DEFAULT_BACKEND
+
+
+def set_default_backend(name: str) -> None:
+    global _default
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown parser backend: {name}")
+    _default = name
+
+
+def parse(markup: str, backend: str | None = None) -> Node:
+    return BACKENDS[backend or _default](markup)
+
+
+def extract(markup: str, scraper: Callable[[Node], T], *, backend: str | None = None) -> T:
+    """Run *scraper* on the parsed page, retrying with BeautifulSoup on failure."""
+    backend = backend or _default
+    try:
+        return scraper(parse(markup, backend))
+    except (ExtractError, lxml.etree.ParserError, ValueError):
+        if backend == FALLBACK_BACKEND:
+            raise
+    return scraper(parse(markup, FALLBACK_BACKEND))
+
+
+def add_parser_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--parser",
+        choices=sorted(BACKENDS),
+        default=DEFAULT_BACKEND,
+        help="HTML parser backend for scraped pages (default: %(default)s; falls back to soup on failure).",
+    )
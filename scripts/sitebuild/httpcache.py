@@ -0,0 +1,108 @@
+"""
+On-disk HTTP response cache for the WordPress importers (.build-cache/http/).
+
+Each cached GET is stored as two files named by the hash of its full URL:
+<key>.json (URL, status, and the response headers worth keeping, including
+ETag / Last-Modified) and <key>.body (the raw bytes). A Fetcher with a cache
+sends If-None-Match / If-Modified-Since for URLs it has seen before and, on a
+304, serves the stored body, so a repeat import mostly costs revalidations.
+In offline mode nothing touches the network: every GET is answered from the
+cache or fails with OfflineMiss, which makes recorded runs replayable.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from sitebuild.buildcache import CACHE_DIR, sha256_text
+
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+
+# Headers replayed from the cache. Everything else is connection-specific.
+KEEP_HEADERS = (
+    "Content-Type",
+    "ETag",
+    "Last-Modified",
+    "Link",
+    "X-WP-Total",
+    "X-WP-TotalPages",
+)
+
+
+class OfflineMiss(LookupError):
+    """Raised in offline mode for a URL that was never cached."""
+
+
+def prepared_url(url: str, params: Any = None) -> str:
+    """The exact URL requests would send for *url* + *params* (the cache key)."""
+    return requests.Request("GET", url, params=params).prepare().url or url
+
+
+class HttpCache:
+    def __init__(self, directory: Path = HTTP_CACHE_DIR, *, offline: bool = False) -> None:
+        self.directory = directory
+        self.offline = offline
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = sha256_text(url)[:32]
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def lookup(self, url: str) -> tuple[dict[str, str], Path] | None:
+        """Stored headers and body path for *url*, or None if not cached."""
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or not body_path.exists():
+            return None
+        return meta.get("headers", {}), body_path
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        hit = self.lookup(url)
+        if hit is None:
+            return {}
+        stored = CaseInsensitiveDict(hit[0])
+        headers = {}
+        if stored.get("ETag"):
+            headers["If-None-Match"] = stored["ETag"]
+        if stored.get("Last-Modified"):
+            headers["If-Modified-Since"] = stored["Last-Modified"]
+        return headers
+
+    def store(self, url: str, resp: requests.Response) -> None:
+        meta_path, body_path = self._paths(url)
+        headers = {name: resp.headers[name] for name in KEEP_HEADERS if name in resp.headers}
+        meta = {"url": url, "status": resp.status_code, "headers": headers}
+        # Unique temp names: several fetch threads may store the same URL.
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        body_tmp = body_path.with_name(body_path.name + suffix)
+        meta_tmp = meta_path.with_name(meta_path.name + suffix)
+        body_tmp.write_bytes(resp.content)
+        meta_tmp.write_text(json.dumps(meta, indent=2) + "\n", encoding="utf-8")
+        os.replace(body_tmp, body_path)
+        os.replace(meta_tmp, meta_path)
+
+    def replay(self, url: str) -> requests.Response:
+        """Build a 200 response for *url* from the cache (OfflineMiss if absent)."""
+        hit = self.lookup(url)
+        if hit is None:
+            raise OfflineMiss(f"not in HTTP cache: {url}")
+        headers, body_path = hit
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.reason = "OK"
+        resp.url = url
+        resp.headers = CaseInsensitiveDict(headers)
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp._content = body_path.read_bytes()
+        return resp
@@ -0,0 +1,199 @@
+"""
+Cached inventory of the site tree.
+
+One pruned os.scandir() walk classifies every file the build scripts care
+about:
+
+- public:  served HTML (root *.html and /<route>/.../index.html)
+- source:  build-source pages under ./pages (not served)
+- partial: HTML fragments under ./partials
+- asset:   files under the asset folders (images/, styles/, scripts/, fonts/)
+           plus root-level static files (favicons, verification files, ...)
+
+Excluded folders (.git, node_modules, dev, ...) are skipped before descending.
+The listing of each directory is cached in .build-cache/inventory.json keyed on
+the directory's mtime, which changes whenever an entry is added, removed or
+renamed; unchanged directories are not re-listed on the next run.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from sitebuild import BASE_DIR
+from sitebuild.buildcache import JsonCache
+
+PUBLIC = "public"
+SOURCE = "source"
+PARTIAL = "partial"
+ASSET = "asset"
+
+SOURCE_DIR = "pages"
+PARTIALS_DIR = "partials"
+ASSET_DIRS = {"fonts", "images", "scripts", "styles"}
+
+# Never descended into, at any depth.
+PRUNE_DIRS = {
+    ".build-cache",
+    ".git",
+    ".pytest_cache",
+    ".superdesign",
+    "__pycache__",
+    "node_modules",
+}
+
+# Top-level folders that hold no site pages or assets.
+PRUNE_TOP_DIRS = {
+    ".well-known",
+    "api",
+    "aws-lambda",
+    "content",
+    "dev",
+    "docs",
+    "wp-content",
+}
+
+ROOT_ASSET_SUFFIXES = {".ico", ".png", ".svg", ".txt", ".webmanifest", ".xml"}
+
+CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Entry:
+    rel: str  # POSIX path relative to BASE_DIR
+    kind: str
+
+    @property
+    def path(self) -> Path:
+        return BASE_DIR / self.rel
+
+    @property
+    def url_path(self) -> str | None:
+        """Clean URL for a public index.html (`/` or `/<route>/`), else None."""
+        if self.kind != PUBLIC:
+            return None
+        if self.rel == "index.html":
+            return "/"
+        if not self.rel.endswith("/index.html"):
+            return None
+        return f"/{self.rel[: -len('index.html')]}"
+
+
+def rel_for_url_path(url_path: str) -> str:
+    """Inverse of Entry.url_path: `/blog/x/` -> `blog/x/index.html`."""
+    route = url_path.strip("/")
+    return f"{route}/index.html" if route else "index.html"
+
+
+def classify(rel: str) -> str | None:
+    parts = rel.split("/")
+    top = parts[0]
+    is_html = rel.endswith(".html")
+    if len(parts) == 1:
+        if is_html:
+            return PUBLIC
+        return ASSET if os.path.splitext(rel)[1].lower() in ROOT_ASSET_SUFFIXES else None
+    if top == SOURCE_DIR:
+        return SOURCE if is_html else None
+    if top == PARTIALS_DIR:
+        return PARTIAL if is_html else None
+    if top in ASSET_DIRS:
+        # HTML under scripts/ etc. is generator templates, not pages.
+        return None if is_html else ASSET
+    return PUBLIC if is_html else None
+
+
+def _prune(rel_dir: str, name: str) -> bool:
+    return name in PRUNE_DIRS or (not rel_dir and name in PRUNE_TOP_DIRS)
+
+
+class Inventory:
+    def __init__(self, entries: Iterable[Entry]) -> None:
+        # Sorted by path components, i.e. the same order as sorted(Path, ...).
+        self.entries = sorted(entries, key=lambda e: e.rel.split("/"))
+        self._by_rel = {e.rel: e for e in self.entries}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, rel: str) -> bool:
+        return rel in self._by_rel
+
+    def get(self, rel: str) -> Entry | None:
+        return self._by_rel.get(rel)
+
+    def files(self, *kinds: str) -> list[Entry]:
+        wanted = set(kinds)
+        return [e for e in self.entries if e.kind in wanted]
+
+    def paths(self, *kinds: str) -> list[Path]:
+        return [e.path for e in self.files(*kinds)]
+
+    def routes(self) -> list[tuple[str, Path]]:
+        """(clean URL path, file) for every public index.html, sorted by file."""
+        return [(e.url_path, e.path) for e in self.files(PUBLIC) if e.url_path]
+
+
+def _walk(cache: JsonCache) -> list[Entry]:
+    old_dirs = cache.section("dirs")
+    new_dirs: dict[str, dict] = {}
+    entries: list[Entry] = []
+
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        abs_dir = os.path.join(BASE_DIR, rel_dir) if rel_dir else str(BASE_DIR)
+        try:
+            mtime_ns = os.stat(abs_dir).st_mtime_ns
+        except FileNotFoundError:
+            continue
+        cached = old_dirs.get(rel_dir)
+        if cached and cached.get("mtime_ns") == mtime_ns:
+            record = cached
+        else:
+            files: list[str] = []
+            subdirs: list[str] = []
+            with os.scandir(abs_dir) as it:
+                for de in it:
+                    if de.is_dir(follow_symlinks=False):
+                        if not _prune(rel_dir, de.name):
+                            subdirs.append(de.name)
+                    elif de.is_file():
+                        files.append(de.name)
+            record = {"mtime_ns": mtime_ns, "files": sorted(files), "subdirs": sorted(subdirs)}
+        new_dirs[rel_dir] = record
+
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        for name in record["files"]:
+            rel = prefix + name
+            kind = classify(rel)
+            if kind is not None:
+                entries.append(Entry(rel=rel, kind=kind))
+        stack.extend(prefix + name for name in reversed(record["subdirs"]))
+
+    if new_dirs != old_dirs:
+        cache.data["dirs"] = new_dirs
+        cache.dirty = True
+    return entries
+
+
+_INVENTORY: Inventory | None = None
+
+
+def load(*, use_cache: bool = True, refresh: bool = False) -> Inventory:
+    """Return the site inventory, walking only directories that changed.
+
+    The result is memoized for the life of the process; pass refresh=True after
+    a step that creates or deletes files.
+    """
+    global _INVENTORY
+    if _INVENTORY is not None and not refresh:
+        return _INVENTORY
+    cache = JsonCache("inventory", version=CACHE_VERSION, enabled=use_cache)
+    entries = _walk(cache)
+    cache.save()
+    _INVENTORY = Inventory(entries)
+    return _INVENTORY
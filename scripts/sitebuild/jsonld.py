@@ -0,0 +1,226 @@
+"""
+Shared JSON-LD (schema.org) builder for the page generators.
+
+Every article, blog index and author page carries the same handful of static
+nodes: the Organization, the WebSite, and the author's Person / Physician node
+built from content/authors.json. Those are serialized once per build (cached
+here) and reused as ready-made JSON fragments; per-page graphs are assembled
+by joining them with the few per-page values, each encoded individually. The
+result is compact JSON with `</` already escaped, ready to drop into a
+<script type="application/ld+json"> tag:
+
+    schema = jsonld.article_graph(canonical_url, title=..., author_slug=...)
+    tag = jsonld.script_tag(schema)
+
+dumps() does the same encoding for ad-hoc objects (author profile pages).
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterable
+
+from sitebuild import BASE_DIR, CANONICAL_ORIGIN
+
+AUTHORS_PATH = BASE_DIR / "content" / "authors.json"
+
+ORIGIN = CANONICAL_ORIGIN
+CONTEXT = "https://schema.org"
+ORGANIZATION_ID = f"{ORIGIN}/#organization"
+WEBSITE_ID = f"{ORIGIN}/#website"
+SITE_NAME = "Classic Vision Care"
+LOGO_URL = f"{ORIGIN}/images/logos/EOP1600_Classic_Logo_FN.png"
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def dumps(obj: Any) -> str:
+    """Compact JSON, safe to embed in a <script> element."""
+    return _encode(obj).replace("</", "<\\/")
+
+
+def script_tag(schema: str, indent: str = "  ") -> str:
+    return f'{indent}<script type="application/ld+json">{schema}</script>'
+
+
+def clean_headline(raw: str) -> str:
+    """Strip site-name suffixes like ' | Classic Vision Care'."""
+    for sep in (" | ", " - Classic Vision Care"):
+        if sep in raw:
+            raw = raw.split(sep)[0]
+    return raw.strip()
+
+
+def _object(fields: Iterable[tuple[str, str | None]]) -> str:
+    """A JSON object from (key, already-encoded value) pairs; None values are left out."""
+    return "{" + ",".join(f'"{key}":{value}' for key, value in fields if value is not None) + "}"
+
+
+def _opt(value: Any) -> str | None:
+    return dumps(value) if value else None
+
+
+def _ref(node_id: str) -> str:
+    return _object([("@id", dumps(node_id))])
+
+
+def graph(*nodes: str) -> str:
+    """Wrap encoded nodes in a schema.org @graph document."""
+    return f'{{"@context":{dumps(CONTEXT)},"@graph":[{",".join(nodes)}]}}'
+
+
+# ---------------------------------------------------------------------------
+# Static fragments (encoded once per build)
+# ---------------------------------------------------------------------------
+
+EN_US = dumps("en-US")
+ORGANIZATION_REF = _ref(ORGANIZATION_ID)
+WEBSITE_REF = _ref(WEBSITE_ID)
+ARTICLE_TYPES = {True: dumps("MedicalWebPage"), False: dumps(["Article", "BlogPosting"])}
+
+ORGANIZATION = dumps(
+    {
+        "@type": "Organization",
+        "@id": ORGANIZATION_ID,
+        "name": SITE_NAME,
+        "url": f"{ORIGIN}/",
+        "logo": LOGO_URL,
+    }
+)
+WEBSITE = dumps(
+    {
+        "@type": "WebSite",
+        "@id": WEBSITE_ID,
+        "url": ORIGIN,
+        "name": SITE_NAME,
+        "publisher": {"@id": ORGANIZATION_ID},
+    }
+)
+# Home > Resources > (page): the first two crumbs never change.
+_RESOURCES_CRUMBS = ",".join(
+    [
+        dumps({"@type": "ListItem", "position": 1, "name": "Home", "item": f"{ORIGIN}/"}),
+        dumps({"@type": "ListItem", "position": 2, "name": "Resources", "item": f"{ORIGIN}/blog/"}),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class AuthorFragments:
+    node: str  # the Person / Physician node
+    ref: str  # {"@id": ...} pointing at it
+    medical: bool  # medical authors' articles are MedicalWebPages
+
+
+@lru_cache(maxsize=None)
+def load_authors() -> dict[str, dict[str, Any]]:
+    data = json.loads(AUTHORS_PATH.read_text(encoding="utf-8"))
+    return {slug: author for slug, author in data.items() if not slug.startswith("_")}
+
+
+@lru_cache(maxsize=None)
+def author(slug: str) -> AuthorFragments:
+    a = load_authors()[slug]
+    node: dict[str, Any] = {
+        "@type": a["schema_type"],
+        "@id": a["schema_id"],
+        "name": a["name"],
+        "url": f"{ORIGIN}{a['author_page']}",
+        "image": f"{ORIGIN}{a['image']}",
+        "jobTitle": a["title"],
+        "sameAs": a.get("sameAs", []),
+        "worksFor": {"@id": ORGANIZATION_ID},
+    }
+    specialties = (a.get("credentials") or {}).get("specialties")
+    if specialties:
+        node["knowsAbout"] = specialties
+    return AuthorFragments(node=dumps(node), ref=_ref(a["schema_id"]), medical=a.get("content_type") == "medical")
+
+
+# ---------------------------------------------------------------------------
+# Per-page graphs
+# ---------------------------------------------------------------------------
+
+
+def article_graph(
+    canonical_url: str,
+    *,
+    title: str,
+    author_slug: str,
+    description: str | None = None,
+    date_published: str | None = None,
+    date_modified: str | None = None,
+    image: str | None = None,
+) -> str:
+    """Article (or MedicalWebPage) + WebPage + author + breadcrumbs + Organization."""
+    by = author(author_slug)
+    headline = dumps(clean_headline(title))
+    page_id = dumps(canonical_url)
+    if image and not image.startswith("http"):
+        image = f"{ORIGIN}{image}"
+    dates = [("datePublished", _opt(date_published)), ("dateModified", _opt(date_modified))]
+    description_field = ("description", _opt(description))
+
+    article = _object(
+        [
+            ("@type", ARTICLE_TYPES[by.medical]),
+            ("@id", dumps(f"{canonical_url}#article")),
+            ("headline", headline),
+            ("author", by.ref),
+            ("publisher", ORGANIZATION_REF),
+            ("mainEntityOfPage", _object([("@id", page_id)])),
+            ("inLanguage", EN_US),
+            *dates,
+            description_field,
+            ("image", _opt(image)),
+        ]
+    )
+    webpage = _object(
+        [
+            ("@type", '"WebPage"'),
+            ("@id", page_id),
+            ("url", page_id),
+            ("name", dumps(title)),
+            ("isPartOf", WEBSITE_REF),
+            ("author", by.ref),
+            ("breadcrumb", _ref(f"{canonical_url}#breadcrumb")),
+            ("inLanguage", EN_US),
+            *dates,
+            description_field,
+        ]
+    )
+    breadcrumbs = (
+        f'{{"@type":"BreadcrumbList","@id":{dumps(canonical_url + "#breadcrumb")},"itemListElement":'
+        f'[{_RESOURCES_CRUMBS},{{"@type":"ListItem","position":3,"name":{headline}}}]}}'
+    )
+    return graph(article, webpage, by.node, breadcrumbs, ORGANIZATION)
+
+
+def faq_page(canonical_url: str, items: Iterable[tuple[str, str]]) -> str:
+    """Standalone FAQPage document for question/answer pairs."""
+    questions = ",".join(
+        f'{{"@type":"Question","name":{dumps(q)},"acceptedAnswer":{{"@type":"Answer","text":{dumps(a)}}}}}'
+        for q, a in items
+    )
+    return (
+        f'{{"@context":{dumps(CONTEXT)},"@type":"FAQPage","@id":{dumps(canonical_url + "#faq")},'
+        f'"mainEntity":[{questions}]}}'
+    )
+
+
+def collection_page(url: str, *, name: str, description: str) -> str:
+    """CollectionPage (an index of articles) + WebSite."""
+    page = _object(
+        [
+            ("@type", '"CollectionPage"'),
+            ("@id", dumps(url)),
+            ("url", dumps(url)),
+            ("name", dumps(name)),
+            ("description", dumps(description)),
+            ("isPartOf", WEBSITE_REF),
+            ("inLanguage", EN_US),
+        ]
+    )
+    return graph(page, WEBSITE)
@@ -0,0 +1,369 @@
+"""
+Offline JSON-LD validation against a bundled subset of schema.org rules.
+
+check_page() extracts every <script type="application/ld+json"> block from a
+page, parses it and walks every typed node. Each node is checked against the
+rules for its @type and the type's bundled ancestors (a MedicalClinic gets the
+LocalBusiness rules, a BlogPosting the Article rules):
+
+- TYPE_RULES: required properties (errors) and recommended ones (warnings);
+  "a|b" means either property satisfies the rule.
+- STRUCTURE_CHECKS: shape checks the property lists cannot express (FAQ
+  questions need an accepted answer with text, breadcrumb positions run
+  1..n, a business address needs its postal fields).
+- Everywhere: date properties must be ISO 8601 and url-like properties
+  absolute http(s) URLs.
+
+Typed nodes nested inside another node that carry an @id (an author's
+"worksFor": {"@type": "MedicalBusiness", "@id": ...}) are references to an
+entity described elsewhere: only their type is recorded, not validated.
+Other nested nodes get the required-property checks but no recommendations.
+
+A PageReport also lists the @ids the page declares (with their types and
+name) and references, so check_site() can compare them across pages: one @id
+declared with unrelated types or different names on different pages is an
+error, and a reference no page declares is a warning.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+ERROR = "error"
+WARNING = "warning"
+
+SCHEMA_CONTEXTS = {"https://schema.org", "http://schema.org", "https://schema.org/", "http://schema.org/"}
+
+JSONLD_RE = re.compile(
+    r"<script\b[^>]*\btype=[\"']application/ld\+json[\"'][^>]*>(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Parent type of each bundled type (single inheritance is enough for these).
+PARENT_TYPES: dict[str, str] = {
+    "BlogPosting": "Article",
+    "NewsArticle": "Article",
+    "MedicalWebPage": "WebPage",
+    "FAQPage": "WebPage",
+    "ProfilePage": "WebPage",
+    "CollectionPage": "WebPage",
+    "ContactPage": "WebPage",
+    "AboutPage": "WebPage",
+    "MedicalClinic": "MedicalBusiness",
+    "Optician": "MedicalBusiness",
+    "MedicalBusiness": "LocalBusiness",
+    "LocalBusiness": "Organization",
+    "MedicalOrganization": "Organization",
+    "CollegeOrUniversity": "EducationalOrganization",
+    "EducationalOrganization": "Organization",
+}
+
+
+@dataclass(frozen=True)
+class TypeRule:
+    required: tuple[str, ...] = ()
+    recommended: tuple[str, ...] = ()
+
+
+TYPE_RULES: dict[str, TypeRule] = {
+    "MedicalWebPage": TypeRule(
+        required=("name|headline",),
+        recommended=("author|reviewedBy", "datePublished", "dateModified|lastReviewed", "publisher"),
+    ),
+    "Article": TypeRule(
+        required=("headline",),
+        recommended=("author", "datePublished", "image", "publisher", "mainEntityOfPage"),
+    ),
+    "FAQPage": TypeRule(required=("mainEntity",)),
+    "Question": TypeRule(required=("name", "acceptedAnswer")),
+    "Answer": TypeRule(required=("text",)),
+    "BreadcrumbList": TypeRule(required=("itemListElement",)),
+    "ListItem": TypeRule(required=("position",), recommended=("name|item",)),
+    "LocalBusiness": TypeRule(
+        required=("name", "address"),
+        recommended=("telephone", "url", "geo", "openingHoursSpecification|openingHours", "image"),
+    ),
+    "PostalAddress": TypeRule(required=("streetAddress", "addressLocality", "addressRegion", "postalCode")),
+    "Organization": TypeRule(required=("name",)),
+    "Person": TypeRule(required=("name",)),
+    "Physician": TypeRule(required=("name",)),
+}
+
+DATE_PROPERTIES = ("datePublished", "dateModified", "lastReviewed", "uploadDate")
+URL_PROPERTIES = ("url", "logo", "sameAs", "mainEntityOfPage", "item")
+
+
+@dataclass(frozen=True)
+class Issue:
+    severity: str
+    page: str
+    location: str  # block index + JSON path, e.g. "#1 @graph[0].author"
+    message: str
+
+    def as_dict(self) -> dict[str, str]:
+        return {"severity": self.severity, "page": self.page, "location": self.location, "message": self.message}
+
+
+@dataclass
+class PageReport:
+    page: str
+    blocks: int = 0
+    nodes: int = 0
+    types: Counter[str] = field(default_factory=Counter)  # @type -> typed nodes
+    issues: list[Issue] = field(default_factory=list)
+    # @id -> (sorted types, name) for every typed node declared on the page
+    declared: dict[str, tuple[tuple[str, ...], str | None]] = field(default_factory=dict)
+    referenced: set[str] = field(default_factory=set)
+
+
+def node_types(node: dict[str, Any]) -> tuple[str, ...]:
+    raw = node.get("@type")
+    if isinstance(raw, str):
+        return (raw,)
+    if isinstance(raw, list):
+        return tuple(t for t in raw if isinstance(t, str))
+    return ()
+
+
+def type_ancestry(type_name: str) -> list[str]:
+    chain = [type_name]
+    while chain[-1] in PARENT_TYPES:
+        chain.append(PARENT_TYPES[chain[-1]])
+    return chain
+
+
+def compatible_types(a: Iterable[str], b: Iterable[str]) -> bool:
+    """True if some type of one node is the same as, or an ancestor of, a type of the other."""
+    for x in a:
+        for y in b:
+            if x in type_ancestry(y) or y in type_ancestry(x):
+                return True
+    return False
+
+
+def _present(node: dict[str, Any], prop: str) -> bool:
+    value = node.get(prop)
+    return value not in (None, "", [], {})
+
+
+def _parse_date(value: str) -> bool:
+    text = value.strip().replace("Z", "+00:00")
+    try:
+        dt.datetime.fromisoformat(text)
+        return True
+    except ValueError:
+        pass
+    try:
+        dt.date.fromisoformat(text)
+        return True
+    except ValueError:
+        return False
+
+
+def _urls(value: Any) -> list[str]:
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [v for v in value if isinstance(v, str)]
+    return []
+
+
+# ---------------------------------------------------------------------------
+# Structure checks: (node, report issue) for shapes TYPE_RULES cannot express
+# ---------------------------------------------------------------------------
+
+Report = Callable[[str, str], None]  # (severity, message)
+
+
+def _as_list(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+def _check_faq(node: dict[str, Any], report: Report) -> None:
+    questions = _as_list(node.get("mainEntity"))
+    if not questions or questions == [None]:
+        return
+    for i, question in enumerate(questions):
+        if not isinstance(question, dict) or "Question" not in node_types(question):
+            report(ERROR, f"mainEntity[{i}] is not a Question")
+
+
+def _check_question(node: dict[str, Any], report: Report) -> None:
+    answer = node.get("acceptedAnswer")
+    if answer is None:
+        return
+    for candidate in _as_list(answer):
+        if not isinstance(candidate, dict) or "Answer" not in node_types(candidate):
+            report(ERROR, "acceptedAnswer is not an Answer")
+
+
+def _check_breadcrumbs(node: dict[str, Any], report: Report) -> None:
+    items = node.get("itemListElement")
+    if not isinstance(items, list) or not items:
+        if items is not None:
+            report(ERROR, "itemListElement must be a non-empty list")
+        return
+    positions = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict) or "ListItem" not in node_types(item):
+            report(ERROR, f"itemListElement[{i}] is not a ListItem")
+            continue
+        position = item.get("position")
+        if isinstance(position, str) and position.isdigit():
+            position = int(position)
+        positions.append(position)
+        if i < len(items) - 1 and not _present(item, "item"):
+            report(ERROR, f"itemListElement[{i}] needs an item URL (only the last crumb may omit it)")
+    if positions != list(range(1, len(positions) + 1)):
+        report(ERROR, f"breadcrumb positions should run 1..{len(positions)}, got {positions}")
+
+
+def _check_business(node: dict[str, Any], report: Report) -> None:
+    address = node.get("address")
+    if isinstance(address, str):
+        report(WARNING, "address is plain text; use a PostalAddress")
+    elif isinstance(address, dict) and "PostalAddress" not in node_types(address) and "@id" not in address:
+        report(ERROR, "address is not a PostalAddress")
+
+
+STRUCTURE_CHECKS: dict[str, Callable[[dict[str, Any], Report], None]] = {
+    "FAQPage": _check_faq,
+    "Question": _check_question,
+    "BreadcrumbList": _check_breadcrumbs,
+    "LocalBusiness": _check_business,
+}
+
+
+# ---------------------------------------------------------------------------
+# Page / site checks
+# ---------------------------------------------------------------------------
+
+
+def _check_node(node: dict[str, Any], types: tuple[str, ...], report: Report, *, nested: bool = False) -> None:
+    seen: set[str] = set()
+    for type_name in types:
+        for ancestor in type_ancestry(type_name):
+            if ancestor in seen:
+                continue
+            seen.add(ancestor)
+            rule = TYPE_RULES.get(ancestor)
+            if rule is not None:
+                for prop in rule.required:
+                    if not any(_present(node, p) for p in prop.split("|")):
+                        report(ERROR, f"{ancestor} requires {prop.replace('|', ' or ')}")
+                for prop in () if nested else rule.recommended:
+                    if not any(_present(node, p) for p in prop.split("|")):
+                        report(WARNING, f"{ancestor} should have {prop.replace('|', ' or ')}")
+            check = STRUCTURE_CHECKS.get(ancestor)
+            if check is not None:
+                check(node, report)
+
+    for prop in DATE_PROPERTIES:
+        value = node.get(prop)
+        if value is not None and not (isinstance(value, str) and _parse_date(value)):
+            report(ERROR, f"{prop} is not an ISO 8601 date: {value!r}")
+    for prop in URL_PROPERTIES:
+        for url in _urls(node.get(prop)):
+            if not url.startswith(("https://", "http://")):
+                report(ERROR, f"{prop} is not an absolute URL: {url!r}")
+
+
+def check_page(page: str, text: str) -> PageReport:
+    """Validate every JSON-LD block of one page (*page* is its name in the report)."""
+    result = PageReport(page=page)
+
+    def walk(value: Any, path: str, block: int, nested: bool = False) -> None:
+        if isinstance(value, list):
+            for i, item in enumerate(value):
+                walk(item, f"{path}[{i}]", block, nested)
+            return
+        if not isinstance(value, dict):
+            return
+        node_id = value.get("@id")
+        types = node_types(value)
+        location = f"#{block} {path or '(root)'}"
+
+        def report(severity: str, message: str) -> None:
+            result.issues.append(Issue(severity, page, location, message))
+
+        if "@type" in value and len(types) != len(_as_list(value["@type"])):
+            report(ERROR, "@type must be a string or a list of strings")
+        if node_id is not None and not isinstance(node_id, str):
+            report(ERROR, "@id must be a string")
+            node_id = None
+        if types:
+            result.nodes += 1
+            result.types.update(types)
+            if not (nested and node_id):
+                _check_node(value, types, report, nested=nested)
+            if node_id:
+                name = value.get("name") if isinstance(value.get("name"), str) else None
+                previous = result.declared.get(node_id)
+                if previous is not None and not compatible_types(previous[0], types):
+                    report(ERROR, f"@id {node_id} is declared as {'/'.join(previous[0])} and {'/'.join(types)}")
+                result.declared[node_id] = (tuple(sorted(types)), name or (previous[1] if previous else None))
+        elif node_id and set(value) == {"@id"}:
+            result.referenced.add(node_id)
+        for key, child in value.items():
+            if key == "@graph":
+                walk(child, f"{path}.{key}" if path else key, block)
+            elif not key.startswith("@"):
+                walk(child, f"{path}.{key}" if path else key, block, nested=True)
+
+    for block, raw in enumerate(JSONLD_RE.findall(text), start=1):
+        result.blocks += 1
+        try:
+            data = json.loads(raw)
+        except ValueError as exc:
+            result.issues.append(Issue(ERROR, page, f"#{block}", f"invalid JSON: {exc}"))
+            continue
+        for i, doc in enumerate(_as_list(data)):
+            prefix = f"[{i}]" if isinstance(data, list) else ""
+            if not isinstance(doc, dict):
+                result.issues.append(Issue(ERROR, page, f"#{block} {prefix or '(root)'}", "JSON-LD document is not an object"))
+                continue
+            if doc.get("@context") not in SCHEMA_CONTEXTS:
+                result.issues.append(
+                    Issue(ERROR, page, f"#{block} {prefix or '(root)'}", f"@context is not schema.org: {doc.get('@context')!r}")
+                )
+            walk(doc, prefix, block)
+    return result
+
+
+def check_site(pages: Iterable[PageReport]) -> list[Issue]:
+    """Cross-page @id checks over the per-page reports."""
+    declared: dict[str, list[tuple[str, tuple[str, ...], str | None]]] = {}
+    referenced: dict[str, str] = {}
+    for report in pages:
+        for node_id, (types, name) in report.declared.items():
+            declared.setdefault(node_id, []).append((report.page, types, name))
+        for node_id in report.referenced:
+            referenced.setdefault(node_id, report.page)
+
+    issues: list[Issue] = []
+    for node_id, uses in sorted(declared.items()):
+        first_page, first_types, _ = uses[0]
+        for page, types, _ in uses[1:]:
+            if not compatible_types(first_types, types):
+                issues.append(
+                    Issue(
+                        ERROR,
+                        page,
+                        node_id,
+                        f"declared as {'/'.join(types)} here but {'/'.join(first_types)} on {first_page}",
+                    )
+                )
+        names = {name for _, _, name in uses if name}
+        if len(names) > 1:
+            pages_by_name = {name: next(page for page, _, n in uses if n == name) for name in sorted(names)}
+            detail = "; ".join(f"{name!r} on {page}" for name, page in pages_by_name.items())
+            issues.append(Issue(ERROR, first_page, node_id, f"declared with different names: {detail}"))
+    for node_id, page in sorted(referenced.items()):
+        if node_id not in declared:
+            issues.append(Issue(WARNING, page, node_id, "referenced but not declared on any page"))
+    return issues
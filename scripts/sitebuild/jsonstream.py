@@ -0,0 +1,141 @@
+"""
+Incremental readers for JSON record files (post manifests and WP exports).
+
+iter_records() yields the objects of a file one at a time instead of loading
+the whole document:
+
+- JSON Lines (.jsonl / .ndjson): one record per line; blank lines are skipped.
+- A JSON array (anything else): the file is read in chunks and each element
+  is decoded with JSONDecoder.raw_decode as soon as it is complete, so only
+  the current record and one chunk are held in memory.
+
+write_records() is the matching writer: it streams records to a temp file
+(a JSON array formatted exactly like json.dumps(records, indent=2), or JSON
+Lines) and moves it into place, so a manifest can be rewritten while it is
+being read. batched() groups any record stream into fixed-size lists for
+stages that work page by page.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+CHUNK_SIZE = 1 << 16
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+_WHITESPACE = " \t\r\n"
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+def _iter_jsonl(path: Path) -> Iterator[Any]:
+    with open(path, encoding="utf-8") as fh:
+        for lineno, line in enumerate(fh, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                raise ValueError(f"{path}:{lineno}: {exc}") from None
+
+
+def _iter_array(path: Path, chunk_size: int) -> Iterator[Any]:
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8-sig") as fh:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def fill() -> None:
+            nonlocal buf, pos, eof
+            chunk = fh.read(chunk_size)
+            if not chunk:
+                eof = True
+            buf = buf[pos:] + chunk
+            pos = 0
+
+        def skip_whitespace() -> None:
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in _WHITESPACE:
+                    pos += 1
+                if pos < len(buf) or eof:
+                    return
+                fill()
+
+        skip_whitespace()
+        if pos >= len(buf) or buf[pos] != "[":
+            raise ValueError(f"{path}: expected a JSON array or JSON Lines")
+        pos += 1
+        first = expect_value = True
+        while True:
+            skip_whitespace()
+            if pos >= len(buf):
+                raise ValueError(f"{path}: unterminated JSON array")
+            if buf[pos] == "]":
+                if expect_value and not first:
+                    raise ValueError(f"{path}: trailing ',' in JSON array")
+                return
+            if not expect_value:
+                if buf[pos] != ",":
+                    raise ValueError(f"{path}: expected ',' or ']' in JSON array")
+                pos += 1
+                expect_value = True
+                continue
+            # Decode the next element, reading more until it is complete. A
+            # number cut off by the chunk boundary ("12" of "123", "-3." of
+            # "-3.5") still decodes, so a value only counts once a delimiter
+            # (or EOF) follows it.
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except ValueError:
+                    if eof:
+                        raise ValueError(f"{path}: invalid JSON near offset {pos}") from None
+                    fill()
+                    continue
+                if not eof and (end == len(buf) or buf[end] not in _DELIMITERS):
+                    fill()
+                    continue
+                break
+            pos = end
+            first = expect_value = False
+            yield value
+
+
+def iter_records(path: Path, *, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the records of a JSON array or JSON Lines file one at a time."""
+    path = Path(path)
+    if path.suffix.lower() in JSONL_SUFFIXES:
+        return _iter_jsonl(path)
+    return _iter_array(path, chunk_size)
+
+
+def write_records(path: Path, records: Iterable[Any]) -> int:
+    """Write *records* to *path* (JSON Lines by suffix, else an indented array); returns the count."""
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    count = 0
+    jsonl = path.suffix.lower() in JSONL_SUFFIXES
+    with open(tmp, "w", encoding="utf-8") as fh:
+        for record in records:
+            if jsonl:
+                fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+            else:
+                text = json.dumps(record, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+                fh.write(("[\n  " if count == 0 else ",\n  ") + text)
+            count += 1
+        if not jsonl:
+            fh.write("\n]\n" if count else "[]\n")
+    os.replace(tmp, path)
+    return count
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
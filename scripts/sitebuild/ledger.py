@@ -0,0 +1,147 @@
+"""
+SQLite ledger of IndexNow submissions (.build-cache/indexnow.sqlite3).
+
+One row per URL records the content hash of the current build, the hash that
+was last accepted by the endpoint, when that happened, and the status of the
+most recent attempt. A URL is pending while its current hash differs from its
+submitted hash, so reruns never resubmit unchanged pages and a failed batch
+stays pending until a later run (e.g. `indexnow-submit.py --drain`) gets it
+through. Every POST is also logged per endpoint host, which is what the rate
+limiter counts against.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from sitebuild.buildcache import CACHE_DIR
+
+LEDGER_PATH = CACHE_DIR / "indexnow.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY,
+    content_hash TEXT,
+    submitted_hash TEXT,
+    last_submitted_at REAL,
+    last_attempt_at REAL,
+    last_status INTEGER,
+    attempts INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS posts (
+    host TEXT NOT NULL,
+    posted_at REAL NOT NULL,
+    url_count INTEGER NOT NULL,
+    status INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS posts_host_time ON posts (host, posted_at);
+"""
+
+PENDING_WHERE = "content_hash IS NOT NULL AND (submitted_hash IS NULL OR submitted_hash != content_hash)"
+
+
+@dataclass(frozen=True)
+class PendingUrl:
+    url: str
+    last_status: int | None
+    last_attempt_at: float | None
+    attempts: int
+
+
+class Ledger:
+    def __init__(self, path: Path = LEDGER_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def record_hashes(self, hashes: dict[str, str]) -> None:
+        """Store the current build's content hash for each URL.
+
+        URLs missing from this build lose their hash, so pages that were
+        removed before they could be submitted drop out of the pending set.
+        """
+        known = {row[0] for row in self.conn.execute("SELECT url FROM urls WHERE content_hash IS NOT NULL")}
+        gone = [(url,) for url in known - hashes.keys()]
+        with self.conn:
+            self.conn.executemany("UPDATE urls SET content_hash = NULL WHERE url = ?", gone)
+            self.conn.executemany(
+                "INSERT INTO urls (url, content_hash) VALUES (?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET content_hash = excluded.content_hash",
+                hashes.items(),
+            )
+
+    def submitted_hashes(self) -> dict[str, str]:
+        rows = self.conn.execute("SELECT url, submitted_hash FROM urls WHERE submitted_hash IS NOT NULL")
+        return dict(rows.fetchall())
+
+    def pending(self) -> list[PendingUrl]:
+        rows = self.conn.execute(
+            f"SELECT url, last_status, last_attempt_at, attempts FROM urls WHERE {PENDING_WHERE} ORDER BY url"
+        ).fetchall()
+        return [PendingUrl(*row) for row in rows]
+
+    def record_result(self, urls: Iterable[str], status: int, *, accepted: bool) -> None:
+        """Record one POST's outcome for its URLs (committed immediately)."""
+        now = time.time()
+        rows = [(url,) for url in urls]
+        with self.conn:
+            # URLs submitted by hand may not have a row yet.
+            self.conn.executemany("INSERT OR IGNORE INTO urls (url) VALUES (?)", rows)
+            if accepted:
+                self.conn.executemany(
+                    "UPDATE urls SET submitted_hash = content_hash, last_submitted_at = ?, "
+                    "last_attempt_at = ?, last_status = ?, attempts = 0 WHERE url = ?",
+                    [(now, now, status, url) for (url,) in rows],
+                )
+            else:
+                self.conn.executemany(
+                    "UPDATE urls SET last_attempt_at = ?, last_status = ?, attempts = attempts + 1 WHERE url = ?",
+                    [(now, status, url) for (url,) in rows],
+                )
+
+    def log_post(self, host: str, url_count: int, status: int) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO posts (host, posted_at, url_count, status) VALUES (?, ?, ?, ?)",
+                (host, time.time(), url_count, status),
+            )
+
+    def posts_since(self, host: str, since: float) -> list[float]:
+        rows = self.conn.execute(
+            "SELECT posted_at FROM posts WHERE host = ? AND posted_at >= ? ORDER BY posted_at", (host, since)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+
+class RateLimiter:
+    """Allow at most *limit* POSTs per *window* seconds to one host, across runs."""
+
+    def __init__(self, ledger: Ledger, host: str, limit: int, window: float = 60.0) -> None:
+        self.ledger = ledger
+        self.host = host
+        self.limit = limit
+        self.window = window
+
+    def record(self, url_count: int, status: int) -> None:
+        self.ledger.log_post(self.host, url_count, status)
+
+    def wait(self) -> float:
+        """Sleep until another POST is allowed; returns the seconds waited."""
+        if self.limit <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            now = time.time()
+            recent = self.ledger.posts_since(self.host, now - self.window)
+            if len(recent) < self.limit:
+                return waited
+            delay = recent[-self.limit] + self.window - now
+            time.sleep(max(delay, 0.05))
+            waited += max(delay, 0.05)
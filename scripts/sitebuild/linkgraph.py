@@ -0,0 +1,316 @@
+"""
+Internal link graph of the public site.
+
+The QA engine already extracts every URL of every page in its single parse
+pass (and caches them per page), so the graph is built in memory from the
+per-page results: each <a>/<area> href that stays on the site (relative,
+root-relative or on CANONICAL_ORIGIN) is resolved the way Vercel would serve
+it:
+
+1. the redirect table compiled from vercel.json (exact sources in a dict,
+   path-to-regexp sources such as /category/:path* as compiled patterns),
+   followed hop by hop so chains and loops are visible;
+2. the rewrites in vercel.json;
+3. the page inventory: /route/ -> route/index.html, files by path (with the
+   trailing-slash redirect Vercel adds for /route -> /route/).
+
+Anything else is a broken link. The graph keeps every page's outgoing
+links and the number of distinct pages linking to each page, from which the
+link checks (sitebuild.checks.links) report orphans.
+"""
+
+from __future__ import annotations
+
+import json
+import posixpath
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+from urllib.parse import unquote, urlsplit
+
+from sitebuild import BASE_DIR, CANONICAL_ORIGIN, inventory
+from sitebuild.qa import file_exists, local_target
+
+VERCEL_JSON = BASE_DIR / "vercel.json"
+MAX_HOPS = 10
+LINK_TAGS = {"a", "area"}
+
+# Resolution kinds.
+PAGE = "page"
+FILE = "file"
+EXTERNAL = "external"
+BROKEN = "broken"
+LOOP = "loop"
+
+_PARAM_RE = re.compile(r":(?P<name>[A-Za-z_]\w*)(?:\((?P<regex>[^)]*)\))?(?P<mod>[*+?])?")
+_SITE_HOST = urlsplit(CANONICAL_ORIGIN).netloc.lower()
+_SITE_HOSTS = {_SITE_HOST, _SITE_HOST[4:] if _SITE_HOST.startswith("www.") else f"www.{_SITE_HOST}"}
+
+
+def _strip_slash(path: str) -> str:
+    return path.rstrip("/") or "/"
+
+
+def _compile_source(source: str) -> re.Pattern[str]:
+    """path-to-regexp source (/a/:slug, /b/:path*, /c/:n(\\d+)) -> regex matching a path."""
+    parts: list[str] = []
+    pos = 0
+    for m in _PARAM_RE.finditer(source):
+        parts.append(re.escape(source[pos : m.start()]))
+        name, regex, mod = m.group("name"), m.group("regex"), m.group("mod")
+        if mod in ("*", "+"):
+            body = f"(?P<{name}>.{mod})"
+            # "/x/:path*" also matches "/x"
+            if mod == "*" and parts and parts[-1].endswith("/"):
+                parts[-1] = parts[-1][:-1]
+                body = f"(?:/(?P<{name}>.*))?"
+        else:
+            body = f"(?P<{name}>{regex or '[^/]+'})"
+            if mod == "?":
+                body += "?"
+        parts.append(body)
+        pos = m.end()
+    parts.append(re.escape(source[pos:].rstrip("/")))
+    return re.compile("".join(parts) + "/?")
+
+
+@dataclass(frozen=True)
+class Redirect:
+    source: str
+    destination: str
+    pattern: re.Pattern[str] | None = None  # None for exact sources
+
+    def apply(self, m: re.Match[str] | None) -> str:
+        if m is None:
+            return self.destination
+        params = {k: v or "" for k, v in m.groupdict().items()}
+        return _PARAM_RE.sub(lambda p: params.get(p.group("name"), p.group(0)), self.destination)
+
+
+class RedirectTable:
+    """vercel.json redirects and rewrites, compiled for lookups by path."""
+
+    def __init__(self, redirects: Iterable[Mapping[str, Any]], rewrites: Iterable[Mapping[str, Any]] = ()) -> None:
+        self.redirects: list[Redirect] = []
+        self.exact: dict[str, Redirect] = {}
+        self.patterns: list[Redirect] = []
+        for r in redirects:
+            source, destination = r.get("source"), r.get("destination")
+            if not isinstance(source, str) or not isinstance(destination, str) or r.get("has"):
+                continue
+            if _PARAM_RE.search(source) or "(" in source:
+                redirect = Redirect(source, destination, _compile_source(source))
+                self.patterns.append(redirect)
+            else:
+                redirect = Redirect(source, destination)
+                self.exact.setdefault(_strip_slash(source), redirect)
+            self.redirects.append(redirect)
+        self.rewrites = [
+            _compile_source(r["source"]) for r in rewrites if isinstance(r.get("source"), str)
+        ]
+
+    @classmethod
+    def load(cls, path: Path = VERCEL_JSON) -> "RedirectTable":
+        if not path.exists():
+            return cls([])
+        cfg = json.loads(path.read_text(encoding="utf-8"))
+        return cls(
+            [r for r in cfg.get("redirects", []) if isinstance(r, dict)],
+            [r for r in cfg.get("rewrites", []) if isinstance(r, dict)],
+        )
+
+    def lookup(self, path: str) -> tuple[Redirect, str] | None:
+        """(matching redirect, destination) for a URL path, or None."""
+        exact = self.exact.get(_strip_slash(path))
+        if exact is not None:
+            return exact, exact.destination
+        for redirect in self.patterns:
+            m = redirect.pattern.fullmatch(path) if redirect.pattern else None
+            if m:
+                return redirect, redirect.apply(m)
+        return None
+
+    def is_rewritten(self, path: str) -> bool:
+        return any(p.fullmatch(path) for p in self.rewrites)
+
+
+@dataclass(frozen=True)
+class Resolution:
+    kind: str  # PAGE, FILE, EXTERNAL, BROKEN or LOOP
+    target: str  # final page/file rel, external URL, or the unresolved path
+    hops: tuple[str, ...] = ()  # redirect sources followed, in order
+
+    @property
+    def ok(self) -> bool:
+        return self.kind in (PAGE, FILE, EXTERNAL)
+
+
+def internal_path(rel: str, url: str) -> str | None:
+    """URL path an on-site link points at (from page *rel*); None for external/non-page URLs."""
+    url = url.strip()
+    parts = urlsplit(url)
+    if parts.scheme in ("http", "https"):
+        if parts.netloc.lower() not in _SITE_HOSTS:
+            return None
+        return unquote(parts.path) or "/"
+    if parts.scheme or parts.netloc or url.startswith(("#", "//")):
+        return None
+    path = unquote(parts.path)
+    if not path:
+        return None
+    if path.startswith("/"):
+        return path
+    target = local_target(rel, path)
+    return None if target is None else f"/{target}"
+
+
+class Resolver:
+    def __init__(self, inv: inventory.Inventory, redirects: RedirectTable) -> None:
+        self.inv = inv
+        self.redirects = redirects
+        self._memo: dict[str, Resolution] = {}
+
+    def serve(self, path: str) -> Resolution | None:
+        """What the filesystem (and rewrites) serve for *path*, without redirects."""
+        rel = path.lstrip("/")
+        entry = self.inv.get(rel)
+        if path.endswith("/"):
+            index = inventory.rel_for_url_path(path)
+            if index in self.inv:
+                return Resolution(PAGE, index)
+        elif entry is not None:
+            return Resolution(PAGE if entry.kind == inventory.PUBLIC else FILE, rel)
+        elif inventory.rel_for_url_path(path + "/") in self.inv:
+            return Resolution(PAGE, inventory.rel_for_url_path(path + "/"))
+        elif rel and file_exists(rel):
+            return Resolution(FILE, rel)
+        if self.redirects.is_rewritten(path) or (rel.startswith("api/") and (BASE_DIR / f"{rel}.js").is_file()):
+            return Resolution(FILE, rel)
+        return None
+
+    def resolve(self, path: str) -> Resolution:
+        """Follow redirects from *path* to a page, file, external URL, or a dead end."""
+        cached = self._memo.get(path)
+        if cached is not None:
+            return cached
+        hops: list[str] = []
+        seen: set[str] = set()
+        current = path
+        while True:
+            key = _strip_slash(current)
+            if key in seen or len(hops) > MAX_HOPS:
+                result = Resolution(LOOP, current, tuple(hops))
+                break
+            seen.add(key)
+            found = self.redirects.lookup(current)
+            if found is None:
+                served = self.serve(current)
+                result = (
+                    Resolution(served.kind, served.target, tuple(hops))
+                    if served
+                    else Resolution(BROKEN, current, tuple(hops))
+                )
+                break
+            redirect, destination = found
+            hops.append(redirect.source)
+            parts = urlsplit(destination)
+            if parts.scheme and parts.netloc.lower() not in _SITE_HOSTS:
+                result = Resolution(EXTERNAL, destination, tuple(hops))
+                break
+            current = unquote(parts.path) or "/"
+        self._memo[path] = result
+        return result
+
+
+@dataclass(frozen=True)
+class Edge:
+    url: str  # as written in the page
+    path: str  # URL path it points at
+    resolution: Resolution
+
+
+@dataclass
+class LinkGraph:
+    pages: list[str]
+    edges: dict[str, list[Edge]] = field(default_factory=dict)
+    inbound: Counter[str] = field(default_factory=Counter)  # page -> distinct pages linking to it
+
+    def _distinct(self, wanted: Callable[[Resolution], bool]) -> Iterable[tuple[str, Edge]]:
+        """(page, edge) for matching links, once per page and URL as written."""
+        for rel, edges in self.edges.items():
+            seen: set[str] = set()
+            for edge in edges:
+                if edge.url not in seen and wanted(edge.resolution):
+                    seen.add(edge.url)
+                    yield rel, edge
+
+    def broken(self) -> Iterable[tuple[str, Edge]]:
+        return self._distinct(lambda r: not r.ok)
+
+    def redirected(self) -> Iterable[tuple[str, Edge]]:
+        return self._distinct(lambda r: r.ok and bool(r.hops))
+
+    def orphans(self, exempt: Iterable[str] = ()) -> list[str]:
+        skip = set(exempt)
+        return [rel for rel in self.pages if not self.inbound[rel] and rel not in skip]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "pages": len(self.pages),
+            "links": sum(len(edges) for edges in self.edges.values()),
+            "inbound": {rel: self.inbound[rel] for rel in self.pages},
+            "outbound": {
+                rel: sorted({e.resolution.target for e in edges if e.resolution.kind == PAGE})
+                for rel, edges in self.edges.items()
+            },
+        }
+
+
+def build(
+    page_links: Mapping[str, Iterable[tuple[str, str, str]]],
+    resolver: Resolver,
+) -> LinkGraph:
+    """Graph over *page_links* (page rel -> (tag, attr, url) links, e.g. QA PageResult.links)."""
+    graph = LinkGraph(pages=list(page_links))
+    # Most links (nav, footer, CTAs) repeat on every page: resolve each
+    # distinct URL once, keyed by the page's folder only for relative URLs.
+    memo: dict[tuple[str, str], Edge | None] = {}
+    for rel, links in page_links.items():
+        folder = posixpath.dirname(rel)
+        edges: list[Edge] = []
+        targets: set[str] = set()
+        for tag, _attr, url in links:
+            if tag not in LINK_TAGS:
+                continue
+            key = ("", url) if url.startswith(("/", "http")) else (folder, url)
+            if key in memo:
+                edge = memo[key]
+            else:
+                path = internal_path(rel, url)
+                edge = memo[key] = None if path is None else Edge(url, path, resolver.resolve(path))
+            if edge is None:
+                continue
+            edges.append(edge)
+            if edge.resolution.kind == PAGE and edge.resolution.target != rel:
+                targets.add(edge.resolution.target)
+        graph.edges[rel] = edges
+        graph.inbound.update(targets)
+    return graph
+
+
+def chains(resolver: Resolver) -> Iterable[tuple[Redirect, Resolution]]:
+    """Exact redirects whose destination redirects again, loops, or goes nowhere."""
+    for redirect in resolver.redirects.exact.values():
+        resolution = resolver.resolve(redirect.source)
+        if resolution.kind == LOOP or len(resolution.hops) > 1 or resolution.kind == BROKEN:
+            yield redirect, resolution
+
+
+def shadowed(resolver: Resolver) -> Iterable[tuple[Redirect, str]]:
+    """Exact redirects whose source is also a page; Vercel redirects first, so the page is unreachable."""
+    for redirect in resolver.redirects.exact.values():
+        served = resolver.serve(redirect.source)
+        if served is not None and served.kind == PAGE:
+            yield redirect, served.target
@@ -0,0 +1,69 @@
+"""
+Process-pool execution for per-file page work.
+
+Scripts add a shared `--jobs N` option via add_jobs_argument() and hand their
+per-file function to map_ordered(). Work is sent to a ProcessPoolExecutor in
+chunked batches and results come back in input order, so logs and summaries
+printed by the caller are identical to a serial run. `--jobs 1` (or a small
+input) runs everything in-process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Below this many items per worker, process start-up costs more than it saves.
+MIN_ITEMS_PER_JOB = 16
+
+
+def add_jobs_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker processes for per-page work (0 = one per CPU, 1 = serial; default: %(default)s).",
+    )
+
+
+def effective_jobs(requested: int, n_items: int) -> int:
+    jobs = requested if requested > 0 else (os.cpu_count() or 1)
+    return max(1, min(jobs, n_items // MIN_ITEMS_PER_JOB))
+
+
+def map_ordered(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    jobs: int = 0,
+    chunksize: int | None = None,
+    initializer: Callable[..., Any] | None = None,
+    initargs: Sequence[Any] = (),
+) -> list[R]:
+    """Apply *func* to every item, in parallel when worthwhile, preserving order.
+
+    *func* and *initializer* must be module-level functions so they can be
+    pickled by reference. *initializer* runs once per worker (or once in-process
+    for serial runs) and is the place to set up large shared inputs instead of
+    shipping them with every item.
+    """
+    items = list(items)
+    if not items:
+        return []
+    workers = effective_jobs(jobs, len(items))
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        return [func(item) for item in items]
+
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(items) / (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=tuple(initargs)) as pool:
+        return list(pool.map(func, items, chunksize=chunksize))
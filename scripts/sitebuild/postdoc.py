@@ -0,0 +1,200 @@
+"""
+Parse-once document model for imported WordPress posts.
+
+A PostDocument holds one parsed tree of a post's content. Every per-post pass
+(URL rewriting, upload-path collection, plain text, FAQ extraction, word
+count) is a Visitor, and visit() feeds all of them from a single walk over
+the tree; the content is serialized exactly once, by html(), after the
+mutating visitors have run.
+
+    doc = PostDocument.parse(rendered)
+    rewrite, uploads, text, faq = RewriteUrls(hosts), CollectUploads(), PlainText(), FaqExtractor()
+    doc.visit(rewrite, uploads, text, faq)
+    content_html = doc.html()
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Callable
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+ROOT_ID = "__cvc_root__"
+
+URL_ATTRS = ("href", "src", "data-src", "data-lazy-src")
+UPLOADS_MARKER = "/wp-content/uploads/"
+
+HEADING_RE = re.compile(r"^h([1-6])$")
+FAQ_HEADING_RE = re.compile(r"\b(faqs?|frequently asked questions)\b", re.IGNORECASE)
+
+
+class Visitor:
+    """Base class: override the hooks a pass needs."""
+
+    def element(self, el: Tag) -> None:
+        pass
+
+    def text(self, node: NavigableString) -> None:
+        pass
+
+    def finish(self) -> None:
+        """Called once after the walk."""
+
+
+class PostDocument:
+    def __init__(self, soup: BeautifulSoup, root: Tag) -> None:
+        self.soup = soup
+        self.root = root
+
+    @classmethod
+    def parse(cls, html_fragment: str) -> "PostDocument":
+        # Parse as a fragment by wrapping it in a root container.
+        soup = BeautifulSoup(f'<div id="{ROOT_ID}">{html_fragment}</div>', "lxml")
+        root = soup.find(id=ROOT_ID)
+        if root is None:
+            root = soup.new_tag("div")
+        return cls(soup, root)
+
+    def visit(self, *visitors: Visitor) -> None:
+        """Run every visitor over the tree in one document-order walk."""
+        for node in list(self.root.descendants):
+            if isinstance(node, Tag):
+                for visitor in visitors:
+                    visitor.element(node)
+            elif type(node) is NavigableString or isinstance(node, CData):
+                for visitor in visitors:
+                    visitor.text(node)
+        for visitor in visitors:
+            visitor.finish()
+
+    def html(self) -> str:
+        return self.root.decode_contents().strip()
+
+
+def srcset_urls(srcset: str) -> list[list[str]]:
+    """Candidates of a srcset value, each split into [url, descriptor...]."""
+    return [part.split() for part in (p.strip() for p in srcset.split(",")) if part]
+
+
+class RewriteUrls(Visitor):
+    """Rewrite links/sources on the WordPress origin hosts to root-relative."""
+
+    def __init__(self, rewrite: Callable[[str], str | None]) -> None:
+        self.rewrite = rewrite
+
+    def element(self, el: Tag) -> None:
+        for attr in URL_ATTRS:
+            if not el.has_attr(attr):
+                continue
+            rewritten = self.rewrite(str(el.get(attr)))
+            if rewritten:
+                el[attr] = rewritten
+
+        if el.has_attr("srcset"):
+            srcset = str(el.get("srcset") or "")
+            if not srcset.strip():
+                return
+            parts_out: list[str] = []
+            for tokens in srcset_urls(srcset):
+                rewritten = self.rewrite(tokens[0])
+                if rewritten:
+                    tokens[0] = rewritten
+                parts_out.append(" ".join(tokens))
+            el["srcset"] = ", ".join(parts_out)
+
+
+def upload_relpath(url: str) -> str:
+    return url.split(UPLOADS_MARKER, 1)[1].split("?", 1)[0].split("#", 1)[0]
+
+
+class CollectUploads(Visitor):
+    """Relative paths under /wp-content/uploads/ referenced by the content."""
+
+    def __init__(self) -> None:
+        self.paths: set[str] = set()
+
+    def element(self, el: Tag) -> None:
+        for attr in (*URL_ATTRS, "srcset"):
+            value = str(el.get(attr) or "") if el.has_attr(attr) else ""
+            if not value:
+                continue
+            if attr == "srcset":
+                for tokens in srcset_urls(value):
+                    if UPLOADS_MARKER in tokens[0]:
+                        self.paths.add(upload_relpath(tokens[0]))
+            elif UPLOADS_MARKER in value:
+                self.paths.add(upload_relpath(value))
+
+
+class PlainText(Visitor):
+    """Visible text, whitespace-normalized (like get_text(" ", strip=True))."""
+
+    def __init__(self) -> None:
+        self.parts: list[str] = []
+
+    def text(self, node: NavigableString) -> None:
+        value = str(node).strip()
+        if value:
+            self.parts.append(value)
+
+    @property
+    def value(self) -> str:
+        return " ".join(self.parts)
+
+
+class WordCount(Visitor):
+    def __init__(self) -> None:
+        self.count = 0
+
+    def text(self, node: NavigableString) -> None:
+        self.count += len(str(node).split())
+
+
+class FaqExtractor(Visitor):
+    """Question/answer pairs from an FAQ section of the content.
+
+    The section starts at a heading mentioning FAQs; each following heading
+    that ends in "?" opens a question whose answer is the text up to the next
+    heading. A non-question heading at the FAQ heading's level or above ends
+    the section.
+    """
+
+    def __init__(self) -> None:
+        self.items: list[tuple[str, str]] = []
+        self._level: int | None = None
+        self._question: str | None = None
+        self._answer: list[str] = []
+        self._heading: Tag | None = None
+
+    def element(self, el: Tag) -> None:
+        match = HEADING_RE.match(el.name or "")
+        if not match:
+            return
+        self._close()
+        self._heading = el
+        level = int(match.group(1))
+        title = " ".join(el.get_text(" ", strip=True).split())
+        if self._level is None:
+            if FAQ_HEADING_RE.search(title):
+                self._level = level
+        elif title.endswith("?"):
+            self._question = title
+        elif level <= self._level:
+            self._level = None
+
+    def text(self, node: NavigableString) -> None:
+        if self._question is None or any(parent is self._heading for parent in node.parents):
+            return
+        value = str(node).strip()
+        if value:
+            self._answer.append(value)
+
+    def finish(self) -> None:
+        self._close()
+
+    def _close(self) -> None:
+        if self._question and self._answer:
+            self.items.append((self._question, " ".join(" ".join(self._answer).split())))
+        self._question = None
+        self._answer = []
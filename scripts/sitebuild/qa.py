@@ -0,0 +1,617 @@
+"""
+Single-pass QA engine for the static site.
+
+Every page any selected rule applies to is read once and parsed once into a
+QaPage: the raw text, head metadata (title, meta description, canonical),
+the <h1> count and every URL it references (links, stylesheets, scripts,
+images incl. srcset, og:/twitter: images, JSON-LD URLs, CSS url()). Page rules registered
+in sitebuild.checks receive that parsed page and return messages; adding a
+rule adds no I/O, and existence checks go through the asset index
+(sitebuild.assets) instead of the filesystem. Site checks run
+afterwards on the per-page results (links included) and on site-level files
+such as vercel.json.
+
+Results are cached per page in .build-cache/qa.json: the page's content
+hash, its parsed links and metadata, and for each rule the rule key (name,
+version and a hash of the module and any data file that define it) with the
+messages it produced and the files it looked up through QaPage.exists(). A
+page whose size and mtime are unchanged is not even read; an edited page is
+re-checked, and so is any page whose rule depended on a file that has since
+appeared or disappeared (e.g. a deleted image). Site checks always run, on the cached
+per-page results, so a run over an unchanged tree costs one stat per page.
+
+All findings land in one QaReport, written as JSON and Markdown by
+scripts/run-qa.py. The older QA scripts (generate-go-live-qa-report.py,
+blog-writer-qa.py, verify-feedback-2026-02-09.py) run their own rule group
+through the engine and keep their existing output formats.
+"""
+
+from __future__ import annotations
+
+import html
+import posixpath
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from functools import lru_cache
+from typing import Any, Callable, Collection, Iterable, NamedTuple
+from urllib.parse import unquote, urlsplit
+
+from sitebuild import BASE_DIR, assets, inventory
+from sitebuild.buildcache import FileStamp, JsonCache, sha256_bytes, sha256_text
+from sitebuild.parallel import map_ordered
+
+PUBLIC = inventory.PUBLIC
+SOURCE = inventory.SOURCE
+ASSET = inventory.ASSET
+
+ERROR = "error"
+WARNING = "warning"
+
+# Tags whose URL attributes (or text, for <title>) QA looks at.
+TAG_RE = re.compile(r"<(?P<tag>a|area|link|img|source|script|iframe|meta|title|h1)\b(?P<attrs>[^>]*)>", re.IGNORECASE)
+ATTR_RE = re.compile(r"""([a-zA-Z_:][-\w:.]*)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))""")
+TITLE_END_RE = re.compile(r"</title\s*>", re.IGNORECASE)
+URL_ATTRS = {
+    "a": ("href",),
+    "area": ("href",),
+    "link": ("href",),
+    "img": ("src", "srcset"),
+    "source": ("src", "srcset"),
+    "script": ("src",),
+    "iframe": ("src",),
+}
+IMAGE_TAGS = {"img", "source"}
+# <meta> tags whose content is an image URL (social previews).
+META_IMAGE_NAMES = {"og:image", "og:image:url", "og:image:secure_url", "twitter:image"}
+# URL-valued strings in JSON-LD blocks (logo, image, ...).
+JSONLD_URL_RE = re.compile(r'"((?:https?://|/)[^"\s]+)"')
+SCRIPT_END_RE = re.compile(r"</script\s*>", re.IGNORECASE)
+# url(...) in <style> blocks, style="" attributes and stylesheets.
+CSS_URL_RE = re.compile(r"""url\(\s*(?:"([^"]*)"|'([^']*)'|([^)"'\s]*))\s*\)""", re.IGNORECASE)
+NON_LOCAL_PREFIXES = ("//", "data:", "mailto:", "tel:", "sms:", "javascript:", "#")
+
+CACHE_VERSION = 1
+
+
+# ---------------------------------------------------------------------------
+# Parsed pages
+# ---------------------------------------------------------------------------
+
+
+class Link(NamedTuple):
+    tag: str  # "style" for CSS url() references
+    attr: str  # href, src, srcset, content (meta images), ld+json or url (CSS)
+    url: str
+
+
+def _attrs(raw: str) -> dict[str, str]:
+    found: dict[str, str] = {}
+    for m in ATTR_RE.finditer(raw):
+        name = m.group(1).lower()
+        if name not in found:
+            value = m.group(2) if m.group(2) is not None else m.group(3) if m.group(3) is not None else m.group(4)
+            found[name] = html.unescape(value) if "&" in value else value
+    return found
+
+
+def _srcset_urls(value: str) -> list[str]:
+    return [part.split()[0] for part in value.split(",") if part.strip()]
+
+
+def local_target(rel: str, url: str) -> str | None:
+    """Repo-relative path a local URL points at (from page *rel*); None for external URLs."""
+    url = url.strip()
+    if not url or url.startswith(NON_LOCAL_PREFIXES):
+        return None
+    parts = urlsplit(url)
+    if parts.scheme or parts.netloc:
+        return None
+    path = unquote(parts.path)
+    if not path:
+        return None
+    target = path.lstrip("/") if path.startswith("/") else posixpath.join(posixpath.dirname(rel), path)
+    if not target:
+        return ""
+    normalized = posixpath.normpath(target)
+    if normalized == ".":
+        return ""
+    return f"{normalized}/" if target.endswith("/") else normalized
+
+
+@dataclass
+class QaPage:
+    rel: str
+    kind: str
+    text: str
+    title: str | None = None
+    meta_description: str | None = None
+    canonical: str | None = None
+    h1_count: int = 0
+    links: list[Link] = field(default_factory=list)
+    # Files looked up through exists() by the rule currently running.
+    deps: dict[str, bool] = field(default_factory=dict)
+    # Derived data several rules share (e.g. one content-rule scan), built once per page.
+    shared: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def path(self) -> Path:
+        return BASE_DIR / self.rel
+
+    @property
+    def url_path(self) -> str | None:
+        return inventory.Entry(self.rel, self.kind).url_path
+
+    @property
+    def images(self) -> list[str]:
+        return [link.url for link in self.links if link.tag in IMAGE_TAGS]
+
+    def local_target(self, url: str) -> str | None:
+        return local_target(self.rel, url)
+
+    def exists(self, rel: str) -> bool:
+        """Whether repo file *rel* exists; recorded so the verdict is redone when that changes."""
+        found = file_exists(rel)
+        self.deps[rel] = found
+        return found
+
+    def get(self, key: str, build: Callable[[], Any]) -> Any:
+        if key not in self.shared:
+            self.shared[key] = build()
+        return self.shared[key]
+
+
+@lru_cache(maxsize=None)
+def file_exists(rel: str) -> bool:
+    if assets.is_asset_path(rel):
+        return assets.load().exists(rel)
+    return (BASE_DIR / rel).is_file()
+
+
+def parse_page(rel: str, kind: str, text: str) -> QaPage:
+    """One scan over the tags QA cares about."""
+    page = QaPage(rel=rel, kind=kind, text=text)
+    for m in TAG_RE.finditer(text):
+        tag = m.group("tag").lower()
+        if tag == "h1":
+            page.h1_count += 1
+            continue
+        if tag == "title":
+            if page.title is None:
+                end = TITLE_END_RE.search(text, m.end())
+                if end:
+                    page.title = html.unescape(text[m.end() : end.start()]).strip()
+            continue
+        attrs = _attrs(m.group("attrs"))
+        if tag == "meta":
+            name = (attrs.get("name") or attrs.get("property") or "").lower()
+            if page.meta_description is None and name == "description":
+                page.meta_description = attrs.get("content", "").strip()
+            elif name in META_IMAGE_NAMES and attrs.get("content", "").strip():
+                page.links.append(Link(tag, "content", attrs["content"].strip()))
+            continue
+        if tag == "script" and "ld+json" in attrs.get("type", "").lower():
+            end = SCRIPT_END_RE.search(text, m.end())
+            body = text[m.end() : end.start() if end else len(text)]
+            page.links.extend(Link(tag, "ld+json", url) for url in JSONLD_URL_RE.findall(body))
+            continue
+        if tag == "link" and page.canonical is None and "canonical" in attrs.get("rel", "").lower().split():
+            page.canonical = attrs.get("href", "").strip()
+        for attr in URL_ATTRS[tag]:
+            value = attrs.get(attr)
+            if value is None:
+                continue
+            if attr == "srcset":
+                page.links.extend(Link(tag, attr, url) for url in _srcset_urls(value))
+            elif value.strip():
+                page.links.append(Link(tag, attr, value.strip()))
+    if "url(" in text:
+        for m in CSS_URL_RE.finditer(text):
+            url = next((g for g in m.groups() if g is not None), "").strip()
+            if url:
+                page.links.append(Link("style", "url", url))
+    return page
+
+
+# ---------------------------------------------------------------------------
+# Rules
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Finding:
+    rule: str
+    page: str  # repo-relative page, or a site file such as vercel.json
+    message: str
+    severity: str = ERROR
+
+    def as_dict(self) -> dict[str, str]:
+        return {"rule": self.rule, "severity": self.severity, "page": self.page, "message": self.message}
+
+
+PageRuleFunc = Callable[[QaPage], Iterable[str]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    func: PageRuleFunc
+    group: str
+    title: str
+    kinds: frozenset[str]
+    # Explicit page list (repo-relative); pages listed but absent are reported.
+    pages: Callable[[], Collection[str]] | None = None
+    severity: str = ERROR
+    version: int = 1
+    predicate: Callable[[str], bool] | None = None  # further filter on the page path
+    # Repo files the rule is defined by besides its module (e.g. a rules data file).
+    inputs: tuple[str, ...] = ()
+
+    def applies_to(self, rel: str, kind: str) -> bool:
+        if kind not in self.kinds:
+            return False
+        if self.predicate is not None and not self.predicate(rel):
+            return False
+        return self.pages is None or rel in self.pages()
+
+
+@dataclass(frozen=True)
+class PageResult:
+    rel: str
+    kind: str
+    findings: tuple[Finding, ...]
+    links: tuple[Link, ...]
+    title: str | None
+    canonical: str | None
+
+
+@dataclass
+class SiteContext:
+    """What site checks see: every checked page's result, by path."""
+
+    results: dict[str, PageResult]
+    # Derived data several checks share (e.g. the link graph), built once per run.
+    shared: dict[str, Any] = field(default_factory=dict)
+
+    def get(self, key: str, build: Callable[[], Any]) -> Any:
+        if key not in self.shared:
+            self.shared[key] = build()
+        return self.shared[key]
+
+
+SiteCheckFunc = Callable[[SiteContext], Iterable[tuple[str, str]]]
+
+
+@dataclass(frozen=True)
+class SiteCheck:
+    name: str
+    func: SiteCheckFunc  # yields (page or file, message)
+    group: str
+    title: str
+    severity: str = ERROR
+    version: int = 1
+    # Page kinds whose parsed results the check reads, even with no page rule on them.
+    kinds: frozenset[str] = frozenset()
+
+
+RULES: dict[str, Rule] = {}
+SITE_CHECKS: dict[str, SiteCheck] = {}
+
+
+def rule(
+    name: str,
+    *,
+    group: str,
+    title: str,
+    kinds: Iterable[str] = (PUBLIC,),
+    pages: Callable[[], Collection[str]] | None = None,
+    severity: str = ERROR,
+    version: int = 1,
+    predicate: Callable[[str], bool] | None = None,
+    inputs: Iterable[str] = (),
+) -> Callable[[PageRuleFunc], PageRuleFunc]:
+    def decorator(func: PageRuleFunc) -> PageRuleFunc:
+        RULES[name] = Rule(
+            name, func, group, title, frozenset(kinds), pages, severity, version, predicate, tuple(inputs)
+        )
+        return func
+
+    return decorator
+
+
+def site_check(
+    name: str,
+    *,
+    group: str,
+    title: str,
+    severity: str = ERROR,
+    version: int = 1,
+    kinds: Iterable[str] = (),
+) -> Callable[[SiteCheckFunc], SiteCheckFunc]:
+    def decorator(func: SiteCheckFunc) -> SiteCheckFunc:
+        SITE_CHECKS[name] = SiteCheck(name, func, group, title, severity, version, frozenset(kinds))
+        return func
+
+    return decorator
+
+
+def load_rules() -> None:
+    import sitebuild.checks  # noqa: F401  (registers the built-in rules)
+
+
+def groups() -> list[str]:
+    load_rules()
+    return sorted({r.group for r in RULES.values()} | {c.group for c in SITE_CHECKS.values()})
+
+
+def select(group_names: Iterable[str] | None = None) -> tuple[list[Rule], list[SiteCheck]]:
+    """Rules and site checks of the given groups (all when None), in registration order."""
+    load_rules()
+    wanted = None if group_names is None else set(group_names)
+    if wanted is not None:
+        unknown = wanted - set(groups())
+        if unknown:
+            raise SystemExit(f"Unknown QA group(s): {', '.join(sorted(unknown))} (known: {', '.join(groups())})")
+    rules = [r for r in RULES.values() if wanted is None or r.group in wanted]
+    checks = [c for c in SITE_CHECKS.values() if wanted is None or c.group in wanted]
+    return rules, checks
+
+
+# ---------------------------------------------------------------------------
+# Running
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def _module_hash(module: str) -> str:
+    source = getattr(sys.modules.get(module), "__file__", None)
+    return sha256_bytes(Path(source).read_bytes())[:16] if source else ""
+
+
+@lru_cache(maxsize=None)
+def _input_hash(rel: str) -> str:
+    path = BASE_DIR / rel
+    return sha256_bytes(path.read_bytes())[:16] if path.is_file() else ""
+
+
+def parser_key() -> str:
+    """Changes whenever parse_page() (this module) does."""
+    return _module_hash(__name__)
+
+
+def rule_key(r: Rule) -> str:
+    """Rule-set version for one rule: its name, version and the code (and data files) that define it."""
+    key = f"{r.name}:{r.version}:{_module_hash(r.func.__module__)}:{parser_key()}"
+    return ":".join([key, *map(_input_hash, r.inputs)])
+
+
+def deps_current(deps: dict[str, bool]) -> bool:
+    return all(file_exists(rel) == found for rel, found in deps.items())
+
+
+def _cached_record(entry: dict[str, Any], r: Rule) -> dict[str, Any] | None:
+    record = entry.get("rules", {}).get(r.name)
+    if record and record.get("key") == rule_key(r) and deps_current(record.get("deps", {})):
+        return record
+    return None
+
+
+def _cached_links(entry: dict[str, Any]) -> tuple[Link, ...]:
+    return tuple(map(Link._make, entry.get("links", [])))
+
+
+@dataclass(frozen=True)
+class PageTask:
+    rel: str
+    kind: str
+    entry: dict[str, Any] | None  # last run's cache entry, if the parser is unchanged
+
+
+@dataclass(frozen=True)
+class PageOutcome:
+    result: PageResult
+    text_hash: str
+    stamp: tuple[int, int] | None
+    records: dict[str, dict[str, Any]]  # rule name -> {key, messages, deps}
+    rechecked: bool  # False when the text was unchanged and every verdict was reused
+
+
+_WORKER_RULES: list[Rule] = []
+
+
+def init_worker(rule_names: tuple[str, ...]) -> None:
+    global _WORKER_RULES
+    load_rules()
+    _WORKER_RULES = [RULES[name] for name in rule_names]
+
+
+def run_rules(page: QaPage, rules: Iterable[Rule]) -> dict[str, dict[str, Any]]:
+    records: dict[str, dict[str, Any]] = {}
+    for r in rules:
+        page.deps = {}
+        messages = list(r.func(page))
+        records[r.name] = {"key": rule_key(r), "messages": messages, "deps": page.deps}
+    return records
+
+
+def _findings(rel: str, rules: Iterable[Rule], records: dict[str, dict[str, Any]]) -> tuple[Finding, ...]:
+    return tuple(
+        Finding(r.name, rel, message, r.severity) for r in rules for message in records[r.name]["messages"]
+    )
+
+
+def check_page(task: PageTask) -> PageOutcome:
+    """Read one page and run the rules whose cached verdict is stale. Runs in a worker when --jobs > 1."""
+    path = BASE_DIR / task.rel
+    text = path.read_text(encoding="utf-8", errors="replace")
+    text_hash = sha256_text(text)
+    stamp = FileStamp.of(path)
+    rules = [r for r in _WORKER_RULES if r.applies_to(task.rel, task.kind)]
+    entry = task.entry if task.entry and task.entry.get("hash") == text_hash else None
+
+    records: dict[str, dict[str, Any]] = {}
+    stale = rules
+    if entry:
+        for r in rules:
+            record = _cached_record(entry, r)
+            if record is not None:
+                records[r.name] = record
+        stale = [r for r in rules if r.name not in records]
+    if entry is not None and not stale:
+        links, title, canonical = _cached_links(entry), entry.get("title"), entry.get("canonical")
+    else:
+        page = parse_page(task.rel, task.kind, text)
+        records.update(run_rules(page, stale))
+        links, title, canonical = tuple(page.links), page.title, page.canonical
+    result = PageResult(task.rel, task.kind, _findings(task.rel, rules, records), links, title, canonical)
+    return PageOutcome(
+        result, text_hash, (stamp.size, stamp.mtime_ns) if stamp else None, records, rechecked=entry is None or bool(stale)
+    )
+
+
+@dataclass
+class QaReport:
+    rules: list[Rule]
+    checks: list[SiteCheck]
+    results: dict[str, PageResult]
+    findings: list[Finding]
+    seconds: float = 0.0
+    cached: int = 0  # pages whose verdicts all came from the cache
+    shared: dict[str, Any] = field(default_factory=dict)  # SiteContext.shared after the site checks
+
+    @property
+    def errors(self) -> list[Finding]:
+        return [f for f in self.findings if f.severity == ERROR]
+
+    @property
+    def warnings(self) -> list[Finding]:
+        return [f for f in self.findings if f.severity == WARNING]
+
+    def by_rule(self) -> dict[str, list[Finding]]:
+        """Findings grouped by rule / site check, in registration order (empty lists included)."""
+        grouped: dict[str, list[Finding]] = {r.name: [] for r in self.rules}
+        grouped.update({c.name: [] for c in self.checks})
+        for finding in self.findings:
+            grouped.setdefault(finding.rule, []).append(finding)
+        return grouped
+
+    def titles(self) -> dict[str, str]:
+        return {**{r.name: r.title for r in self.rules}, **{c.name: c.title for c in self.checks}}
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "date": date.today().isoformat(),
+            "pages": len(self.results),
+            "rules": [r.name for r in self.rules] + [c.name for c in self.checks],
+            "errors": len(self.errors),
+            "warnings": len(self.warnings),
+            "findings": [f.as_dict() for f in self.findings],
+        }
+
+    def to_markdown(self, title: str = "QA Report", limit: int = 100) -> str:
+        titles = self.titles()
+        lines = [
+            f"# {title}",
+            "",
+            f"**Date:** {date.today().isoformat()}",
+            f"**Pages checked:** {len(self.results)}",
+            f"**Overall status:** {'FAIL' if self.errors else 'PASS'}"
+            f" ({len(self.errors)} errors, {len(self.warnings)} warnings)",
+            "",
+            "## Results",
+            "",
+        ]
+        for name, found in self.by_rule().items():
+            mark = "✅" if not found else "❌" if any(f.severity == ERROR for f in found) else "⚠️"
+            lines.append(f"- {mark} **{titles.get(name, name)}** (`{name}`)" + (f": {len(found)}" if found else ""))
+            for f in found[:limit]:
+                lines.append(f"  - `{f.page}`: {f.message}")
+            if len(found) > limit:
+                lines.append(f"  - ...and {len(found) - limit} more")
+        return "\n".join(lines) + "\n"
+
+
+def run(rules: list[Rule], checks: list[SiteCheck], *, jobs: int = 0, use_cache: bool = True) -> QaReport:
+    t0 = time.perf_counter()
+    inv = inventory.load()
+    cache = JsonCache("qa", version=CACHE_VERSION, enabled=use_cache)
+    entries = cache.section("pages")
+    parser = parser_key()
+    check_kinds = set().union(*(c.kinds for c in checks)) if checks else set()
+    kinds = check_kinds.union(*(r.kinds for r in rules))
+
+    page_results: dict[str, PageResult] = {}
+    cached = 0
+    tasks: list[PageTask] = []
+    for e in inv.files(*kinds):
+        applicable = [r for r in rules if r.applies_to(e.rel, e.kind)]
+        if not applicable and e.kind not in check_kinds:
+            continue
+        entry = entries.get(e.rel)
+        if not entry or entry.get("parser") != parser:
+            tasks.append(PageTask(e.rel, e.kind, None))
+            continue
+        stamp = FileStamp.of(e.path)
+        records: dict[str, Any] = {r.name: _cached_record(entry, r) for r in applicable}
+        if stamp and [stamp.size, stamp.mtime_ns] == entry.get("stamp") and all(records.values()):
+            page_results[e.rel] = PageResult(
+                e.rel,
+                e.kind,
+                _findings(e.rel, applicable, records),
+                _cached_links(entry),
+                entry.get("title"),
+                entry.get("canonical"),
+            )
+            cached += 1
+            continue
+        tasks.append(PageTask(e.rel, e.kind, entry))
+
+    outcomes = map_ordered(
+        check_page, tasks, jobs=jobs, initializer=init_worker, initargs=(tuple(r.name for r in rules),)
+    )
+    for outcome in outcomes:
+        result = outcome.result
+        page_results[result.rel] = result
+        cached += not outcome.rechecked
+        if outcome.stamp is None:
+            continue
+        previous = entries.get(result.rel) or {}
+        # Verdicts of rules outside this run stay valid only for the same text.
+        kept = previous.get("rules", {}) if previous.get("hash") == outcome.text_hash else {}
+        cache.set(
+            "pages",
+            result.rel,
+            {
+                "hash": outcome.text_hash,
+                "stamp": list(outcome.stamp),
+                "parser": parser,
+                "title": result.title,
+                "canonical": result.canonical,
+                "links": [list(link) for link in result.links],
+                "rules": {**kept, **outcome.records},
+            },
+        )
+    for rel in [rel for rel in entries if rel not in inv]:
+        del entries[rel]
+        cache.dirty = True
+    cache.save()
+
+    findings: list[Finding] = []
+    for r in rules:
+        if r.pages is not None:
+            findings.extend(Finding(r.name, rel, "missing file", r.severity) for rel in r.pages() if rel not in inv)
+    # Inventory order, whether a page came from the cache or was re-checked.
+    results = {e.rel: page_results[e.rel] for e in inv.files(*kinds) if e.rel in page_results}
+    for result in results.values():
+        findings.extend(result.findings)
+
+    ctx = SiteContext(results)
+    for c in checks:
+        try:
+            findings.extend(Finding(c.name, where, message, c.severity) for where, message in c.func(ctx))
+        except Exception as exc:  # a broken input file fails the check, not the run
+            findings.append(Finding(c.name, "-", f"check could not run: {exc}", c.severity))
+
+    return QaReport(rules, checks, ctx.results, findings, time.perf_counter() - t0, cached, ctx.shared)
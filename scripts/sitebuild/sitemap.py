@@ -0,0 +1,192 @@
+"""
+Streaming sitemap writer.
+
+ShardWriter streams <url> entries of one type (core, blog, ...) straight to
+disk, starting a new numbered shard whenever the protocol limits (50,000 URLs
+or 50 MB uncompressed) would be exceeded, and writes a gzip copy alongside
+each .xml file. Shards are written to temporary files and only moved into
+place when their content differs from the last run (tracked by hash in
+.build-cache/sitemaps.json), so unchanged shards keep their bytes and mtimes.
+write_index() then emits the <sitemapindex> that points at every shard.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterable
+from xml.sax.saxutils import escape
+
+from sitebuild.buildcache import JsonCache
+
+MAX_URLS = 50_000
+MAX_BYTES = 50 * 1024 * 1024
+# Google accepts at most 1,000 <image:image> entries per <url>.
+MAX_IMAGES_PER_URL = 1000
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+IMAGE_NS = "http://www.google.com/schemas/sitemap-image/1.1"
+
+CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class UrlEntry:
+    loc: str
+    lastmod: str | None = None
+    images: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Shard:
+    filename: str  # e.g. "blog.xml"; the gzip copy is filename + ".gz"
+    count: int
+    lastmod: str | None
+    changed: bool
+
+
+def _url_xml(entry: UrlEntry) -> bytes:
+    parts = ["  <url>\n", f"    <loc>{escape(entry.loc)}</loc>\n"]
+    if entry.lastmod:
+        parts.append(f"    <lastmod>{escape(entry.lastmod)}</lastmod>\n")
+    for image in entry.images[:MAX_IMAGES_PER_URL]:
+        parts.append(f"    <image:image><image:loc>{escape(image)}</image:loc></image:image>\n")
+    parts.append("  </url>\n")
+    return "".join(parts).encode("utf-8")
+
+
+class _ShardFile:
+    """One shard being streamed to <name>.xml.tmp and <name>.xml.gz.tmp."""
+
+    def __init__(self, out_dir: Path, filename: str, header: bytes, footer: bytes) -> None:
+        self.path = out_dir / filename
+        self.gz_path = out_dir / f"{filename}.gz"
+        self.tmp = self.path.with_name(self.path.name + ".tmp")
+        self.gz_tmp = self.gz_path.with_name(self.gz_path.name + ".tmp")
+        self.footer = footer
+        self.count = 0
+        self.size = 0
+        self.lastmod: str | None = None
+        self._hash = hashlib.sha256()
+        self._raw: BinaryIO = open(self.tmp, "wb")
+        # mtime=0 keeps the gzip bytes stable for identical content.
+        self._gz = gzip.GzipFile(filename="", fileobj=open(self.gz_tmp, "wb"), mode="wb", mtime=0)
+        self._write(header)
+
+    def _write(self, chunk: bytes) -> None:
+        self._raw.write(chunk)
+        self._gz.write(chunk)
+        self.size += len(chunk)
+        self._hash.update(chunk)
+
+    def fits(self, chunk: bytes) -> bool:
+        return self.count < MAX_URLS and self.size + len(chunk) + len(self.footer) <= MAX_BYTES
+
+    def add(self, chunk: bytes, lastmod: str | None) -> None:
+        self._write(chunk)
+        self.count += 1
+        if lastmod and (self.lastmod is None or lastmod > self.lastmod):
+            self.lastmod = lastmod
+
+    def finish(self, known_digest: str | None) -> tuple[str, bool]:
+        self._write(self.footer)
+        self._raw.close()
+        gz_fileobj = self._gz.fileobj
+        self._gz.close()
+        gz_fileobj.close()
+        digest = self._hash.hexdigest()
+        if digest == known_digest and self.path.exists() and self.gz_path.exists():
+            self.tmp.unlink()
+            self.gz_tmp.unlink()
+            return digest, False
+        os.replace(self.tmp, self.path)
+        os.replace(self.gz_tmp, self.gz_path)
+        return digest, True
+
+
+class ShardWriter:
+    """Streams entries of one sitemap type into <name>.xml, <name>-2.xml, ..."""
+
+    def __init__(self, out_dir: Path, name: str, cache: JsonCache, *, images: bool = False) -> None:
+        self.out_dir = out_dir
+        self.name = name
+        self.cache = cache
+        namespaces = f'xmlns="{SITEMAP_NS}"'
+        if images:
+            namespaces += f' xmlns:image="{IMAGE_NS}"'
+        self.header = f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset {namespaces}>\n'.encode("utf-8")
+        self.footer = b"</urlset>\n"
+        self.shards: list[Shard] = []
+        self._current: _ShardFile | None = None
+
+    def _filename(self, number: int) -> str:
+        return f"{self.name}.xml" if number == 1 else f"{self.name}-{number}.xml"
+
+    def _open_next(self) -> _ShardFile:
+        filename = self._filename(len(self.shards) + 1)
+        return _ShardFile(self.out_dir, filename, self.header, self.footer)
+
+    def _close_current(self) -> None:
+        current = self._current
+        if current is None:
+            return
+        filename = current.path.name
+        known = self.cache.section("shards").get(filename)
+        digest, changed = current.finish(known)
+        self.cache.set("shards", filename, digest)
+        self.shards.append(Shard(filename, current.count, current.lastmod, changed))
+        self._current = None
+
+    def add(self, entry: UrlEntry) -> None:
+        chunk = _url_xml(entry)
+        if self._current is not None and not self._current.fits(chunk):
+            self._close_current()
+        if self._current is None:
+            self._current = self._open_next()
+        self._current.add(chunk, entry.lastmod)
+
+    def close(self) -> list[Shard]:
+        self._close_current()
+        return self.shards
+
+
+def open_cache(*, enabled: bool = True) -> JsonCache:
+    return JsonCache("sitemaps", version=CACHE_VERSION, enabled=enabled)
+
+
+def remove_stale(out_dir: Path, shards: Iterable[Shard]) -> list[str]:
+    """Delete shard files left over from a run that produced more parts."""
+    keep = set()
+    for shard in shards:
+        keep.add(shard.filename)
+        keep.add(f"{shard.filename}.gz")
+    removed = []
+    for fp in sorted(out_dir.iterdir()):
+        if fp.name not in keep and fp.name.endswith((".xml", ".xml.gz")):
+            fp.unlink()
+            removed.append(fp.name)
+    return removed
+
+
+def write_index(index_path: Path, shards: Iterable[Shard], base_url: str) -> bool:
+    """Write the <sitemapindex> (pointing at the .xml.gz shards) if it changed."""
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<sitemapindex xmlns="{SITEMAP_NS}">',
+    ]
+    for shard in shards:
+        lines.append("  <sitemap>")
+        lines.append(f"    <loc>{escape(base_url)}{escape(shard.filename)}.gz</loc>")
+        if shard.lastmod:
+            lines.append(f"    <lastmod>{escape(shard.lastmod)}</lastmod>")
+        lines.append("  </sitemap>")
+    lines.append("</sitemapindex>")
+    lines.append("")
+    text = "\n".join(lines)
+    if index_path.exists() and index_path.read_text(encoding="utf-8") == text:
+        return False
+    index_path.write_text(text, encoding="utf-8")
+    return True
@@ -0,0 +1,52 @@
+"""
+Comment-fenced slots in generated article pages.
+
+Regions that later tools rewrite (the author byline, the medical review
+footer, the article JSON-LD) are wrapped in comment fences when a page is
+generated:
+
+    <!-- slot:byline --><div class="mt-4 flex ...">...</div><!-- /slot:byline -->
+
+An empty slot (e.g. the review footer on a community article) is kept so it
+can be filled later. fill() rewrites any number of slots in a single
+left-to-right scan of the page, and reports which slots it found, so an
+author change is one pass per page with no fallbacks; callers only need
+their own matching for pages generated before the fences existed.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Mapping
+
+BYLINE = "byline"
+REVIEW = "review"
+JSONLD = "jsonld"
+
+SLOT_RE = re.compile(r"<!-- slot:(?P<name>[a-z][a-z0-9-]*) -->(?P<body>.*?)<!-- /slot:(?P=name) -->", re.DOTALL)
+
+
+def fence(name: str, content: str = "") -> str:
+    return f"<!-- slot:{name} -->{content}<!-- /slot:{name} -->"
+
+
+def read(text: str) -> dict[str, str]:
+    """Contents of every slot on the page (the first one wins for repeated names)."""
+    found: dict[str, str] = {}
+    for m in SLOT_RE.finditer(text):
+        found.setdefault(m.group("name"), m.group("body"))
+    return found
+
+
+def fill(text: str, contents: Mapping[str, str]) -> tuple[str, set[str]]:
+    """Replace the contents of the named slots; returns the new text and the slots found."""
+    found: set[str] = set()
+
+    def replace(m: re.Match[str]) -> str:
+        name = m.group("name")
+        if name not in contents:
+            return m.group(0)
+        found.add(name)
+        return fence(name, contents[name])
+
+    return SLOT_RE.sub(replace, text), found
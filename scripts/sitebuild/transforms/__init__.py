@@ -0,0 +1,5 @@
+"""
+Built-in page transforms. Importing this package registers them with the engine.
+"""
+
+from sitebuild.transforms import canonical, gtm, layout, links, tailwind, theme  # noqa: F401
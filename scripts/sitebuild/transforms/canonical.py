@@ -0,0 +1,224 @@
+"""
+Canonical + OpenGraph/Twitter meta tags.
+
+Rules:
+- Canonical origin is always https://classicvisioncare.com
+- For clean-route pages (/<route>/index.html), canonical is /<route>/
+- For root index.html, canonical is /
+- For legacy source pages under ./pages, canonical is the matching clean route
+  when one exists (based on scripts/create-canonical-copies.py mapping).
+- og:title, og:description and og:url follow the page's <title>, meta
+  description and canonical URL; og:type and twitter:card are added only when
+  missing. Other OG/Twitter tags (og:image, og:site_name, twitter:title, ...)
+  are left as they are.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import html
+import re
+from pathlib import Path
+
+from sitebuild import BASE_DIR, CANONICAL_ORIGIN
+from sitebuild.engine import PUBLIC, SOURCE, BuildContext, Page, register
+
+# Reverse of the route map in scripts/create-canonical-copies.py.
+# This avoids importing code from a script file.
+SOURCE_TO_ROUTE: dict[str, str] = {
+    "pages/about/index.html": "/about-us/",
+    "pages/about/why-choose-us.html": "/why-choose-us/",
+    "pages/about/testimonials.html": "/testimonials/",
+    "pages/about/community.html": "/community-involvement/",
+    "pages/about/careers.html": "/careers/",
+    "pages/patients/contact.html": "/contact-us/",
+    "pages/patients/new.html": "/new-patients/",
+    "pages/patients/book.html": "/book-now/",
+    "pages/patients/insurance.html": "/insurance/",
+    "pages/legal/accessibility.html": "/accessibility/",
+    "pages/legal/privacy.html": "/privacy-policy-2/",
+    "pages/about/doctors/index.html": "/our-doctors/",
+    "pages/about/doctors/mital-patel.html": "/dr-mital-patel-od/",
+    "pages/about/doctors/bhumi-patel.html": "/dr-bhumi-patel-od/",
+    "pages/locations/index.html": "/our-locations/",
+    "pages/locations/kennesaw.html": "/eye-doctor-kennesaw-ga/",
+    "pages/locations/east-cobb.html": "/eye-doctor-marietta/",
+    "pages/services/index.html": "/eye-care-services/",
+    "pages/services/exams/comprehensive.html": "/comprehensive-eye-exams/",
+    "pages/services/exams/contact-lens.html": "/contact-lens-exams/",
+    "pages/services/exams/diabetic.html": "/diabetic-eye-exam/",
+    "pages/services/pediatric/eye-care.html": "/pediatric-eye-care/",
+    "pages/services/pediatric/eye-exams.html": "/pediatric-eye-exams/",
+    "pages/services/pediatric/childrens-exam.html": "/childrens-eye-exam/",
+    "pages/services/pediatric/school-screening.html": "/school-vision-screening/",
+    "pages/services/conditions/glaucoma.html": "/glaucoma/",
+    "pages/services/conditions/macular-degeneration.html": "/macular-degeneration/",
+    "pages/dry-eye/treatments.html": "/dry-eye-treatment/",
+    "pages/dry-eye/index.html": "/dry-eye-treatment/",
+    "pages/dry-eye/treatments/blephex.html": "/dry-eye-treatment-blephex/",
+    "pages/dry-eye/treatments/ipl.html": "/dry-eye-treatment-intense-pulsed-light/",
+    "pages/dry-eye/treatments/miboflo.html": "/dry-eye-treatment-miboflo/",
+    "pages/dry-eye/treatments/punctal-plugs.html": "/dry-eye-treatment-punctal-plugs/",
+    "pages/dry-eye/treatments/eye-drops.html": "/dry-eye-treatment-eye-drops/",
+    "pages/dry-eye/treatments/supplements.html": "/dry-eye-treatment-eye-supplements/",
+    "pages/dry-eye/treatments/scleral-lenses.html": "/scleral-lenses-for-dry-eyes/",
+    "pages/myopia/index.html": "/myopia-control/",
+    "pages/myopia/children.html": "/myopia-in-children/",
+    "pages/myopia/treatments/ortho-k.html": "/ortho-k-lenses-for-myopia-control/",
+    "pages/myopia/treatments/atropine.html": "/myopia-control-atropine-eye-drops/",
+    "pages/myopia/treatments/misight.html": "/misight-lenses-for-myopia-control/",
+    "pages/myopia/treatments/multifocal.html": "/myopia-control-multifocal-lenses/",
+    "pages/eyewear/specialty/index.html": "/specialty-contact-lenses/",
+    "pages/eyewear/contact-lenses.html": "/contact-lenses/",
+    "pages/eyewear/eyeglasses.html": "/eyeglasses/",
+    "pages/eyewear/index.html": "/eyewear/",
+    "pages/eyewear/sunglasses.html": "/sunglasses/",
+    "pages/eyewear/specialty/scleral.html": "/scleral-lenses-atlanta/",
+    "pages/eyewear/specialty/keratoconus.html": "/keratoconus-contacts/",
+    "pages/eyewear/specialty/post-lasik.html": "/post-lasik-contacts/",
+    "pages/services/conditions/allergies.html": "/allergies/",
+    "pages/services/conditions/astigmatism.html": "/astigmatism/",
+    "pages/about/blog.html": "/blog/",
+}
+
+
+def normalize_slash_path(path: str) -> str:
+    if not path.startswith("/"):
+        path = "/" + path
+    if not path.endswith("/"):
+        path += "/"
+    return path
+
+
+def to_canonical_url(path: str) -> str:
+    if not path.startswith("/"):
+        path = "/" + path
+    if path == "/":
+        return f"{CANONICAL_ORIGIN}/"
+    # If it's a file-like path (e.g. /pages/foo/bar.html), do not force a trailing slash.
+    if re.search(r"/[^/]+\.[^/]+$", path):
+        return f"{CANONICAL_ORIGIN}{path}"
+    return f"{CANONICAL_ORIGIN}{normalize_slash_path(path)}"
+
+
+@dataclass(frozen=True)
+class HeadMeta:
+    title: str | None
+    description: str | None
+
+
+def get_head_meta(html_text: str) -> HeadMeta:
+    title_match = re.search(r"<title>(.*?)</title>", html_text, flags=re.IGNORECASE | re.DOTALL)
+    title = html.unescape(title_match.group(1).strip()) if title_match else None
+
+    desc_match = re.search(
+        r'<meta\s+name=["\']description["\']\s+content=(?P<q>["\'])(?P<desc>.*?)(?P=q)\s*/?>',
+        html_text,
+        flags=re.IGNORECASE | re.DOTALL,
+    )
+    description = html.unescape(desc_match.group("desc").strip()) if desc_match else None
+    return HeadMeta(title=title, description=description)
+
+
+CANONICAL_TAG_RE = re.compile(r'<link\s+rel=["\']canonical["\']\s+href=["\'][^"\']+["\']\s*/?>', re.IGNORECASE)
+
+
+def upsert_canonical(html_text: str, canonical_url: str) -> str:
+    canonical_tag = f'  <link rel="canonical" href="{canonical_url}">'
+    if re.search(r'<link\s+rel=["\']canonical["\']', html_text, flags=re.IGNORECASE):
+        # Consume the existing indentation too, so reruns don't keep indenting the tag.
+        return re.sub(
+            r'[ \t]*<link\s+rel=["\']canonical["\']\s+href=["\'][^"\']+["\']\s*/?>',
+            lambda _m: canonical_tag,
+            html_text,
+            flags=re.IGNORECASE,
+        )
+
+    # Prefer insert after meta description, else after </title>; on a line of its own.
+    for pattern in (r'<meta\s+name=["\']description["\'][^>]*>', r"</title>"):
+        m = re.search(pattern, html_text, flags=re.IGNORECASE)
+        if m:
+            return html_text[: m.end()] + "\n" + canonical_tag + html_text[m.end() :]
+
+    return html_text
+
+
+def _meta_re(key: str) -> re.Pattern[str]:
+    return re.compile(
+        rf'<meta\s[^>]*\b(?:property|name)=["\']{re.escape(key)}["\'][^>]*>',
+        re.IGNORECASE,
+    )
+
+
+def _meta_content(tag: str) -> str | None:
+    m = re.search(r'\bcontent=(?P<q>["\'])(?P<content>.*?)(?P=q)', tag, flags=re.IGNORECASE | re.DOTALL)
+    return html.unescape(m.group("content")) if m else None
+
+
+def _meta_tag(key: str, content: str) -> str:
+    attr = "name" if key.startswith("twitter:") else "property"
+    return f'<meta {attr}="{key}" content="{content}">'
+
+
+def upsert_og_and_twitter(html_text: str, canonical_url: str, meta: HeadMeta, og_type: str) -> str:
+    """Update the OG/Twitter tags derived from the page; add og:type and twitter:card if missing.
+
+    Only these tags are touched. og:image, og:site_name, og:locale,
+    twitter:title/description/image and the like are kept as they are, and an
+    existing og:type (article, profile) wins over the default.
+    """
+    if not meta.title and not meta.description:
+        return html_text
+
+    derived: list[tuple[str, str]] = []
+    if meta.title:
+        derived.append(("og:title", meta.title))
+    if meta.description:
+        derived.append(("og:description", meta.description))
+    derived.append(("og:url", canonical_url))
+    defaults = [("og:type", og_type), ("twitter:card", "summary_large_image")]
+
+    missing: list[str] = []
+    for key, value in derived + defaults:
+        pattern = _meta_re(key)
+        content = html.escape(value, quote=True)
+        m = pattern.search(html_text)
+        if not m:
+            missing.append(_meta_tag(key, content))
+        elif (key, value) in derived and _meta_content(m.group(0)) != value:
+            # Replace the tag only (not its surroundings), so reruns change nothing.
+            html_text = html_text[: m.start()] + _meta_tag(key, content) + html_text[m.end() :]
+    if not missing:
+        return html_text
+
+    block = "\n".join(f"  {tag}" for tag in missing)
+    # Insert right after canonical tag (preferred), else before </head>
+    m = CANONICAL_TAG_RE.search(html_text)
+    if m:
+        return html_text[: m.end()] + "\n" + block + html_text[m.end() :]
+    m = re.search(r"</head>", html_text, flags=re.IGNORECASE)
+    if m:
+        return html_text[: m.start()] + block + "\n" + html_text[m.start() :]
+    return html_text
+
+
+def file_to_served_path(file_path: Path) -> str:
+    if file_path == BASE_DIR / "index.html":
+        return "/"
+    if file_path.name == "index.html" and file_path.parent != BASE_DIR:
+        rel = file_path.parent.relative_to(BASE_DIR)
+        return normalize_slash_path(rel.as_posix())
+    # For non-index pages, treat as file path (legacy)
+    rel = file_path.relative_to(BASE_DIR)
+    return "/" + rel.as_posix()
+
+
+@register("canonical", kinds=(PUBLIC, SOURCE), version=3)
+def apply_canonical_and_og(text: str, page: Page, ctx: BuildContext) -> str:
+    canonical_path = SOURCE_TO_ROUTE.get(page.rel) or file_to_served_path(page.path)
+    canonical_url = to_canonical_url(canonical_path)
+    og_type = "website"
+
+    meta = get_head_meta(text)
+    text = upsert_canonical(text, canonical_url)
+    return upsert_og_and_twitter(text, canonical_url, meta, og_type=og_type)
@@ -0,0 +1,51 @@
+"""
+Google Tag Manager snippet + lightweight tracking loader.
+
+- Inserts GTM loader in <head>
+- Inserts GTM <noscript> immediately after <body>
+- Adds /scripts/tracking.js as a deferred script in <head>
+"""
+
+from __future__ import annotations
+
+import re
+
+from sitebuild.engine import PUBLIC, SOURCE, BuildContext, Page, register
+
+GTM_ID = "GTM-WG6M9ZDV"
+
+HEAD_SNIPPET = f"""<!-- Google Tag Manager -->
+<script>
+(function(w,d,s,l,i){{w[l]=w[l]||[];w[l].push({{'gtm.start':
+new Date().getTime(),event:'gtm.js'}});var f=d.getElementsByTagName(s)[0],
+j=d.createElement(s),dl=l!='dataLayer'?'&l='+l:'';j.async=true;j.src=
+'https://www.googletagmanager.com/gtm.js?id='+i+dl;f.parentNode.insertBefore(j,f);
+}})(window,document,'script','dataLayer','{GTM_ID}');
+</script>
+<!-- End Google Tag Manager -->
+<script src="/scripts/tracking.js" defer></script>
+"""
+
+NOSCRIPT_SNIPPET = f"""<!-- Google Tag Manager (noscript) -->
+<noscript><iframe src="https://www.googletagmanager.com/ns.html?id={GTM_ID}" height="0" width="0" style="display:none;visibility:hidden"></iframe></noscript>
+<!-- End Google Tag Manager (noscript) -->
+"""
+
+
+def insert_head(html: str) -> str:
+    if GTM_ID in html:
+        return html
+    if "</head>" not in html.lower():
+        return html
+    return re.sub(r"</head>", HEAD_SNIPPET + "\n</head>", html, count=1, flags=re.IGNORECASE)
+
+
+def insert_noscript(html: str) -> str:
+    if f"ns.html?id={GTM_ID}" in html:
+        return html
+    return re.sub(r"(<body\b[^>]*>)", r"\1\n" + NOSCRIPT_SNIPPET, html, count=1, flags=re.IGNORECASE)
+
+
+@register("gtm", kinds=(PUBLIC, SOURCE))
+def add_gtm(text: str, page: Page, ctx: BuildContext) -> str:
+    return insert_noscript(insert_head(text))
@@ -0,0 +1,53 @@
+"""
+Nav + footer sync: copy the header and footer blocks from index.html into
+every public page.
+
+This repo uses root-relative paths (e.g., /book-now/), so we do NOT attempt to
+rewrite links based on directory depth.
+
+Footer block boundary:
+  Start: <!-- Footer -->
+  End:   <script src="/scripts/editorial-forest.js" defer></script>
+         (any attributes on the script tag are accepted)
+"""
+
+from __future__ import annotations
+
+import re
+
+from sitebuild.engine import BuildContext, Page, register
+
+NAV_PATTERNS = [
+    re.compile(r"(<!-- Top Phone Bar -->.*?</header>)", re.DOTALL),
+    re.compile(r'(<div class="ef-topbar.*?</header>)', re.DOTALL),
+]
+
+FOOTER_PATTERNS = [
+    re.compile(r"(<!-- Footer -->.*?<script\b[^>]*\bsrc=[\"']/scripts/editorial-forest\.js[\"'][^>]*></script>)", re.DOTALL),
+    re.compile(r"(<!-- Footer -->.*?<script\b[^>]*\bsrc=[\"'][^\"']*editorial-forest\.js[\"'][^>]*></script>)", re.DOTALL),
+]
+
+
+def replace_block(text: str, patterns: list[re.Pattern[str]], block: str) -> str | None:
+    for pattern in patterns:
+        if pattern.search(text):
+            return pattern.sub(lambda _m: block, text, count=1)
+    return None
+
+
+@register("nav", skip_layout_source=True, requires=("nav",))
+def sync_nav(text: str, page: Page, ctx: BuildContext) -> str:
+    replaced = replace_block(text, NAV_PATTERNS, ctx.layout_block("nav") or "")
+    if replaced is None:
+        page.notes.append("no nav found")
+        return text
+    return replaced
+
+
+@register("footer", skip_layout_source=True, requires=("footer",))
+def sync_footer(text: str, page: Page, ctx: BuildContext) -> str:
+    replaced = replace_block(text, FOOTER_PATTERNS, ctx.layout_block("footer") or "")
+    if replaced is None:
+        page.notes.append("no footer found")
+        return text
+    return replaced
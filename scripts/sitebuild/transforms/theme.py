@@ -0,0 +1,44 @@
+"""
+Editorial Forest stylesheet + body class for the root-level HTML pages.
+"""
+
+from __future__ import annotations
+
+import re
+
+from sitebuild.engine import BuildContext, Page, register
+
+# Root-relative, as the links transform would rewrite it anyway.
+STYLESHEET_TAG = '<link rel="stylesheet" href="/styles/editorial-forest.css?v=4">'
+
+
+def ensure_stylesheet(html: str) -> str:
+    if "styles/editorial-forest.css?v=4" in html:
+        return html
+    return html.replace("</head>", f"  {STYLESHEET_TAG}\n</head>")
+
+
+def ensure_body_class(html: str) -> str:
+    def repl(match):
+        attrs = match.group(1) or ""
+        classes = match.group(2) or ""
+        if "cvc-editorial" in classes:
+            return match.group(0)
+        new_classes = f"cvc-editorial {classes}".strip()
+        return f'<body{attrs} class="{new_classes}">'
+
+    if "<body" not in html:
+        return html
+    html = re.sub(r"<body([^>]*)class=\"([^\"]*)\">", repl, html, count=1)
+    if "cvc-editorial" not in html:
+        html = re.sub(r"<body([^>]*)>", r"<body\1 class=\"cvc-editorial\">", html, count=1)
+    return html
+
+
+def is_root_page(page: Page) -> bool:
+    return "/" not in page.rel
+
+
+@register("theme", predicate=is_root_page)
+def apply_theme(text: str, page: Page, ctx: BuildContext) -> str:
+    return ensure_stylesheet(ensure_body_class(text))
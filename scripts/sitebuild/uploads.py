@@ -0,0 +1,261 @@
+"""
+Parallel, content-deduplicating copier for WordPress uploads.
+
+copy_uploads() brings every referenced /wp-content/uploads/ file from the
+local export (or, optionally, the origin) into the static site:
+
+1. Source and destination files are hashed on a thread pool. Hashes are
+   cached in .build-cache/uploads.json by size + mtime, so a re-import only
+   stats files and reads nothing.
+2. Destinations whose content already matches their source are skipped.
+3. Referenced files with byte-identical content (WordPress size variants
+   that came out the same, re-uploads under a new name) are copied once and
+   hardlinked for the rest; hardlinks fall back to copies across devices.
+4. Copies run on a thread pool, each into a temp file moved into place.
+
+The result records what was referenced, copied, linked, unchanged, missing
+or left differing, plus upload files in the site that no public page
+references (orphans, e.g. unused size variants), for the uploads manifest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, TypeVar
+
+from sitebuild import inventory
+from sitebuild.buildcache import FileStamp, JsonCache
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+CACHE_VERSION = 1
+CHUNK_SIZE = 1024 * 1024
+UPLOADS_URL_RE = re.compile(r"/wp-content/uploads/([^\s\"'<>()?#,]+)")
+
+
+@dataclass
+class CopyReport:
+    referenced: list[str] = field(default_factory=list)
+    copied: list[str] = field(default_factory=list)
+    downloaded: list[str] = field(default_factory=list)
+    linked: dict[str, str] = field(default_factory=dict)  # rel -> rel it shares content with
+    unchanged: list[str] = field(default_factory=list)
+    differing: list[str] = field(default_factory=list)  # dest differs from source; kept (no --overwrite)
+    missing: list[str] = field(default_factory=list)
+    orphaned: list[str] = field(default_factory=list)
+
+    def as_manifest(self) -> dict[str, object]:
+        return {
+            "summary": {
+                "referenced": len(self.referenced),
+                "copied": len(self.copied),
+                "downloaded": len(self.downloaded),
+                "linked": len(self.linked),
+                "unchanged": len(self.unchanged),
+                "differing": len(self.differing),
+                "missing": len(self.missing),
+                "orphaned": len(self.orphaned),
+            },
+            "referenced": self.referenced,
+            "copied": self.copied,
+            "downloaded": self.downloaded,
+            "linked": self.linked,
+            "unchanged": self.unchanged,
+            "differing": self.differing,
+            "missing": self.missing,
+            "orphaned": self.orphaned,
+        }
+
+
+def _thread_map(func: Callable[[T], R], items: Iterable[T], workers: int) -> list[R]:
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, items))
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while chunk := fh.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _HashCache:
+    """sha256 of files, reused while their size and mtime are unchanged."""
+
+    def __init__(self, cache: JsonCache) -> None:
+        self.cache = cache
+        self.entries = cache.section("files")
+
+    def lookup(self, path: Path) -> tuple[FileStamp | None, str | None]:
+        stamp = FileStamp.of(path)
+        if stamp is None:
+            return None, None
+        entry = self.entries.get(str(path))
+        if entry and entry.get("size") == stamp.size and entry.get("mtime_ns") == stamp.mtime_ns:
+            return stamp, entry.get("sha256")
+        return stamp, None
+
+    def hashes(self, paths: list[Path], workers: int) -> dict[Path, str]:
+        """Hash every existing path, reading only files the cache cannot vouch for."""
+        known: dict[Path, str] = {}
+        to_read: list[Path] = []
+        for path in paths:
+            stamp, digest = self.lookup(path)
+            if digest:
+                known[path] = digest
+            elif stamp is not None:
+                to_read.append(path)
+        for path, digest in zip(to_read, _thread_map(_hash_file, to_read, workers)):
+            known[path] = digest
+            self.record(path, digest)
+        return known
+
+    def record(self, path: Path, digest: str) -> None:
+        stamp = FileStamp.of(path)
+        if stamp is not None:
+            self.cache.set("files", str(path), {"size": stamp.size, "mtime_ns": stamp.mtime_ns, "sha256": digest})
+
+
+def _copy_file(src: Path, dest: Path) -> None:
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(dest.name + ".tmp")
+    shutil.copy2(src, tmp)
+    os.replace(tmp, dest)
+
+
+def _link_file(target: Path, dest: Path) -> None:
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(dest.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(target, tmp)
+    except OSError:
+        shutil.copy2(target, tmp)
+    os.replace(tmp, dest)
+
+
+def site_upload_references() -> set[str]:
+    """Upload paths referenced by any public page (for orphan detection)."""
+    refs: set[str] = set()
+    for fp in inventory.load().paths(inventory.PUBLIC):
+        text = fp.read_text(encoding="utf-8", errors="replace")
+        if "/wp-content/uploads/" in text:
+            refs.update(UPLOADS_URL_RE.findall(text))
+    return refs
+
+
+def copy_uploads(
+    upload_relpaths: Iterable[str],
+    *,
+    uploads_source: Path,
+    uploads_dest: Path,
+    download: Callable[[str], bytes | None] | None = None,
+    overwrite: bool = False,
+    workers: int = 8,
+) -> CopyReport:
+    """Copy the referenced uploads into *uploads_dest*; see the module docstring.
+
+    *download* fetches a file that is missing from the source (None or an
+    exception counts as missing). With *overwrite*, destinations whose content
+    differs from the source are replaced; otherwise they are left and reported.
+    """
+    report = CopyReport(referenced=sorted(set(upload_relpaths)))
+    cache = JsonCache("uploads", version=CACHE_VERSION)
+    hashes = _HashCache(cache)
+    workers = max(1, workers)
+
+    src_paths = {rel: uploads_source / rel for rel in report.referenced}
+    dest_paths = {rel: uploads_dest / rel for rel in report.referenced}
+    digests = hashes.hashes([*src_paths.values(), *dest_paths.values()], workers)
+
+    # Files missing from the export: download straight to the destination.
+    absent = [rel for rel in report.referenced if src_paths[rel] not in digests]
+    fetchable = [rel for rel in absent if dest_paths[rel] not in digests]
+    if download is not None:
+
+        def fetch(rel: str) -> bool:
+            try:
+                data = download(rel)
+            except Exception:
+                return False
+            if data is None:
+                return False
+            dest = dest_paths[rel]
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dest.with_name(dest.name + ".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, dest)
+            return True
+
+        for rel, ok in zip(fetchable, _thread_map(fetch, fetchable, workers)):
+            if ok:
+                report.downloaded.append(rel)
+                digests[dest_paths[rel]] = _hash_file(dest_paths[rel])
+                hashes.record(dest_paths[rel], digests[dest_paths[rel]])
+            else:
+                report.missing.append(rel)
+    else:
+        report.missing.extend(fetchable)
+    # Absent from the export but already in the site: nothing to compare against.
+    report.unchanged.extend(rel for rel in absent if rel not in fetchable)
+
+    # Group the remaining files by source content; the first of each group is
+    # copied, later ones are hardlinked to it.
+    by_digest: dict[str, list[str]] = defaultdict(list)
+    for rel in report.referenced:
+        src_digest = digests.get(src_paths[rel])
+        if src_digest is None:
+            continue
+        dest_digest = digests.get(dest_paths[rel])
+        if dest_digest == src_digest:
+            report.unchanged.append(rel)
+        elif dest_digest is not None and not overwrite:
+            report.differing.append(rel)
+        else:
+            by_digest[src_digest].append(rel)
+
+    # A destination that already holds the content can serve as the link target.
+    present = {digests[dest_paths[rel]]: rel for rel in report.unchanged if dest_paths[rel] in digests}
+    to_copy: list[str] = []
+    to_link: list[tuple[str, str]] = []
+    for digest, rels in by_digest.items():
+        first = present.get(digest)
+        if first is None:
+            first = rels[0]
+            to_copy.append(first)
+        to_link.extend((rel, first) for rel in rels if rel != first)
+
+    _thread_map(lambda rel: _copy_file(src_paths[rel], dest_paths[rel]), to_copy, workers)
+    _thread_map(lambda pair: _link_file(dest_paths[pair[1]], dest_paths[pair[0]]), to_link, workers)
+    for rel in to_copy:
+        hashes.record(dest_paths[rel], digests[src_paths[rel]])
+    for rel, first in to_link:
+        hashes.record(dest_paths[rel], digests[src_paths[rel]])
+        report.linked[rel] = first
+    report.copied = sorted(to_copy)
+    report.unchanged.sort()
+    report.missing.sort()
+
+    if uploads_dest.exists():
+        site_refs = site_upload_references() | set(report.referenced)
+        prefix = len(str(uploads_dest)) + 1
+        report.orphaned = sorted(
+            str(fp)[prefix:].replace(os.sep, "/")
+            for fp in uploads_dest.rglob("*")
+            if fp.is_file() and not fp.name.endswith(".tmp") and str(fp)[prefix:].replace(os.sep, "/") not in site_refs
+        )
+
+    cache.save()
+    return report
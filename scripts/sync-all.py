@@ -1,35 +1,21 @@
 #!/usr/bin/env python3
 """
-Sync navigation and footer across all public HTML pages.
+Refresh every public HTML page in a single pass.
 
-Convenience wrapper around:
-- scripts/sync-nav.py
-- scripts/sync-footer.py
+Each page is read once and run through the full transform chain in memory
+(nav, footer, link rewiring, Tailwind stylesheet, theme, GTM, canonical/OG),
+then written back only if the final text changed. Use --transforms to run a
+subset, e.g. `--transforms nav,footer` for the old layout-only sync.
 """
 
 from __future__ import annotations
 
-import subprocess
-import sys
-from pathlib import Path
+from sitebuild import engine
 
 
 def main() -> int:
-    scripts_dir = Path(__file__).resolve().parent
-    python = sys.executable
-
-    commands = [
-        [python, str(scripts_dir / "sync-nav.py")],
-        [python, str(scripts_dir / "sync-footer.py")],
-    ]
-
-    for cmd in commands:
-        print(f"Running: {' '.join(cmd)}")
-        subprocess.run(cmd, check=True)
-
-    return 0
+    return engine.main(engine.DEFAULT_CHAIN, description=__doc__)
 
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Validate the JSON-LD structured data of every public page, offline.
+
+Each page is read once, every application/ld+json block is parsed and checked
+against the bundled schema.org rules in sitebuild.jsonldcheck (required and
+recommended properties for MedicalWebPage, Article/BlogPosting, FAQPage,
+BreadcrumbList, LocalBusiness and friends; ISO dates; absolute URLs). Pages
+are checked in parallel (--jobs), then @ids are compared across pages: the
+same @id must keep compatible types and one name everywhere, and referenced
+@ids should be declared somewhere.
+
+Exit status is 1 if any error is found (or any warning, with --strict).
+
+Usage:
+    python scripts/validate-jsonld.py
+    python scripts/validate-jsonld.py --json-out .build-cache/jsonld-report.json
+    python scripts/validate-jsonld.py blog/ dry-eyes/punctal-plugs-for-dry-eyes-guide/index.html
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections import Counter
+from pathlib import Path
+
+from sitebuild import inventory
+from sitebuild.jsonldcheck import ERROR, WARNING, Issue, PageReport, check_page, check_site
+from sitebuild.parallel import add_jobs_argument, map_ordered
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+MAX_LISTED = 50
+
+
+def page_name(fp: Path) -> str:
+    try:
+        return fp.resolve().relative_to(BASE_DIR).as_posix()
+    except ValueError:
+        return str(fp)
+
+
+def html_files(paths: list[str]) -> list[Path]:
+    files: list[Path] = []
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            files.extend(sorted(path.rglob("*.html")))
+        elif path.is_file():
+            files.append(path)
+    return files
+
+
+def check_file(fp: Path) -> PageReport:
+    """Per-page validation; runs in a worker process when --jobs > 1."""
+    return check_page(page_name(fp), fp.read_text(encoding="utf-8", errors="replace"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validate JSON-LD on public pages against bundled schema.org rules.")
+    parser.add_argument("paths", nargs="*", help="HTML files or directories (default: every public page).")
+    parser.add_argument("--json-out", help="Write every issue (and per-type counts) to this JSON file.")
+    parser.add_argument("--strict", action="store_true", help="Exit non-zero on warnings as well as errors.")
+    parser.add_argument("--errors-only", action="store_true", help="Do not list warnings.")
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    files = html_files(args.paths) if args.paths else inventory.load().paths(inventory.PUBLIC)
+    reports = map_ordered(check_file, files, jobs=args.jobs)
+    issues: list[Issue] = [issue for report in reports for issue in report.issues]
+    issues.extend(check_site(reports))
+    seconds = time.perf_counter() - t0
+
+    errors = [issue for issue in issues if issue.severity == ERROR]
+    warnings = [issue for issue in issues if issue.severity == WARNING]
+    blocks = sum(report.blocks for report in reports)
+    nodes = sum(report.nodes for report in reports)
+    types: Counter[str] = Counter()
+    for report in reports:
+        types.update(report.types)
+    without = sum(1 for report in reports if not report.blocks)
+
+    print(f"Checked {len(files)} pages: {blocks} JSON-LD blocks, {nodes} typed nodes ({seconds:.1f}s)")
+    if without:
+        print(f"  {without} pages have no JSON-LD")
+    listed = errors if args.errors_only else errors + warnings
+    for issue in listed[:MAX_LISTED]:
+        print(f"  [{issue.severity.upper()}] {issue.page} {issue.location}: {issue.message}")
+    if len(listed) > MAX_LISTED:
+        print(f"  ...and {len(listed) - MAX_LISTED} more")
+    if len(listed) > MAX_LISTED:
+        print("Most common:")
+        by_message = Counter(f"[{issue.severity}] {issue.message}" for issue in listed)
+        for message, count in by_message.most_common(10):
+            print(f"  {count:5} {message}")
+    print(f"Errors: {len(errors)}, warnings: {len(warnings)}")
+
+    if args.json_out:
+        out = Path(args.json_out)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "pages": len(files),
+            "blocks": blocks,
+            "nodes": nodes,
+            "types": dict(types.most_common()),
+            "errors": len(errors),
+            "warnings": len(warnings),
+            "issues": [issue.as_dict() for issue in issues],
+        }
+        out.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"Report: {out}")
+
+    if errors or (args.strict and warnings):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Check the internal link graph of the public site.
+
+Runs the "links" QA group (sitebuild/checks/links.py): every <a href> on
+every public page is resolved against the page inventory and the redirect
+table compiled from vercel.json. Reports broken links, links that go
+through a redirect, redirect chains/loops, pages a redirect makes
+unreachable, and orphan pages. Links come from the QA engine's per-page
+cache, so only pages edited since the last QA run are re-read.
+
+The JSON report adds the graph itself: inbound link counts (distinct
+linking pages) and the pages each page links to.
+
+Exit status is 1 if any error is found (or any warning, with --strict).
+
+Usage:
+    python scripts/validate-links.py
+    python scripts/validate-links.py --least-linked 20
+    python scripts/validate-links.py --json-out .build-cache/links-report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from sitebuild import qa
+from sitebuild.buildcache import CACHE_DIR
+from sitebuild.checks import links
+from sitebuild.parallel import add_jobs_argument
+
+DEFAULT_JSON = CACHE_DIR / "links-report.json"
+MAX_LISTED = 50
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check internal links, redirects and orphan pages.")
+    parser.add_argument("--json-out", default=str(DEFAULT_JSON), help="JSON report path (default: %(default)s).")
+    parser.add_argument(
+        "--least-linked",
+        type=int,
+        default=10,
+        metavar="N",
+        help="List the N pages with the fewest inbound links (default: %(default)s).",
+    )
+    parser.add_argument("--strict", action="store_true", help="Exit non-zero on warnings as well as errors.")
+    parser.add_argument("--no-cache", action="store_true", help="Re-read every page instead of using the QA cache.")
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    rules, checks = qa.select([links.GROUP])
+    report = qa.run(rules, checks, jobs=args.jobs, use_cache=not args.no_cache)
+    graph = links.report_graph(report)
+    errors, warnings = report.errors, report.warnings
+
+    print(
+        f"Checked {sum(len(e) for e in graph.edges.values())} internal links on {len(graph.pages)} pages "
+        f"({report.seconds:.2f}s)"
+    )
+    for name, found in report.by_rule().items():
+        print(f"  {name}: {len(found)}")
+    listed = errors + warnings
+    for f in listed[:MAX_LISTED]:
+        print(f"  [{f.severity.upper()}] {f.rule} {f.page}: {f.message}")
+    if len(listed) > MAX_LISTED:
+        print(f"  ...and {len(listed) - MAX_LISTED} more (see the JSON report)")
+
+    if args.least_linked:
+        print("Least-linked pages:")
+        for rel in sorted(graph.pages, key=lambda rel: (graph.inbound[rel], rel))[: args.least_linked]:
+            print(f"  {graph.inbound[rel]:4} {rel}")
+    print(f"Errors: {len(errors)}, warnings: {len(warnings)}")
+
+    out = Path(args.json_out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(
+        json.dumps({**report.as_dict(), "graph": graph.as_dict()}, ensure_ascii=False, indent=2) + "\n",
+        encoding="utf-8",
+    )
+    print(f"Report: {out}")
+
+    if errors or (args.strict and warnings):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
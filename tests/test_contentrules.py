@@ -0,0 +1,137 @@
+"""
+sitebuild.contentrules: the Aho-Corasick path and the per-literal `in` path
+must find the same terms, and both must agree with plain regex searches.
+
+Run from the repo root:
+    python -m unittest discover -s tests
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from sitebuild import contentrules  # noqa: E402
+from sitebuild.contentrules import Automaton, Matcher, Term  # noqa: E402
+
+TERMS = [
+    Term.from_dict(data)
+    for data in [
+        {"require": "Dry Eye"},
+        {"forbid": "dry eye", "ignore_case": True, "word": True},
+        {"forbid": "eye"},
+        {"forbid": "ye", "word": True},
+        {"forbid": ["—", "–"]},
+        {"forbid": ["In today’s world", "In today's world"], "ignore_case": True},
+        {"forbid": "seamless", "ignore_case": True, "word": True},
+        {"forbid": "robust", "ignore_case": True, "word": True},
+        {"require": "MiBoFlo"},
+        {"forbid": "miboflo"},
+        {"forbid": "LipiScan®"},
+        {"require": "he"},
+        {"require": "she"},
+        {"require": "hers"},
+        {"require_pattern": r"vision\s+therapy", "ignore_case": True},
+        {"forbid_pattern": r"Dry\s+Eye"},
+        {"forbid_pattern": "ry\\s+E"},
+    ]
+]
+
+TEXTS = [
+    "",
+    "Dry Eye",
+    "dry eyes and DRY EYE",
+    "Our seamless, robust — and seamlessly robustness–free care",
+    "In Today’s World, it's ushers: she said hers was MiBoFlo not miboflo.",
+    "LipiScan® and LipiScan, vision\n therapy, Dry\tEye",
+    "eye_ye ye-ye (ye) eyes",
+]
+
+
+def reference(term: Term, text: str) -> bool:
+    """Whether *term* is present in *text*, by plain regex search."""
+    if term.is_pattern:
+        return re.search(contentrules._term_regex(term), text) is not None
+    flags = re.IGNORECASE if term.ignore_case else 0
+    for alternative in term.texts:
+        pattern = re.escape(alternative)
+        if term.word:
+            pattern = rf"(?<!\w){pattern}(?!\w)"
+        if re.search(pattern, text, flags):
+            return True
+    return False
+
+
+def random_texts(count: int, seed: int = 0) -> list[str]:
+    """Texts stitched from pieces of the terms, so overlapping and adjacent hits are common."""
+    rng = random.Random(seed)
+    pieces = [t for term in TERMS if not term.is_pattern for t in term.texts]
+    pieces += ["e", "y", " ", "_", "-", "s", "hers", "DRY", "Eye", "ûber", "İ"]
+    texts = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(0, 30)):
+            piece = rng.choice(pieces)
+            parts.append(piece[: rng.randint(1, len(piece))] if rng.random() < 0.3 else piece)
+        texts.append("".join(parts))
+    return texts
+
+
+class AutomatonTest(unittest.TestCase):
+    def test_hits_every_occurrence(self) -> None:
+        keys = ["he", "she", "his", "hers", "e", "ushe"]
+        automaton = Automaton(keys)
+        for text in ["ushers", "shehishers", "hhhe", "", "xyz", *random_texts(200)]:
+            expected = sorted(
+                (m.start() + len(key), i)
+                for i, key in enumerate(keys)
+                for m in re.finditer(f"(?={re.escape(key)})", text)
+            )
+            self.assertEqual(sorted(automaton.hits(text)), expected, text)
+
+
+class MatcherTest(unittest.TestCase):
+    def test_both_paths_match_reference(self) -> None:
+        scan_in = Matcher(TERMS, ac_min_literals=len(TERMS) * 10)
+        scan_ac = Matcher(TERMS, ac_min_literals=0)
+        self.assertIsNone(scan_in._automaton)
+        self.assertIsNotNone(scan_ac._automaton)
+        for text in TEXTS + random_texts(500):
+            expected = {i for i, term in enumerate(TERMS) if reference(term, text)}
+            self.assertEqual(scan_in.scan(text), expected, text)
+            self.assertEqual(scan_ac.scan(text), expected, text)
+
+    def test_overlapping_patterns_are_all_found(self) -> None:
+        # "Dry\s+Eye" and "ry\s+E" overlap; the earlier match must not hide the later one.
+        matcher = Matcher([TERMS[15], TERMS[16]])
+        self.assertEqual(matcher.scan("a Dry  Eye"), {0, 1})
+
+
+class TermTest(unittest.TestCase):
+    def test_group_references_are_rejected(self) -> None:
+        for pattern in [r"(?P<x>a)", r"(a)\1", r"(a)?(?(1)b|c)"]:
+            with self.assertRaises(ValueError, msg=pattern):
+                Term.from_dict({"forbid_pattern": pattern})
+        # An escaped backslash before a digit is not a backreference.
+        Term.from_dict({"forbid_pattern": r"(a)\\1"})
+
+    def test_rule_file_errors_exit(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rules.json"
+            path.write_text(
+                json.dumps({"rules": [{"name": "x", "group": "g", "title": "t", "terms": [{"forbid_pattern": "(?P<a>"}]}]}),
+                encoding="utf-8",
+            )
+            with self.assertRaises(SystemExit):
+                contentrules.load(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
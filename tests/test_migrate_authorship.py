@@ -0,0 +1,93 @@
+"""
+scripts/migrate-authorship.py: installing slots into the article pages in the
+tree must leave exactly one byline and one article graph, and keep FAQPage
+data, including FAQ nodes from an older combined @graph.
+
+Runs in memory; nothing is written. From the repo root:
+    python -m unittest discover -s tests
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import re
+import sys
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from sitebuild import slots  # noqa: E402
+
+_spec = importlib.util.spec_from_file_location("migrate_authorship", SCRIPTS_DIR / "migrate-authorship.py")
+migrate = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(migrate)
+
+SCRIPT_RE = re.compile(r'<script type="application/ld\+json">(.*?)</script>', re.DOTALL)
+
+
+def nodes(text: str) -> list[dict]:
+    """Every top-level JSON-LD node on the page (@graph members included)."""
+    found = []
+    for body in SCRIPT_RE.findall(text):
+        data = json.loads(body)
+        found.extend(data.get("@graph", [data]))
+    return found
+
+
+class InstallSlotsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.authors, community_slugs = migrate.load_authors()
+        cls.articles = []
+        for post in migrate.iter_manifest():
+            path = migrate.BASE_DIR / (post.get("path") or "").strip("/") / "index.html"
+            if post.get("path") and path.exists():
+                author_slug = migrate.assign_author(post.get("slug", ""), community_slugs)
+                cls.articles.append((path, post, author_slug))
+
+    def migrate(self, path: Path, post: dict, author_slug: str) -> tuple[str, str, list[str]]:
+        original = path.read_text(encoding="utf-8")
+        contents = migrate.article_slots(post, author_slug, self.authors)
+        text, found = slots.fill(original, contents)
+        text, unplaced = migrate.install_slots(text, {k: v for k, v in contents.items() if k not in found})
+        return original, text, unplaced
+
+    def test_live_articles_get_one_byline_and_one_article_graph(self) -> None:
+        self.assertTrue(self.articles)
+        for path, post, author_slug in self.articles:
+            with self.subTest(page=path.relative_to(migrate.BASE_DIR).as_posix()):
+                original, text, unplaced = self.migrate(path, post, author_slug)
+                self.assertEqual(unplaced, [])
+                self.assertEqual(text.count(migrate.RICH_BYLINE_START), 1)
+                self.assertEqual(text.count("<!-- slot:byline -->"), 1)
+                ids = [node["@id"] for node in nodes(text) if "@id" in node]
+                self.assertEqual(sum(i.endswith("#article") for i in ids), 1)
+                self.assertEqual(sorted(ids), sorted(set(ids)))
+                faq_before = sum(node.get("@type") == "FAQPage" for node in nodes(original))
+                faq_after = sum(node.get("@type") == "FAQPage" for node in nodes(text))
+                self.assertEqual(faq_after, faq_before)
+                # A second run only refills the slots.
+                again = slots.fill(text, migrate.article_slots(post, author_slug, self.authors))
+                self.assertEqual(again, (text, {slots.JSONLD, slots.BYLINE, slots.REVIEW}))
+
+    def test_faq_node_leaves_combined_graph(self) -> None:
+        path = migrate.BASE_DIR / "blog" / "pain-behind-left-eye" / "index.html"
+        article = next(a for a in self.articles if a[0] == path)
+        _, text, _ = self.migrate(*article)
+        # The old graph held the article, physician and FAQ nodes; only the FAQ stays.
+        ids = [node["@id"] for node in nodes(text)]
+        self.assertEqual(sorted(ids), sorted(set(ids)))
+        self.assertIn(f"{migrate.ORIGIN}{article[1]['path']}#faq", ids)
+
+    def test_unrecognised_byline_is_not_duplicated(self) -> None:
+        page = f"<h1>Title</h1>\n      {migrate.RICH_BYLINE_START}<span>Dr. Someone</span></div>\n"
+        text, unplaced = migrate.install_slots(page, {slots.BYLINE: "<p>new</p>"})
+        self.assertEqual(text, page)
+        self.assertEqual(unplaced, [slots.BYLINE])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+sitebuild transforms: the default chain must be stable, so a second run over
+its own output changes nothing (the engine caches pages on that assumption),
+and the canonical transform must keep the OG/Twitter tags it does not derive.
+
+Runs in memory over the pages in the tree; nothing is written. From the repo root:
+    python -m unittest discover -s tests
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from sitebuild import engine  # noqa: E402
+from sitebuild.transforms import canonical  # noqa: E402
+
+META_KEY_RE = re.compile(r'<meta\s[^>]*\b(?:property|name)=["\']((?:og|twitter):[\w:]+)["\']', re.IGNORECASE)
+
+
+class DefaultChainTest(unittest.TestCase):
+    def test_second_run_changes_nothing(self) -> None:
+        chain = engine.resolve_chain(engine.DEFAULT_CHAIN)
+        ctx = engine.BuildContext()
+        unstable = []
+        for page in engine.iter_pages(set().union(*(t.kinds for t in chain))):
+            if not any(t.applies_to(page) for t in chain):
+                continue
+            after = engine.apply_chain(page.path.read_text(encoding="utf-8"), page, chain, ctx)
+            if page.is_layout_source:
+                ctx.set_layout_text(after)
+            if not engine.is_stable(after, page, chain, ctx):
+                unstable.append(page.rel)
+        self.assertEqual(unstable, [])
+
+
+class CanonicalTest(unittest.TestCase):
+    PAGE = """<head>
+  <title>Kids' Exams | Classic Vision Care</title>
+  <meta name="description" content="Old &amp; new">
+    <link rel="canonical" href="https://example.com/old/">
+  <meta property="og:title" content="Stale">
+  <meta property="og:type" content="article">
+  <meta property="og:image" content="https://classicvisioncare.com/images/a.jpg">
+  <meta property="og:site_name" content="Classic Vision Care">
+  <meta name="twitter:title" content="Kids">
+</head>"""
+
+    def apply(self, text: str) -> str:
+        rel = "childrens-eye-exam/index.html"
+        page = engine.Page(path=engine.BASE_DIR / rel, rel=rel, kind=engine.PUBLIC)
+        return canonical.apply_canonical_and_og(text, page, engine.BuildContext())
+
+    def test_keeps_tags_it_does_not_derive(self) -> None:
+        after = self.apply(self.PAGE)
+        keys = META_KEY_RE.findall(after)
+        self.assertEqual(sorted(keys), sorted(set(keys)))
+        for tag in [
+            '<meta property="og:type" content="article">',
+            '<meta property="og:image" content="https://classicvisioncare.com/images/a.jpg">',
+            '<meta property="og:site_name" content="Classic Vision Care">',
+            '<meta name="twitter:title" content="Kids">',
+            '<meta property="og:title" content="Kids&#x27; Exams | Classic Vision Care">',
+            '<meta property="og:description" content="Old &amp; new">',
+            '<meta property="og:url" content="https://classicvisioncare.com/childrens-eye-exam/">',
+            '<meta name="twitter:card" content="summary_large_image">',
+            '  <link rel="canonical" href="https://classicvisioncare.com/childrens-eye-exam/">',
+        ]:
+            self.assertIn(tag, after)
+        self.assertEqual(self.apply(after), after)
+
+
+if __name__ == "__main__":
+    unittest.main()